@@ -1,6 +1,10 @@
 """
 CSS selectors for Workana job listings
 """
+from dataclasses import dataclass
+
+import soupsieve
+
 SELECTORS = {
     # Container
     'job_container': '#projects',
@@ -31,3 +35,41 @@ SELECTORS = {
     'pagination_next': 'ul.pagination > li:not(.disabled) > a[aria-label="Next"]',
 }
 
+# Precompiled SoupSieve selectors for the BeautifulSoup parsing path.
+# soup.select()/select_one() compile (or cache-lookup) the CSS pattern on every
+# call; compiling once at import removes that from the per-job hot path.
+# Usage: COMPILED_SELECTORS['job_title'].select_one(soup)
+COMPILED_SELECTORS = {key: soupsieve.compile(css) for key, css in SELECTORS.items()}
+
+
+@dataclass(frozen=True, slots=True)
+class SelectorSet:
+    """
+    Frozen bundle of precompiled selectors.
+    Attribute access is a C-level slot read (no per-lookup string hashing), and
+    a typo'd selector name raises AttributeError instead of a silent KeyError.
+    """
+    job_container: soupsieve.SoupSieve
+    job_item: soupsieve.SoupSieve
+    job_item_featured: soupsieve.SoupSieve
+    job_title: soupsieve.SoupSieve
+    job_url: soupsieve.SoupSieve
+    job_date: soupsieve.SoupSieve
+    job_bids: soupsieve.SoupSieve
+    job_description: soupsieve.SoupSieve
+    job_budget: soupsieve.SoupSieve
+    job_skills: soupsieve.SoupSieve
+    job_featured_badge: soupsieve.SoupSieve
+    client_name: soupsieve.SoupSieve
+    client_country: soupsieve.SoupSieve
+    client_rating: soupsieve.SoupSieve
+    client_payment_verified: soupsieve.SoupSieve
+    client_last_reply: soupsieve.SoupSieve
+    pagination: soupsieve.SoupSieve
+    pagination_pages: soupsieve.SoupSieve
+    pagination_current: soupsieve.SoupSieve
+    pagination_next: soupsieve.SoupSieve
+
+
+COMPILED = SelectorSet(**COMPILED_SELECTORS)
+
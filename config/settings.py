@@ -25,6 +25,12 @@ JOBS_URL = f"{BASE_URL}/jobs"
 DEFAULT_CATEGORY = "it-programming"
 DEFAULT_LANGUAGE = "en,pt,es"  # English, Portuguese, Spanish
 
+# Page fetch mode: 'http' fetches listing pages with plain requests (much
+# faster, no Chromium RAM cost); 'selenium' drives Chrome. HTTP mode falls
+# back to Selenium automatically when the listing markup isn't present in the
+# raw HTML (e.g. bot detection or JS-only rendering).
+FETCH_MODE = 'http'
+
 # Selenium settings
 HEADLESS = True  # Set to False for debugging
 IMPLICIT_WAIT = 3  # seconds (reduced from 10)
@@ -1,19 +1,17 @@
 """
 Main script for Workana job scraper
 """
-import sys
+import logging
 import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
-from pathlib import Path
-
-# Add project root to path
-sys.path.insert(0, str(Path(__file__).parent))
 
 from config.settings import (
-    DATABASE_PATH, DEFAULT_CATEGORY, DEFAULT_LANGUAGE,
+    DATABASE_PATH, DEFAULT_CATEGORY, DEFAULT_LANGUAGE, FETCH_MODE, LOG_LEVEL,
     MAX_PAGES, STOP_ON_KNOWN_JOB, SLACK_WEBHOOK_URL, ENABLE_SLACK_NOTIFICATIONS,
     SCRAPE_INTERVAL, ENABLE_SHEETS_EXPORT, GOOGLE_SHEETS_SPREADSHEET_ID, GOOGLE_SHEETS_CREDENTIALS_JSON
 )
+
 from storage.database import WorkanaDatabase
 from scrapers.workana_scraper import WorkanaScraper
 from parsers.date_parser import extract_job_id_from_url
@@ -21,6 +19,10 @@ from utils.slack_notifier import SlackNotifier
 from utils.translator import DeepLTranslator
 from utils.sheets_exporter import SheetsExporter
 
+# Per-job progress goes through the logger at DEBUG so production runs (INFO)
+# skip the string formatting and stdout writes entirely
+logger = logging.getLogger(__name__)
+
 
 def run_scrape(db, scraper, slack_notifier, translator, sheets_exporter):
     """Run a single scrape cycle"""
@@ -35,29 +37,20 @@ def run_scrape(db, scraper, slack_notifier, translator, sheets_exporter):
         print(f"Category: {DEFAULT_CATEGORY} | Language: {DEFAULT_LANGUAGE} | Max pages: {MAX_PAGES or 'No limit'}")
         print("-" * 60)
         
-        scraped_jobs = scraper.scrape(
+        result = scraper.scrape(
             category=DEFAULT_CATEGORY,
             language=DEFAULT_LANGUAGE,
             existing_job_ids=existing_job_ids,
             max_pages=MAX_PAGES
         )
-        
+        scraped_jobs = result.jobs
+
         print(f"Scraped {len(scraped_jobs)} jobs total")
         
-        # Save jobs to database
-        new_jobs = []
-        updated_jobs = 0
-        
-        for job in scraped_jobs:
-            if not job.get('id'):
-                continue
-            
-            is_new = db.save_job(job)
-            if is_new:
-                new_jobs.append(job)
-            else:
-                updated_jobs += 1
-        
+        # Save jobs to database (single transaction for the whole batch)
+        new_jobs = db.save_jobs_bulk(scraped_jobs)
+        updated_jobs = len([j for j in scraped_jobs if j.get('id')]) - len(new_jobs)
+
         print(f"New jobs: {len(new_jobs)} | Updated jobs: {updated_jobs}")
         
         # Send Slack notification for new jobs (individually)
@@ -68,57 +61,64 @@ def run_scrape(db, scraper, slack_notifier, translator, sheets_exporter):
             print("ℹ️  No new jobs to send to Slack")
         else:
             # Filter out jobs that have already been sent to Slack
+            # (one batched query instead of one lookup per job)
+            sent_ids = db.get_sent_slack_ids([j['id'] for j in new_jobs if j.get('id')])
             unsent_jobs = []
             for job in new_jobs:
                 job_id = job.get('id')
                 if not job_id:
-                    print(f"⚠️  Skipping job without ID: {job.get('title', 'Unknown')[:50]}")
+                    logger.debug("Skipping job without ID: %s", job.get('title', 'Unknown')[:50])
                     continue
-                if db.is_job_sent_to_slack(job_id):
-                    print(f"ℹ️  Job {job_id} already sent to Slack, skipping")
+                if job_id in sent_ids:
+                    logger.debug("Job %s already sent to Slack, skipping", job_id)
                 else:
                     unsent_jobs.append(job)
             
             if unsent_jobs:
-                print(f"📤 Sending {len(unsent_jobs)} job(s) individually to Slack...")
-                
-                success_count = 0
+                print(f"📤 Sending {len(unsent_jobs)} job(s) to Slack (up to 4 concurrent)...")
+
+                sent_ok = []
                 failed_count = 0
-                for i, job in enumerate(unsent_jobs, 1):
-                    job_id = job.get('id')
-                    job_title = job.get('title', 'Unknown')[:50]
-                    print(f"   [{i}/{len(unsent_jobs)}] Sending job: {job_title}...")
-                    success = slack_notifier.send_single_job(job)
-                    if success and job_id:
-                        # Mark as sent to prevent duplicates
-                        if db.mark_job_sent_to_slack(job_id):
-                            success_count += 1
-                            print(f"   ✅ Job {job_id} sent and marked in database")
+                # Slack sends are pure I/O wait, so a small thread pool gives
+                # near-linear speedup; the notifier rate-limits across threads.
+                # Database marking stays on this thread (SQLite single-writer).
+                with ThreadPoolExecutor(max_workers=4) as pool:
+                    futures = {
+                        pool.submit(slack_notifier.send_single_job, job): job
+                        for job in unsent_jobs
+                    }
+                    for future in as_completed(futures):
+                        job = futures[future]
+                        job_id = job.get('id')
+                        try:
+                            success = future.result()
+                        except Exception as e:
+                            print(f"   ❌ Error sending job {job_id}: {e}")
+                            success = False
+                        if success and job_id:
+                            sent_ok.append(job_id)
+                            logger.debug("Job %s sent to Slack", job_id)
                         else:
-                            print(f"   ⚠️  Job {job_id} sent but failed to mark in database")
-                    else:
-                        failed_count += 1
-                        print(f"   ❌ Failed to send job {job_id}")
-                    
-                    # Small delay between messages to avoid rate limiting
-                    if i < len(unsent_jobs):
-                        time.sleep(0.5)
-                
-                print(f"✅ Sent {success_count}/{len(unsent_jobs)} job notifications to Slack")
+                            failed_count += 1
+                            print(f"   ❌ Failed to send job {job_id}")
+
+                # Mark all successfully sent jobs in one transaction
+                marked = db.mark_jobs_sent_to_slack(sent_ok)
+                if marked != len(sent_ok):
+                    print(f"⚠️  Sent {len(sent_ok)} job(s) but only marked {marked} in database")
+
+                print(f"✅ Sent {len(sent_ok)}/{len(unsent_jobs)} job notifications to Slack")
                 if failed_count > 0:
                     print(f"⚠️  {failed_count} job(s) failed to send")
             else:
                 print(f"ℹ️  All {len(new_jobs)} new job(s) were already sent to Slack (skipping duplicates)")
         
-        # Calculate pages scraped (approximate)
-        pages_scraped = len(scraped_jobs) // 20  # Assuming ~20 jobs per page
-        
         # Save scrape history
         duration = time.time() - start_time
         db.save_scrape_history(
             jobs_found=len(scraped_jobs),
             new_jobs_count=len(new_jobs),
-            pages_scraped=pages_scraped,
+            pages_scraped=result.pages_scraped,
             duration_seconds=duration,
             category=DEFAULT_CATEGORY,
             language=DEFAULT_LANGUAGE
@@ -134,23 +134,26 @@ def run_scrape(db, scraper, slack_notifier, translator, sheets_exporter):
             print("ℹ️  No new jobs to export to Google Sheets")
         else:
             try:
-                # Ensure today's sheet exists (create if it doesn't)
-                sheets_exporter.ensure_today_sheet_exists()
-                
                 # Filter out jobs that have already been exported
-                # Use new_jobs directly instead of querying database
+                # (one batched query instead of one lookup per job)
+                exported_ids = db.get_exported_sheet_ids([j['id'] for j in new_jobs if j.get('id')])
                 unexported_jobs = []
                 for job in new_jobs:
                     job_id = job.get('id')
                     if not job_id:
-                        print(f"⚠️  Skipping job without ID for Sheets export: {job.get('title', 'Unknown')[:50]}")
+                        logger.debug("Skipping job without ID for Sheets export: %s", job.get('title', 'Unknown')[:50])
                         continue
-                    if db.is_job_exported_to_sheets(job_id):
-                        print(f"ℹ️  Job {job_id} already exported to Sheets, skipping")
+                    if job_id in exported_ids:
+                        logger.debug("Job %s already exported to Sheets, skipping", job_id)
                     else:
                         unexported_jobs.append(job)
                 
                 if unexported_jobs:
+                    # Ensure today's sheet exists (create if it doesn't).
+                    # Only done when there is something to export, so idle
+                    # cycles don't cost a Sheets API round-trip.
+                    sheets_exporter.ensure_today_sheet_exists()
+
                     print(f"📊 Exporting {len(unexported_jobs)} job(s) to Google Sheets...")
                     exported_count = sheets_exporter.export_jobs(unexported_jobs)
                     
@@ -162,17 +165,13 @@ def run_scrape(db, scraper, slack_notifier, translator, sheets_exporter):
                     else:
                         print(f"✅ Successfully exported {exported_count} job(s) to Google Sheets")
                     
-                    # Mark jobs as exported (only mark the ones that were actually exported)
-                    marked_count = 0
-                    for job in unexported_jobs[:exported_count]:
-                        job_id = job.get('id')
-                        if job_id:
-                            if db.mark_job_exported_to_sheets(job_id):
-                                marked_count += 1
-                                print(f"   ✅ Job {job_id} marked as exported in database")
-                            else:
-                                print(f"   ⚠️  Failed to mark job {job_id} as exported in database")
-                    
+                    # Mark jobs as exported (only the ones actually exported),
+                    # in a single transaction
+                    exported_job_ids = [
+                        job['id'] for job in unexported_jobs[:exported_count] if job.get('id')
+                    ]
+                    marked_count = db.mark_jobs_exported_to_sheets(exported_job_ids)
+
                     if marked_count != exported_count:
                         print(f"⚠️  Warning: Exported {exported_count} job(s), but only {marked_count} were marked as exported in database")
                 else:
@@ -182,8 +181,9 @@ def run_scrape(db, scraper, slack_notifier, translator, sheets_exporter):
                 print("   Jobs will be exported when network connection is restored.")
             except Exception as e:
                 print(f"⚠️  Error exporting to Google Sheets: {e}")
-                import traceback
-                traceback.print_exc()
+                if logger.isEnabledFor(logging.DEBUG):
+                    import traceback
+                    traceback.print_exc()
         
         # Display brief statistics
         stats = db.get_statistics()
@@ -193,13 +193,19 @@ def run_scrape(db, scraper, slack_notifier, translator, sheets_exporter):
         
     except Exception as e:
         print(f"❌ Error during scraping: {e}")
-        import traceback
-        traceback.print_exc()
+        if logger.isEnabledFor(logging.DEBUG):
+            import traceback
+            traceback.print_exc()
         return False
 
 
 def main():
     """Main execution function"""
+    logging.basicConfig(
+        level=getattr(logging, LOG_LEVEL, logging.INFO),
+        format='%(asctime)s %(levelname)s %(message)s'
+    )
+
     print("=" * 60)
     print("Workana Job Scraper")
     print("=" * 60)
@@ -261,7 +267,9 @@ def main():
     # Initialize scraper
     print("[5/6] Initializing scraper...")
     scraper = WorkanaScraper()
-    scraper.setup_driver()
+    if FETCH_MODE == 'selenium':
+        # HTTP mode starts the browser lazily, only if it has to fall back
+        scraper.setup_driver()
     
     print("[6/6] Setup complete!")
     print("=" * 60)
@@ -275,17 +283,26 @@ def main():
                 print(f"\n{'='*60}")
                 print(f"Run #{run_count}")
                 print(f"{'='*60}")
-                
+
+                # Fixed-rate schedule: measure from the start of the run so the
+                # scrape duration doesn't accumulate on top of the interval
+                loop_start = time.monotonic()
                 run_scrape(db, scraper, slack_notifier, translator, sheets_exporter)
-                
-                # Calculate next run time
-                next_run = datetime.now().timestamp() + SCRAPE_INTERVAL
-                next_run_str = datetime.fromtimestamp(next_run).strftime('%H:%M:%S')
-                print(f"\n⏰ Next run in {SCRAPE_INTERVAL} seconds (at {next_run_str})")
-                print("   Press Ctrl+C to stop")
-                
-                # Wait for next run
-                time.sleep(SCRAPE_INTERVAL)
+
+                # Keep the query planner's statistics fresh as the table grows
+                if run_count % 10 == 0:
+                    db.optimize()
+
+                # Sleep only the remainder of the interval
+                sleep_for = max(0, SCRAPE_INTERVAL - (time.monotonic() - loop_start))
+                if sleep_for > 0:
+                    next_run = datetime.now().timestamp() + sleep_for
+                    next_run_str = datetime.fromtimestamp(next_run).strftime('%H:%M:%S')
+                    print(f"\n⏰ Next run in {sleep_for:.0f} seconds (at {next_run_str})")
+                    print("   Press Ctrl+C to stop")
+                    time.sleep(sleep_for)
+                else:
+                    print(f"\n⏰ Scrape took longer than {SCRAPE_INTERVAL}s interval, running next scrape immediately")
         else:
             # Single run mode
             run_scrape(db, scraper, slack_notifier, translator, sheets_exporter)
@@ -1,101 +1,119 @@
-"""
-Parser for converting relative dates to absolute timestamps
-"""
-import re
-from datetime import datetime, timedelta
-from typing import Optional
-
-
-def parse_relative_date(date_text: str) -> Optional[datetime]:
-    """
-    Parse relative date strings like "20 hours ago", "Just now", "Yesterday"
-    Returns datetime object or None if parsing fails
-    """
-    if not date_text:
-        return None
-    
-    # Clean the text
-    date_text = date_text.strip().lower()
-    
-    # Remove "Published: " prefix if present
-    date_text = re.sub(r'^published:\s*', '', date_text, flags=re.IGNORECASE)
-    
-    now = datetime.now()
-    
-    # "Just now" or "now"
-    if 'just now' in date_text or date_text == 'now':
-        return now - timedelta(seconds=30)  # Approximate as 30 seconds ago
-    
-    # Minutes ago
-    match = re.search(r'(\d+)\s*(?:minute|min)s?\s*ago', date_text)
-    if match:
-        minutes = int(match.group(1))
-        return now - timedelta(minutes=minutes)
-    
-    # Hours ago
-    match = re.search(r'(\d+)\s*(?:hour|hr)s?\s*ago', date_text)
-    if match:
-        hours = int(match.group(1))
-        return now - timedelta(hours=hours)
-    
-    # "Almost an hour ago" or "Almost 1 hour ago"
-    if 'almost an hour ago' in date_text or 'almost 1 hour ago' in date_text:
-        return now - timedelta(hours=1, minutes=30)
-    
-    # Days ago
-    match = re.search(r'(\d+)\s*(?:day|d)s?\s*ago', date_text)
-    if match:
-        days = int(match.group(1))
-        return now - timedelta(days=days)
-    
-    # "Yesterday"
-    if 'yesterday' in date_text:
-        return now - timedelta(days=1, hours=12)  # Approximate as yesterday noon
-    
-    # Weeks ago
-    match = re.search(r'(\d+)\s*(?:week|w)s?\s*ago', date_text)
-    if match:
-        weeks = int(match.group(1))
-        return now - timedelta(weeks=weeks)
-    
-    # Months ago
-    match = re.search(r'(\d+)\s*(?:month|mo)s?\s*ago', date_text)
-    if match:
-        months = int(match.group(1))
-        return now - timedelta(days=months * 30)  # Approximate month as 30 days
-    
-    # Try to parse as absolute date if relative parsing fails
-    try:
-        # Try common date formats
-        for fmt in ['%Y-%m-%d', '%m/%d/%Y', '%d/%m/%Y', '%B %d, %Y']:
-            try:
-                return datetime.strptime(date_text, fmt)
-            except ValueError:
-                continue
-    except:
-        pass
-    
-    # If all parsing fails, return None
-    return None
-
-
-def extract_job_id_from_url(url: str) -> str:
-    """
-    Extract unique job ID from Workana job URL
-    Example: /job/desenvolvedor-expert-em-webhook... -> desenvolvedor-expert-em-webhook...
-    """
-    if not url:
-        return ""
-    
-    # Remove base URL if present
-    url = url.replace('https://www.workana.com', '')
-    url = url.replace('http://www.workana.com', '')
-    
-    # Extract job slug
-    match = re.search(r'/job/([^/?]+)', url)
-    if match:
-        return match.group(1)
-    
-    # If no match, return the last part of the URL
-    return url.strip('/').split('/')[-1].split('?')[0]
-
+"""
+Parser for converting relative dates to absolute timestamps
+"""
+import re
+from datetime import datetime, timedelta
+from functools import lru_cache
+from typing import Optional
+
+# Precompiled patterns (these run once per job, so avoid recompiling per call)
+_PUBLISHED_RE = re.compile(r'^published:\s*', re.IGNORECASE)
+# Single alternation covering all "N <unit> ago" variants; one scan of the
+# string instead of one search per unit. Dispatch on the named group that matched.
+_REL_RE = re.compile(
+    r'(?P<min>\d+)\s*(?:minute|min)s?\s*ago'
+    r'|(?P<hr>\d+)\s*(?:hour|hr)s?\s*ago'
+    r'|(?P<day>\d+)\s*(?:day|d)s?\s*ago'
+    r'|(?P<week>\d+)\s*(?:week|w)s?\s*ago'
+    r'|(?P<month>\d+)\s*(?:month|mo)s?\s*ago',
+    re.IGNORECASE
+)
+# Case-insensitive matching instead of lowercasing the input (saves a string
+# allocation per call)
+_JUST_NOW_RE = re.compile(r'just now|^now$', re.IGNORECASE)
+_ALMOST_HOUR_RE = re.compile(r'almost (?:an|1) hour ago', re.IGNORECASE)
+_YESTERDAY_RE = re.compile(r'yesterday', re.IGNORECASE)
+# Absolute dates always start with a digit or a month name; anything else can
+# skip the strptime fallback entirely
+_ABSOLUTE_PREFIX_RE = re.compile(r'^(\d|jan|feb|mar|apr|may|jun|jul|aug|sep|oct|nov|dec)', re.IGNORECASE)
+_REL_FACTORY = {
+    'min': lambda n: timedelta(minutes=n),
+    'hr': lambda n: timedelta(hours=n),
+    'day': lambda n: timedelta(days=n),
+    'week': lambda n: timedelta(weeks=n),
+    'month': lambda n: timedelta(days=n * 30),  # Approximate month as 30 days
+}
+_JOB_RE = re.compile(r'/job/([^/?]+)')
+
+
+@lru_cache(maxsize=4096)
+def _parse_offset(date_text: str) -> Optional[timedelta]:
+    """
+    Parse a cleaned relative-date string into an offset from "now".
+    Cached: Workana date strings are drawn from a small vocabulary, so the same
+    inputs recur on every scrape cycle.
+    """
+    # "Just now" or "now"
+    if _JUST_NOW_RE.search(date_text):
+        return timedelta(seconds=30)  # Approximate as 30 seconds ago
+
+    # "N minutes/hours/days/weeks/months ago" (single scan, dispatch on unit)
+    match = _REL_RE.search(date_text)
+    if match:
+        unit = match.lastgroup
+        return _REL_FACTORY[unit](int(match.group(unit)))
+
+    # "Almost an hour ago" or "Almost 1 hour ago"
+    if _ALMOST_HOUR_RE.search(date_text):
+        return timedelta(hours=1, minutes=30)
+
+    # "Yesterday"
+    if _YESTERDAY_RE.search(date_text):
+        return timedelta(days=1, hours=12)  # Approximate as yesterday noon
+
+    return None
+
+
+def parse_relative_date(date_text: str) -> Optional[datetime]:
+    """
+    Parse relative date strings like "20 hours ago", "Just now", "Yesterday"
+    Returns datetime object or None if parsing fails
+    """
+    if not date_text:
+        return None
+
+    # Clean the text (patterns are case-insensitive, so no .lower() needed)
+    date_text = date_text.strip()
+
+    # Remove "Published: " prefix if present
+    date_text = _PUBLISHED_RE.sub('', date_text)
+
+    offset = _parse_offset(date_text)
+    if offset is not None:
+        return datetime.now() - offset
+
+    # Try to parse as absolute date if relative parsing fails. Pre-screen on
+    # the first characters so the common relative-date misses skip the
+    # strptime attempts entirely.
+    if _ABSOLUTE_PREFIX_RE.match(date_text):
+        # Try common date formats
+        for fmt in ['%Y-%m-%d', '%m/%d/%Y', '%d/%m/%Y', '%B %d, %Y']:
+            try:
+                return datetime.strptime(date_text, fmt)
+            except ValueError:
+                continue
+
+    # If all parsing fails, return None
+    return None
+
+
+@lru_cache(maxsize=4096)
+def extract_job_id_from_url(url: str) -> str:
+    """
+    Extract unique job ID from Workana job URL
+    Example: /job/desenvolvedor-expert-em-webhook... -> desenvolvedor-expert-em-webhook...
+    """
+    if not url:
+        return ""
+
+    # Extract job slug (the pattern doesn't care about any base-URL prefix,
+    # so search the original string and skip the two .replace() scans)
+    match = _JOB_RE.search(url)
+    if match:
+        return match.group(1)
+
+    # If no match, return the last part of the URL (base stripped first so a
+    # bare domain doesn't get returned as the ID)
+    url = url.replace('https://www.workana.com', '')
+    url = url.replace('http://www.workana.com', '')
+    return url.strip('/').split('/')[-1].split('?')[0]
@@ -1,425 +1,488 @@
-"""
-Parser for extracting job data from HTML elements
-"""
-import re
-from typing import Dict, Optional, List
-from selenium.webdriver.remote.webelement import WebElement
-from selenium.webdriver.common.by import By
-from selenium.common.exceptions import NoSuchElementException, StaleElementReferenceException
-from bs4 import BeautifulSoup
-from config.selectors import SELECTORS
-from parsers.date_parser import parse_relative_date, extract_job_id_from_url
-
-
-def parse_budget(budget_text: str) -> Dict[str, Optional[str]]:
-    """
-    Parse budget text to extract min, max, and type
-    Examples:
-    - "USD 50 - 100" -> {min: 50, max: 100, type: "fixed"}
-    - "Over USD 45 / hour" -> {min: 45, max: None, type: "hourly"}
-    - "Less than USD 50" -> {min: None, max: 50, type: "fixed"}
-    """
-    if not budget_text:
-        return {'min': None, 'max': None, 'type': None}
-    
-    budget_text = budget_text.strip()
-    budget_type = None
-    min_val = None
-    max_val = None
-    
-    # Check if hourly
-    if '/ hour' in budget_text.lower() or 'hourly' in budget_text.lower():
-        budget_type = 'hourly'
-    else:
-        budget_type = 'fixed'
-    
-    # Extract numbers (remove commas)
-    numbers = re.findall(r'[\d,]+', budget_text.replace(',', ''))
-    numbers = [int(n.replace(',', '')) for n in numbers]
-    
-    if 'over' in budget_text.lower() or 'more than' in budget_text.lower():
-        if numbers:
-            min_val = numbers[0]
-    elif 'less than' in budget_text.lower() or 'under' in budget_text.lower():
-        if numbers:
-            max_val = numbers[0]
-    elif len(numbers) >= 2:
-        min_val = numbers[0]
-        max_val = numbers[1]
-    elif len(numbers) == 1:
-        min_val = numbers[0]
-    
-    return {
-        'min': min_val,
-        'max': max_val,
-        'type': budget_type
-    }
-
-
-def extract_rating(rating_element: Optional[WebElement]) -> Optional[float]:
-    """Extract rating from profile-stars element title attribute"""
-    if not rating_element:
-        return None
-    
-    try:
-        title = rating_element.get_attribute('title')
-        if title:
-            # Extract number from title like "5.00 of 5.00"
-            match = re.search(r'(\d+\.?\d*)', title)
-            if match:
-                return float(match.group(1))
-    except:
-        pass
-    
-    return None
-
-
-def safe_get_text(element: Optional[WebElement], default: str = None) -> Optional[str]:
-    """Safely get text from element"""
-    if element is None:
-        return default
-    try:
-        text = element.text.strip()
-        return text if text else default
-    except:
-        return default
-
-
-def safe_get_attribute(element: Optional[WebElement], attr: str, default: str = None) -> Optional[str]:
-    """Safely get attribute from element"""
-    if element is None:
-        return default
-    try:
-        value = element.get_attribute(attr)
-        return value if value else default
-    except:
-        return default
-
-
-def parse_job_element(job_element: WebElement, base_url: str = "https://www.workana.com") -> Dict:
-    """
-    Parse a single job element and extract all available data
-    Returns dictionary with job data
-    """
-    job_data = {}
-    
-    try:
-        # Title and URL
-        try:
-            title_elem = job_element.find_element(By.CSS_SELECTOR, SELECTORS['job_title'])
-            job_data['title'] = safe_get_text(title_elem)
-            url_path = safe_get_attribute(title_elem, 'href')
-            if url_path:
-                if url_path.startswith('http'):
-                    job_data['url'] = url_path
-                else:
-                    job_data['url'] = base_url + url_path
-                job_data['id'] = extract_job_id_from_url(job_data['url'])
-            else:
-                job_data['url'] = None
-                job_data['id'] = None
-        except NoSuchElementException:
-            job_data['title'] = None
-            job_data['url'] = None
-            job_data['id'] = None
-        
-        # Date
-        try:
-            date_elem = job_element.find_element(By.CSS_SELECTOR, SELECTORS['job_date'])
-            date_text = safe_get_text(date_elem)
-            job_data['posted_date_relative'] = date_text.replace('Published: ', '').strip() if date_text else None
-            job_data['posted_date_timestamp'] = parse_relative_date(job_data['posted_date_relative']) if job_data['posted_date_relative'] else None
-        except NoSuchElementException:
-            job_data['posted_date_relative'] = None
-            job_data['posted_date_timestamp'] = None
-        
-        # Bids count
-        try:
-            bids_elem = job_element.find_element(By.CSS_SELECTOR, SELECTORS['job_bids'])
-            bids_text = safe_get_text(bids_elem)
-            if bids_text:
-                match = re.search(r'(\d+)', bids_text)
-                job_data['bids_count'] = int(match.group(1)) if match else None
-            else:
-                job_data['bids_count'] = None
-        except NoSuchElementException:
-            job_data['bids_count'] = None
-        
-        # Description
-        try:
-            desc_elem = job_element.find_element(By.CSS_SELECTOR, SELECTORS['job_description'])
-            job_data['description'] = safe_get_text(desc_elem)
-        except NoSuchElementException:
-            job_data['description'] = None
-        
-        # Budget
-        try:
-            budget_elem = job_element.find_element(By.CSS_SELECTOR, SELECTORS['job_budget'])
-            budget_text = safe_get_text(budget_elem)
-            job_data['budget'] = budget_text
-            budget_parsed = parse_budget(budget_text)
-            job_data['budget_min'] = budget_parsed['min']
-            job_data['budget_max'] = budget_parsed['max']
-            job_data['budget_type'] = budget_parsed['type']
-        except NoSuchElementException:
-            job_data['budget'] = None
-            job_data['budget_min'] = None
-            job_data['budget_max'] = None
-            job_data['budget_type'] = None
-        
-        # Skills
-        try:
-            skill_elems = job_element.find_elements(By.CSS_SELECTOR, SELECTORS['job_skills'])
-            job_data['skills'] = [safe_get_text(skill) for skill in skill_elems if safe_get_text(skill)]
-        except:
-            job_data['skills'] = []
-        
-        # Featured/Max project
-        try:
-            featured_badge = job_element.find_element(By.CSS_SELECTOR, SELECTORS['job_featured_badge'])
-            job_data['is_max_project'] = True
-        except NoSuchElementException:
-            job_data['is_max_project'] = False
-        
-        # Check if featured (has project-item-featured class)
-        classes = safe_get_attribute(job_element, 'class', '')
-        job_data['is_featured'] = 'project-item-featured' in (classes or '')
-        
-        # Client information
-        try:
-            client_section = job_element.find_element(By.CSS_SELECTOR, 'div.project-author')
-            
-            # Client name
-            try:
-                name_elem = client_section.find_element(By.CSS_SELECTOR, SELECTORS['client_name'])
-                job_data['client_name'] = safe_get_text(name_elem)
-            except NoSuchElementException:
-                job_data['client_name'] = None
-            
-            # Client country - get text from anchor tag inside country-name span
-            try:
-                # Primary: span.country > span.country-name > a
-                country_elem = client_section.find_element(By.CSS_SELECTOR, SELECTORS['client_country'])
-                job_data['client_country'] = safe_get_text(country_elem)
-            except NoSuchElementException:
-                # Fallback 1: try span.country-name > a directly
-                try:
-                    country_elem = client_section.find_element(By.CSS_SELECTOR, 'span.country-name > a')
-                    job_data['client_country'] = safe_get_text(country_elem)
-                except NoSuchElementException:
-                    # Fallback 2: try span.country > a
-                    try:
-                        country_elem = client_section.find_element(By.CSS_SELECTOR, 'span.country > a')
-                        job_data['client_country'] = safe_get_text(country_elem)
-                    except NoSuchElementException:
-                        job_data['client_country'] = None
-            
-            # Client rating - get from title attribute of stars-bg element
-            try:
-                # Try the stars-bg element which has the title attribute
-                rating_elem = client_section.find_element(By.CSS_SELECTOR, SELECTORS['client_rating'])
-                job_data['client_rating'] = extract_rating(rating_elem)
-            except NoSuchElementException:
-                # Fallback: try profile-stars and look for stars-bg inside
-                try:
-                    profile_stars = client_section.find_element(By.CSS_SELECTOR, 'span.rating > span.profile-stars')
-                    stars_bg = profile_stars.find_element(By.CSS_SELECTOR, 'span.stars-bg')
-                    job_data['client_rating'] = extract_rating(stars_bg)
-                except NoSuchElementException:
-                    job_data['client_rating'] = None
-            
-            # Payment verified
-            try:
-                verified_elem = client_section.find_element(By.CSS_SELECTOR, SELECTORS['client_payment_verified'])
-                job_data['client_payment_verified'] = True
-            except NoSuchElementException:
-                job_data['client_payment_verified'] = False
-            
-            # Last reply
-            try:
-                reply_elem = client_section.find_element(By.CSS_SELECTOR, SELECTORS['client_last_reply'])
-                reply_text = safe_get_text(reply_elem)
-                # Extract just the time part (after "Last reply:")
-                if reply_text:
-                    parts = reply_text.split(':', 1)
-                    job_data['client_last_reply'] = parts[-1].strip() if len(parts) > 1 else reply_text
-                else:
-                    job_data['client_last_reply'] = None
-            except NoSuchElementException:
-                job_data['client_last_reply'] = None
-                
-        except NoSuchElementException:
-            job_data['client_name'] = None
-            job_data['client_country'] = None
-            job_data['client_rating'] = None
-            job_data['client_payment_verified'] = False
-            job_data['client_last_reply'] = None
-    
-    except Exception as e:
-        # Log error but continue
-        print(f"Error parsing job element: {e}")
-    
-    return job_data
-
-
-def parse_job_element_from_html(html: str, base_url: str = "https://www.workana.com") -> Dict:
-    """
-    Parse a single job element from HTML string (avoids stale element issues)
-    Returns dictionary with job data
-    """
-    job_data = {}
-    
-    try:
-        soup = BeautifulSoup(html, 'lxml')
-        
-        # Title and URL
-        title_elem = soup.select_one(SELECTORS['job_title'])
-        if title_elem:
-            job_data['title'] = title_elem.get_text(strip=True)
-            url_path = title_elem.get('href', '')
-            if url_path:
-                if url_path.startswith('http'):
-                    job_data['url'] = url_path
-                else:
-                    job_data['url'] = base_url + url_path
-                job_data['id'] = extract_job_id_from_url(job_data['url'])
-            else:
-                job_data['url'] = None
-                job_data['id'] = None
-        else:
-            job_data['title'] = None
-            job_data['url'] = None
-            job_data['id'] = None
-        
-        # Date
-        date_elem = soup.select_one(SELECTORS['job_date'])
-        if date_elem:
-            date_text = date_elem.get_text(strip=True)
-            job_data['posted_date_relative'] = date_text.replace('Published: ', '').strip() if date_text else None
-            job_data['posted_date_timestamp'] = parse_relative_date(job_data['posted_date_relative']) if job_data['posted_date_relative'] else None
-        else:
-            job_data['posted_date_relative'] = None
-            job_data['posted_date_timestamp'] = None
-        
-        # Bids count
-        bids_elem = soup.select_one(SELECTORS['job_bids'])
-        if bids_elem:
-            bids_text = bids_elem.get_text(strip=True)
-            if bids_text:
-                match = re.search(r'(\d+)', bids_text)
-                job_data['bids_count'] = int(match.group(1)) if match else None
-            else:
-                job_data['bids_count'] = None
-        else:
-            job_data['bids_count'] = None
-        
-        # Description
-        desc_elem = soup.select_one(SELECTORS['job_description'])
-        if desc_elem:
-            job_data['description'] = desc_elem.get_text(strip=True)
-        else:
-            job_data['description'] = None
-        
-        # Budget
-        budget_elem = soup.select_one(SELECTORS['job_budget'])
-        if budget_elem:
-            budget_text = budget_elem.get_text(strip=True)
-            job_data['budget'] = budget_text
-            budget_parsed = parse_budget(budget_text)
-            job_data['budget_min'] = budget_parsed['min']
-            job_data['budget_max'] = budget_parsed['max']
-            job_data['budget_type'] = budget_parsed['type']
-        else:
-            job_data['budget'] = None
-            job_data['budget_min'] = None
-            job_data['budget_max'] = None
-            job_data['budget_type'] = None
-        
-        # Skills
-        skill_elems = soup.select(SELECTORS['job_skills'])
-        job_data['skills'] = [skill.get_text(strip=True) for skill in skill_elems if skill.get_text(strip=True)]
-        
-        # Featured/Max project
-        featured_badge = soup.select_one(SELECTORS['job_featured_badge'])
-        job_data['is_max_project'] = featured_badge is not None
-        
-        # Check if featured (has project-item-featured class)
-        main_elem = soup.select_one('.project-item')
-        classes = main_elem.get('class', []) if main_elem else []
-        job_data['is_featured'] = 'project-item-featured' in classes
-        
-        # Client information
-        client_section = soup.select_one('div.project-author')
-        if client_section:
-            # Client name
-            name_elem = client_section.select_one(SELECTORS['client_name'])
-            job_data['client_name'] = name_elem.get_text(strip=True) if name_elem else None
-            
-            # Client country - get text from anchor tag inside country-name span
-            country_elem = client_section.select_one(SELECTORS['client_country'])
-            if country_elem:
-                job_data['client_country'] = country_elem.get_text(strip=True)
-            else:
-                # Fallback 1: try span.country-name > a directly
-                country_elem = client_section.select_one('span.country-name > a')
-                if country_elem:
-                    job_data['client_country'] = country_elem.get_text(strip=True)
-                else:
-                    # Fallback 2: try span.country > a
-                    country_elem = client_section.select_one('span.country > a')
-                    job_data['client_country'] = country_elem.get_text(strip=True) if country_elem else None
-            
-            # Client rating - get from title attribute of stars-bg element
-            rating_elem = client_section.select_one(SELECTORS['client_rating'])
-            if rating_elem:
-                title_attr = rating_elem.get('title', '')
-                if title_attr:
-                    # Extract first number from title like "0.00 of 5.00"
-                    match = re.search(r'(\d+\.?\d*)', title_attr)
-                    job_data['client_rating'] = float(match.group(1)) if match else None
-                else:
-                    job_data['client_rating'] = None
-            else:
-                # Fallback: try to find stars-bg inside profile-stars
-                profile_stars = client_section.select_one('span.rating > span.profile-stars')
-                if profile_stars:
-                    stars_bg = profile_stars.select_one('span.stars-bg')
-                    if stars_bg:
-                        title_attr = stars_bg.get('title', '')
-                        if title_attr:
-                            match = re.search(r'(\d+\.?\d*)', title_attr)
-                            job_data['client_rating'] = float(match.group(1)) if match else None
-                        else:
-                            job_data['client_rating'] = None
-                    else:
-                        job_data['client_rating'] = None
-                else:
-                    job_data['client_rating'] = None
-            
-            # Payment verified
-            verified_elem = client_section.select_one(SELECTORS['client_payment_verified'])
-            job_data['client_payment_verified'] = verified_elem is not None
-            
-            # Last reply
-            reply_elem = client_section.select_one(SELECTORS['client_last_reply'])
-            if reply_elem:
-                reply_text = reply_elem.get_text(strip=True)
-                if reply_text:
-                    parts = reply_text.split(':', 1)
-                    job_data['client_last_reply'] = parts[-1].strip() if len(parts) > 1 else reply_text
-                else:
-                    job_data['client_last_reply'] = None
-            else:
-                job_data['client_last_reply'] = None
-        else:
-            job_data['client_name'] = None
-            job_data['client_country'] = None
-            job_data['client_rating'] = None
-            job_data['client_payment_verified'] = False
-            job_data['client_last_reply'] = None
-    
-    except Exception as e:
-        print(f"Error parsing job HTML: {e}")
-    
-    return job_data
-
+"""
+Parser for extracting job data from HTML elements
+"""
+import re
+from functools import lru_cache
+from typing import Dict, Optional, List, Tuple
+from bs4 import BeautifulSoup, SoupStrainer
+from config.selectors import SELECTORS, COMPILED
+from parsers.date_parser import parse_relative_date, extract_job_id_from_url
+
+try:
+    from selectolax.lexbor import LexborHTMLParser
+    SELECTOLAX_AVAILABLE = True
+except ImportError:
+    SELECTOLAX_AVAILABLE = False
+
+
+# Selector strings bound to module constants once at import (skips a dict
+# lookup per field per job on the hot path)
+_CSS_JOB_ITEM = SELECTORS['job_item']
+_CSS_JOB_TITLE = SELECTORS['job_title']
+_CSS_JOB_DATE = SELECTORS['job_date']
+_CSS_JOB_BIDS = SELECTORS['job_bids']
+_CSS_JOB_DESCRIPTION = SELECTORS['job_description']
+_CSS_JOB_BUDGET = SELECTORS['job_budget']
+_CSS_JOB_SKILLS = SELECTORS['job_skills']
+_CSS_JOB_FEATURED_BADGE = SELECTORS['job_featured_badge']
+_CSS_PAGINATION_PAGES = SELECTORS['pagination_pages']
+_CSS_CLIENT_NAME = SELECTORS['client_name']
+_CSS_CLIENT_COUNTRY = SELECTORS['client_country']
+_CSS_CLIENT_RATING = SELECTORS['client_rating']
+_CSS_CLIENT_PAYMENT_VERIFIED = SELECTORS['client_payment_verified']
+_CSS_CLIENT_LAST_REPLY = SELECTORS['client_last_reply']
+
+# Field-extraction regexes compiled once at import instead of per job
+_NUM_RE = re.compile(r'[\d,]+')
+_RATING_RE = re.compile(r'(\d+\.?\d*)')
+_BIDS_RE = re.compile(r'(\d+)')
+
+# Strainer for the bs4 page-level path: only job-item subtrees get
+# materialized, not the whole document
+_SOUP_ITEM_STRAINER = SoupStrainer(
+    'div', class_=lambda c: bool(c) and 'js-project' in str(c).split())
+
+
+def _abs_url(base_url: str, path: str) -> str:
+    """Absolutize a job link (the [:4] slice check beats startswith here)"""
+    return path if path[:4] == 'http' else base_url + path
+
+
+def _txt(node, deep: bool = True) -> Optional[str]:
+    """
+    Stripped text of a selectolax node, or None if the node is missing
+    Pass deep=False for known single-text-node tags to skip the recursive
+    descendant walk
+    """
+    return node.text(deep=deep, strip=True) if node is not None else None
+
+
+def _attr(node, name: str) -> Optional[str]:
+    """Attribute value of a selectolax node, or None if missing"""
+    return node.attributes.get(name) if node is not None else None
+
+
+@lru_cache(maxsize=1024)
+def parse_budget(budget_text: str) -> Tuple[Optional[int], Optional[int], Optional[str]]:
+    """
+    Parse budget text to extract (min, max, type)
+    Examples:
+    - "USD 50 - 100" -> (50, 100, "fixed")
+    - "Over USD 45 / hour" -> (45, None, "hourly")
+    - "Less than USD 50" -> (None, 50, "fixed")
+    Cached: budget strings are drawn from a small vocabulary, so repeats
+    become a dict lookup
+    """
+    if not budget_text:
+        return (None, None, None)
+    
+    budget_text = budget_text.strip()
+    budget_lower = budget_text.lower()  # Lowercase once, reuse for all checks
+    min_val = None
+    max_val = None
+    
+    # Check if hourly ('hour' covers both '/ hour' and 'hourly' in one scan)
+    budget_type = 'hourly' if 'hour' in budget_lower else 'fixed'
+    
+    # Extract numbers in one scan, stripping commas per match instead of
+    # copying the whole string first
+    numbers = [int(n.replace(',', '')) for n in _NUM_RE.findall(budget_text)]
+    
+    if 'over' in budget_lower or 'more than' in budget_lower:
+        if numbers:
+            min_val = numbers[0]
+    elif 'less than' in budget_lower or 'under' in budget_lower:
+        if numbers:
+            max_val = numbers[0]
+    elif len(numbers) >= 2:
+        min_val = numbers[0]
+        max_val = numbers[1]
+    elif len(numbers) == 1:
+        min_val = numbers[0]
+    
+    return (min_val, max_val, budget_type)
+
+
+def job_data_from_js_fields(raw: Dict, base_url: str = "https://www.workana.com") -> Dict:
+    """
+    Build the standard job dict from fields already extracted in the browser
+    (see WorkanaScraper.scrape_page_via_js)
+    Only budget/date/rating parsing runs in Python; no HTML is reparsed
+    """
+    job_data = {}
+
+    job_data['title'] = raw.get('title') or None
+
+    url_path = raw.get('url') or None
+    if url_path:
+        job_data['url'] = _abs_url(base_url, url_path)
+        job_data['id'] = extract_job_id_from_url(job_data['url'])
+    else:
+        job_data['url'] = None
+        job_data['id'] = None
+
+    date_text = raw.get('date') or None
+    job_data['posted_date_relative'] = date_text.replace('Published: ', '').strip() if date_text else None
+    job_data['posted_date_timestamp'] = parse_relative_date(job_data['posted_date_relative']) if job_data['posted_date_relative'] else None
+
+    match = _BIDS_RE.search(raw.get('bids') or '')
+    job_data['bids_count'] = int(match.group(1)) if match else None
+
+    job_data['description'] = raw.get('description') or None
+
+    budget_text = raw.get('budget') or None
+    job_data['budget'] = budget_text
+    (job_data['budget_min'], job_data['budget_max'],
+     job_data['budget_type']) = parse_budget(budget_text)
+
+    job_data['skills'] = raw.get('skills') or []
+    job_data['is_max_project'] = bool(raw.get('is_max_project'))
+    job_data['is_featured'] = bool(raw.get('is_featured'))
+
+    job_data['client_name'] = raw.get('client_name') or None
+    job_data['client_country'] = raw.get('client_country') or None
+
+    match = _RATING_RE.search(raw.get('rating_title') or '')
+    job_data['client_rating'] = float(match.group(1)) if match else None
+
+    job_data['client_payment_verified'] = bool(raw.get('client_payment_verified'))
+
+    reply_text = raw.get('last_reply') or None
+    if reply_text:
+        _, sep, tail = reply_text.partition(':')
+        job_data['client_last_reply'] = tail.strip() if sep else reply_text
+    else:
+        job_data['client_last_reply'] = None
+
+    return job_data
+
+
+def parse_job_element_from_html(html: str, base_url: str = "https://www.workana.com") -> Dict:
+    """
+    Parse a single job element from HTML string (avoids stale element issues)
+    Returns dictionary with job data
+
+    Uses selectolax (Lexbor engine, ~10x faster than BeautifulSoup) when
+    installed, falling back to the BeautifulSoup/lxml path otherwise.
+    """
+    if SELECTOLAX_AVAILABLE:
+        return _parse_job_html_selectolax(html, base_url)
+    return _parse_job_html_soup(html, base_url)
+
+
+def _parse_job_html_selectolax(html: str, base_url: str = "https://www.workana.com") -> Dict:
+    """Parse a job element using selectolax/Lexbor (fast path)"""
+    tree = LexborHTMLParser(html)
+    # Scope all queries to the job-item node: each selector then walks the
+    # subtree instead of the whole (html/body-wrapped) document
+    root = tree.css_first('.project-item') or tree.root
+    return _job_from_selectolax_node(root, base_url)
+
+
+def _job_from_selectolax_node(root, base_url: str = "https://www.workana.com") -> Dict:
+    """Extract job fields from an already-parsed selectolax job-item node"""
+    try:
+        # Title and URL
+        title_elem = root.css_first(_CSS_JOB_TITLE)
+        title = _txt(title_elem, deep=False)
+        url_path = _attr(title_elem, 'href')
+        if url_path:
+            url = _abs_url(base_url, url_path)
+            job_id = extract_job_id_from_url(url)
+        else:
+            url = None
+            job_id = None
+
+        # Date
+        date_text = _txt(root.css_first(_CSS_JOB_DATE), deep=False)
+        posted_relative = date_text.replace('Published: ', '').strip() if date_text else None
+        posted_timestamp = parse_relative_date(posted_relative) if posted_relative else None
+
+        # Bids count
+        bids_text = _txt(root.css_first(_CSS_JOB_BIDS), deep=False)
+        match = _BIDS_RE.search(bids_text) if bids_text else None
+        bids_count = int(match.group(1)) if match else None
+
+        # Description
+        description = _txt(root.css_first(_CSS_JOB_DESCRIPTION))
+
+        # Budget
+        budget = _txt(root.css_first(_CSS_JOB_BUDGET), deep=False)
+        budget_min, budget_max, budget_type = parse_budget(budget)
+
+        # Skills (extract text once per element, filter after)
+        skills = [
+            text for text in (skill.text(strip=True) for skill in root.css(_CSS_JOB_SKILLS))
+            if text
+        ]
+
+        # Featured/Max project
+        is_max_project = root.css_first(_CSS_JOB_FEATURED_BADGE) is not None
+
+        # Check if featured (has project-item-featured class)
+        classes = root.attributes.get('class', '') if root.attributes is not None else ''
+        is_featured = 'project-item-featured' in (classes or '')
+
+        # Client information
+        client_section = root.css_first('div.project-author')
+        if client_section:
+            client_name = _txt(client_section.css_first(_CSS_CLIENT_NAME), deep=False)
+
+            # Client country - get text from anchor tag inside country-name span
+            country_elem = (
+                client_section.css_first(_CSS_CLIENT_COUNTRY)
+                or client_section.css_first('span.country-name > a')
+                or client_section.css_first('span.country > a')
+            )
+            client_country = _txt(country_elem, deep=False)
+
+            # Client rating - get from title attribute of stars-bg element
+            rating_elem = (
+                client_section.css_first(_CSS_CLIENT_RATING)
+                or client_section.css_first('span.rating > span.profile-stars span.stars-bg')
+            )
+            title_attr = _attr(rating_elem, 'title')
+            # Extract first number from title like "0.00 of 5.00"
+            match = _RATING_RE.search(title_attr) if title_attr else None
+            client_rating = float(match.group(1)) if match else None
+
+            # Payment verified
+            client_payment_verified = (
+                client_section.css_first(_CSS_CLIENT_PAYMENT_VERIFIED) is not None
+            )
+
+            # Last reply
+            reply_text = _txt(client_section.css_first(_CSS_CLIENT_LAST_REPLY))
+            if reply_text:
+                _, sep, tail = reply_text.partition(':')
+                client_last_reply = tail.strip() if sep else reply_text
+            else:
+                client_last_reply = None
+        else:
+            client_name = None
+            client_country = None
+            client_rating = None
+            client_payment_verified = False
+            client_last_reply = None
+
+    except Exception as e:
+        print(f"Error parsing job HTML: {e}")
+        return {}
+
+    # Single dict literal: allocated once at its final size instead of ~19
+    # incremental key writes
+    return {
+        'title': title,
+        'url': url,
+        'id': job_id,
+        'posted_date_relative': posted_relative,
+        'posted_date_timestamp': posted_timestamp,
+        'bids_count': bids_count,
+        'description': description,
+        'budget': budget,
+        'budget_min': budget_min,
+        'budget_max': budget_max,
+        'budget_type': budget_type,
+        'skills': skills,
+        'is_max_project': is_max_project,
+        'is_featured': is_featured,
+        'client_name': client_name,
+        'client_country': client_country,
+        'client_rating': client_rating,
+        'client_payment_verified': client_payment_verified,
+        'client_last_reply': client_last_reply,
+    }
+
+
+def parse_jobs_from_page_html(page_html: str, base_url: str = "https://www.workana.com") -> List[Dict]:
+    """
+    Parse every job on a full listing page with a single HTML parse
+    Returns list of job data dicts (empty if the listing markup is absent)
+    """
+    if not page_html:
+        return []
+    if SELECTOLAX_AVAILABLE:
+        tree = LexborHTMLParser(page_html)
+        return [_job_from_selectolax_node(node, base_url)
+                for node in tree.css(_CSS_JOB_ITEM)]
+    # Fallback: one strained bs4 parse, then walk each job-item tag
+    # (html.parser here: the lxml tree builder ignores parse_only)
+    soup = BeautifulSoup(page_html, 'html.parser', parse_only=_SOUP_ITEM_STRAINER)
+    return [_job_from_soup_node(tag, base_url)
+            for tag in soup.find_all('div', class_='js-project')]
+
+
+def extract_total_pages(page_html: str) -> int:
+    """Get the highest page number from the pagination links (1 if none)"""
+    if not page_html:
+        return 1
+    if SELECTOLAX_AVAILABLE:
+        texts = [node.text(strip=True) for node in LexborHTMLParser(page_html).css(_CSS_PAGINATION_PAGES)]
+    else:
+        soup = BeautifulSoup(page_html, 'lxml')
+        texts = [tag.get_text(strip=True) for tag in COMPILED.pagination_pages.select(soup)]
+    page_numbers = [int(text) for text in texts if text.isdigit()]
+    return max(page_numbers) if page_numbers else 1
+
+
+def _parse_job_html_soup(html: str, base_url: str = "https://www.workana.com") -> Dict:
+    """Parse a job element using BeautifulSoup/lxml (fallback path)"""
+    soup = BeautifulSoup(html, 'lxml')
+    # Scope all queries to the job-item node (see the selectolax path)
+    root = soup.select_one('.project-item') or soup
+    return _job_from_soup_node(root, base_url)
+
+
+def _job_from_soup_node(root, base_url: str = "https://www.workana.com") -> Dict:
+    """Extract job fields from an already-parsed bs4 job-item tag"""
+    job_data = {}
+
+    try:
+        # Title and URL
+        title_elem = COMPILED.job_title.select_one(root)
+        if title_elem:
+            job_data['title'] = title_elem.get_text(strip=True)
+            url_path = title_elem.get('href', '')
+            if url_path:
+                job_data['url'] = _abs_url(base_url, url_path)
+                job_data['id'] = extract_job_id_from_url(job_data['url'])
+            else:
+                job_data['url'] = None
+                job_data['id'] = None
+        else:
+            job_data['title'] = None
+            job_data['url'] = None
+            job_data['id'] = None
+        
+        # Date
+        date_elem = COMPILED.job_date.select_one(root)
+        if date_elem:
+            date_text = date_elem.get_text(strip=True)
+            job_data['posted_date_relative'] = date_text.replace('Published: ', '').strip() if date_text else None
+            job_data['posted_date_timestamp'] = parse_relative_date(job_data['posted_date_relative']) if job_data['posted_date_relative'] else None
+        else:
+            job_data['posted_date_relative'] = None
+            job_data['posted_date_timestamp'] = None
+        
+        # Bids count
+        bids_elem = COMPILED.job_bids.select_one(root)
+        if bids_elem:
+            bids_text = bids_elem.get_text(strip=True)
+            if bids_text:
+                match = _BIDS_RE.search(bids_text)
+                job_data['bids_count'] = int(match.group(1)) if match else None
+            else:
+                job_data['bids_count'] = None
+        else:
+            job_data['bids_count'] = None
+        
+        # Description
+        desc_elem = COMPILED.job_description.select_one(root)
+        if desc_elem:
+            job_data['description'] = desc_elem.get_text(strip=True)
+        else:
+            job_data['description'] = None
+        
+        # Budget
+        budget_elem = COMPILED.job_budget.select_one(root)
+        if budget_elem:
+            budget_text = budget_elem.get_text(strip=True)
+            job_data['budget'] = budget_text
+            (job_data['budget_min'], job_data['budget_max'],
+             job_data['budget_type']) = parse_budget(budget_text)
+        else:
+            job_data['budget'] = None
+            job_data['budget_min'] = None
+            job_data['budget_max'] = None
+            job_data['budget_type'] = None
+        
+        # Skills (extract text once per element, filter after)
+        skill_elems = COMPILED.job_skills.select(root)
+        job_data['skills'] = [
+            text for text in (skill.get_text(strip=True) for skill in skill_elems)
+            if text
+        ]
+        
+        # Featured/Max project
+        featured_badge = COMPILED.job_featured_badge.select_one(root)
+        job_data['is_max_project'] = featured_badge is not None
+        
+        # Check if featured (has project-item-featured class)
+        classes = root.get('class') or []
+        job_data['is_featured'] = 'project-item-featured' in classes
+        
+        # Client information
+        client_section = root.select_one('div.project-author')
+        if client_section:
+            # Client name
+            name_elem = COMPILED.client_name.select_one(client_section)
+            job_data['client_name'] = name_elem.get_text(strip=True) if name_elem else None
+            
+            # Client country - get text from anchor tag inside country-name span
+            country_elem = COMPILED.client_country.select_one(client_section)
+            if country_elem:
+                job_data['client_country'] = country_elem.get_text(strip=True)
+            else:
+                # Fallback 1: try span.country-name > a directly
+                country_elem = client_section.select_one('span.country-name > a')
+                if country_elem:
+                    job_data['client_country'] = country_elem.get_text(strip=True)
+                else:
+                    # Fallback 2: try span.country > a
+                    country_elem = client_section.select_one('span.country > a')
+                    job_data['client_country'] = country_elem.get_text(strip=True) if country_elem else None
+            
+            # Client rating - get from title attribute of stars-bg element
+            rating_elem = COMPILED.client_rating.select_one(client_section)
+            if rating_elem:
+                title_attr = rating_elem.get('title', '')
+                if title_attr:
+                    # Extract first number from title like "0.00 of 5.00"
+                    match = _RATING_RE.search(title_attr)
+                    job_data['client_rating'] = float(match.group(1)) if match else None
+                else:
+                    job_data['client_rating'] = None
+            else:
+                # Fallback: try to find stars-bg inside profile-stars
+                profile_stars = client_section.select_one('span.rating > span.profile-stars')
+                if profile_stars:
+                    stars_bg = profile_stars.select_one('span.stars-bg')
+                    if stars_bg:
+                        title_attr = stars_bg.get('title', '')
+                        if title_attr:
+                            match = _RATING_RE.search(title_attr)
+                            job_data['client_rating'] = float(match.group(1)) if match else None
+                        else:
+                            job_data['client_rating'] = None
+                    else:
+                        job_data['client_rating'] = None
+                else:
+                    job_data['client_rating'] = None
+            
+            # Payment verified
+            verified_elem = COMPILED.client_payment_verified.select_one(client_section)
+            job_data['client_payment_verified'] = verified_elem is not None
+            
+            # Last reply
+            reply_elem = COMPILED.client_last_reply.select_one(client_section)
+            if reply_elem:
+                reply_text = reply_elem.get_text(strip=True)
+                if reply_text:
+                    _, sep, tail = reply_text.partition(':')
+                    job_data['client_last_reply'] = tail.strip() if sep else reply_text
+                else:
+                    job_data['client_last_reply'] = None
+            else:
+                job_data['client_last_reply'] = None
+        else:
+            job_data['client_name'] = None
+            job_data['client_country'] = None
+            job_data['client_rating'] = None
+            job_data['client_payment_verified'] = False
+            job_data['client_last_reply'] = None
+    
+    except Exception as e:
+        print(f"Error parsing job HTML: {e}")
+    
+    return job_data
+
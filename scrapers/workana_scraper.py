@@ -3,9 +3,12 @@ Selenium-based scraper for Workana job listings
 """
 import time
 import random
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
 from typing import List, Dict, Optional, Set
 from datetime import datetime
 from urllib.parse import quote
+import requests
 from selenium import webdriver
 from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.chrome.options import Options
@@ -16,24 +19,96 @@ from selenium.common.exceptions import TimeoutException, NoSuchElementException
 from webdriver_manager.chrome import ChromeDriverManager
 
 from config.settings import (
-    BASE_URL, JOBS_URL, DEFAULT_CATEGORY, DEFAULT_LANGUAGE,
+    BASE_URL, JOBS_URL, DEFAULT_CATEGORY, DEFAULT_LANGUAGE, FETCH_MODE,
     HEADLESS, IMPLICIT_WAIT, PAGE_LOAD_TIMEOUT, EXPLICIT_WAIT_TIMEOUT,
     DELAY_BETWEEN_REQUESTS, RANDOM_DELAY_RANGE, MAX_PAGES, STOP_ON_KNOWN_JOB,
     USER_AGENT, CHROME_OPTIONS
 )
 from config.selectors import SELECTORS
-from parsers.job_parser import parse_job_element, parse_job_element_from_html
+from parsers.job_parser import (
+    parse_job_element_from_html, job_data_from_js_fields,
+    parse_jobs_from_page_html, extract_total_pages
+)
+
+
+# Extracts every job field inside the browser in one evaluation: the DOM is
+# already parsed in Chrome, so this skips both the outerHTML serialization and
+# the Python-side reparse. Only budget/date/rating strings come back for
+# post-processing (see job_data_from_js_fields).
+_JS_EXTRACT_JOBS = """
+const sels = arguments[0];
+const txt = (root, sel) => {
+    const el = root.querySelector(sel);
+    return el ? el.innerText.trim() : null;
+};
+return Array.from(document.querySelectorAll(sels.job_item)).map(item => {
+    const titleEl = item.querySelector(sels.job_title);
+    const countryEl = item.querySelector(sels.client_country)
+        || item.querySelector('span.country-name > a')
+        || item.querySelector('span.country > a');
+    const ratingEl = item.querySelector(sels.client_rating)
+        || item.querySelector('span.rating > span.profile-stars span.stars-bg');
+    return {
+        title: titleEl ? titleEl.innerText.trim() : null,
+        url: titleEl ? titleEl.getAttribute('href') : null,
+        date: txt(item, sels.job_date),
+        bids: txt(item, sels.job_bids),
+        description: txt(item, sels.job_description),
+        budget: txt(item, sels.job_budget),
+        skills: Array.from(item.querySelectorAll(sels.job_skills))
+            .map(e => e.innerText.trim()).filter(Boolean),
+        is_max_project: item.querySelector(sels.job_featured_badge) !== null,
+        is_featured: item.classList.contains('project-item-featured'),
+        client_name: txt(item, sels.client_name),
+        client_country: countryEl ? countryEl.innerText.trim() : null,
+        rating_title: ratingEl ? ratingEl.getAttribute('title') : null,
+        client_payment_verified: item.querySelector(sels.client_payment_verified) !== null,
+        last_reply: txt(item, sels.client_last_reply)
+    };
+});
+"""
+
+@dataclass
+class ScrapeResult:
+    """Result of a scrape run: the jobs found and the pages actually visited"""
+    jobs: List[Dict] = field(default_factory=list)
+    pages_scraped: int = 0
 
 
 class WorkanaScraper:
     """Selenium-based scraper for Workana job listings"""
     
-    def __init__(self, headless: bool = None):
+    def __init__(self, headless: bool = None, fetch_mode: str = None):
         self.headless = headless if headless is not None else HEADLESS
+        self.fetch_mode = fetch_mode or FETCH_MODE
         self.driver = None
         self.wait = None
+        self.http_session = None
         self.base_url = BASE_URL
-    
+
+    def _get_http_session(self) -> requests.Session:
+        """Get (or lazily create) the keep-alive HTTP session"""
+        if self.http_session is None:
+            session = requests.Session()
+            session.headers.update({
+                'User-Agent': USER_AGENT,
+                'Accept-Language': DEFAULT_LANGUAGE,
+            })
+            self.http_session = session
+        return self.http_session
+
+    def fetch_page_html(self, url: str) -> Optional[str]:
+        """Fetch a listing page over plain HTTP (no browser)"""
+        try:
+            response = self._get_http_session().get(url, timeout=PAGE_LOAD_TIMEOUT)
+            if response.status_code != 200:
+                print(f"HTTP fetch returned {response.status_code} for {url}")
+                return None
+            return response.text
+        except requests.RequestException as e:
+            print(f"HTTP fetch failed for {url}: {e}")
+            return None
+
     def setup_driver(self):
         """Initialize Chrome WebDriver"""
         chrome_options = Options()
@@ -57,8 +132,10 @@ class WorkanaScraper:
         chrome_options.add_experimental_option("prefs", prefs)
         
         # Initialize driver
+        # keep_alive reuses the HTTP connection to chromedriver across
+        # WebDriver commands instead of a TCP handshake per command
         service = Service(ChromeDriverManager().install())
-        self.driver = webdriver.Chrome(service=service, options=chrome_options)
+        self.driver = webdriver.Chrome(service=service, options=chrome_options, keep_alive=True)
         
         # Set timeouts
         self.driver.implicitly_wait(IMPLICIT_WAIT)
@@ -94,8 +171,12 @@ class WorkanaScraper:
                 EC.presence_of_element_located((By.CSS_SELECTOR, SELECTORS['job_container']))
             )
             
-            # Wait briefly for dynamic content (reduced from 2s to 0.5s)
-            time.sleep(0.5)
+            # Wait until job items actually exist instead of sleeping a fixed
+            # 0.5s: returns as soon as the listing is rendered
+            self.wait.until(lambda d: d.execute_script(
+                "return document.querySelectorAll(arguments[0]).length >= 1;",
+                SELECTORS['job_item']
+            ))
             
             return True
         except TimeoutException:
@@ -108,43 +189,24 @@ class WorkanaScraper:
     def scroll_page(self):
         """Scroll page to trigger lazy loading if needed (optimized)"""
         try:
-            # Quick scroll to bottom and back (reduced delays)
-            self.driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-            time.sleep(0.3)  # Reduced from 1s
-            self.driver.execute_script("window.scrollTo(0, 0);")
-            time.sleep(0.2)  # Reduced from 1s
+            # Single round-trip, no sleeps: images are blocked in Chrome prefs
+            # so there is nothing to wait for, and load_page already waits on
+            # the job items
+            self.driver.execute_script(
+                "window.scrollTo(0, document.body.scrollHeight); window.scrollTo(0, 0);"
+            )
         except:
             pass
     
-    def get_job_elements(self) -> List:
-        """Get all job elements from current page"""
-        try:
-            job_elements = self.driver.find_elements(By.CSS_SELECTOR, SELECTORS['job_item'])
-            return job_elements
-        except Exception as e:
-            print(f"Error getting job elements: {e}")
-            return []
-    
     def get_total_pages(self) -> Optional[int]:
-        """Get total number of pages from pagination"""
+        """Get total number of pages from pagination (one JS round-trip)"""
         try:
-            pagination = self.driver.find_element(By.CSS_SELECTOR, SELECTORS['pagination'])
-            page_links = pagination.find_elements(By.CSS_SELECTOR, SELECTORS['pagination_pages'])
-            
-            if not page_links:
-                return 1
-            
-            # Get the last page number
-            page_numbers = []
-            for link in page_links:
-                try:
-                    text = link.text.strip()
-                    if text.isdigit():
-                        page_numbers.append(int(text))
-                except:
-                    continue
-            
-            return max(page_numbers) if page_numbers else 1
+            return self.driver.execute_script(
+                "const a = [...document.querySelectorAll(arguments[0])]"
+                ".map(n => parseInt(n.textContent, 10)).filter(n => !isNaN(n));"
+                "return a.length ? Math.max(...a) : 1;",
+                SELECTORS['pagination_pages']
+            )
         except:
             return 1
     
@@ -163,76 +225,208 @@ class WorkanaScraper:
         if not skip_scroll:
             self.scroll_page()
         
-        # Get job elements
-        job_elements = self.get_job_elements()
-        
-        if not job_elements:
+        # Grab all job outerHTML strings in one round-trip instead of one
+        # get_attribute() RPC per job. The returned strings are detached from
+        # the DOM, so there is no stale-element case to handle.
+        try:
+            job_htmls = self.driver.execute_script(
+                "return Array.from(document.querySelectorAll(arguments[0]))"
+                ".map(e => e.outerHTML);",
+                SELECTORS['job_item']
+            )
+        except Exception as e:
+            print(f"Error getting job elements: {e}")
+            return jobs, should_stop
+
+        if not job_htmls:
             print("No job elements found on page")
             return jobs, should_stop
-        
-        print(f"Found {len(job_elements)} jobs on page")
-        
-        # Parse each job (extract HTML immediately to avoid stale element issues)
-        for i, job_element in enumerate(job_elements):
-            try:
-                # Get HTML immediately to avoid stale element reference
-                try:
-                    job_html = job_element.get_attribute('outerHTML')
-                except:
-                    # If element is stale, re-find it
-                    job_elements_refresh = self.get_job_elements()
-                    if i < len(job_elements_refresh):
-                        job_element = job_elements_refresh[i]
-                        job_html = job_element.get_attribute('outerHTML')
-                    else:
-                        continue
-                
-                # Parse using HTML string instead of WebElement
-                job_data = parse_job_element_from_html(job_html, self.base_url)
-                
-                # Skip if no ID
-                if not job_data.get('id'):
-                    continue
-                
-                # Build composite key for comparison: id + client_name
-                job_key = f"{job_data.get('id')}|{job_data.get('client_name') or ''}"
 
-                # Check if we should stop (if STOP_ON_KNOWN_JOB is enabled)
-                if STOP_ON_KNOWN_JOB and job_key in existing_job_ids:
-                    print(f"Found known job {job_data['id']} (client: {job_data.get('client_name') or 'N/A'}), stopping scrape")
-                    should_stop = True
-                    break
-                
-                jobs.append(job_data)
-                
-            except Exception as e:
-                print(f"Error parsing job element {i+1}: {e}")
+        print(f"Found {len(job_htmls)} jobs on page")
+
+        return self._parse_jobs_from_htmls(job_htmls, existing_job_ids)
+    
+    def scrape_page_via_js(self, existing_job_ids: Set[str] = None,
+                           skip_scroll: bool = False) -> Optional[tuple[List[Dict], bool]]:
+        """
+        Scrape jobs from current page with a single in-browser field extraction
+        Returns: (list of job data, should_stop flag), or None if the script
+        failed (caller should fall back to scrape_page)
+        """
+        if existing_job_ids is None:
+            existing_job_ids = set()
+
+        # Scroll only if needed (skip on first page load as it's already loaded)
+        if not skip_scroll:
+            self.scroll_page()
+
+        try:
+            raw_jobs = self.driver.execute_script(_JS_EXTRACT_JOBS, SELECTORS)
+        except Exception as e:
+            print(f"Error extracting jobs via JS: {e}")
+            return None
+
+        if not raw_jobs:
+            print("No job elements found on page")
+            return [], False
+
+        print(f"Found {len(raw_jobs)} jobs on page")
+
+        parsed = [job_data_from_js_fields(raw, self.base_url) for raw in raw_jobs]
+        return self._filter_parsed_jobs(parsed, existing_job_ids)
+
+    def _parse_jobs_from_htmls(self, job_htmls: List[str],
+                               existing_job_ids: Set[str]) -> tuple[List[Dict], bool]:
+        """
+        Parse a list of per-job HTML fragments
+        Returns: (list of job data, should_stop flag)
+        """
+        # A page carries a few dozen small fragments; selectolax parses them
+        # in well under the cost of spawning workers and pickling the HTML,
+        # so parsing stays sequential.
+        parsed = [parse_job_element_from_html(job_html, self.base_url)
+                  for job_html in job_htmls]
+
+        return self._filter_parsed_jobs(parsed, existing_job_ids)
+
+    def _filter_parsed_jobs(self, parsed: List[Dict],
+                            existing_job_ids: Set[str]) -> tuple[List[Dict], bool]:
+        """
+        Filter parsed job dicts: drop entries without an ID and honour
+        STOP_ON_KNOWN_JOB
+        Returns: (list of job data, should_stop flag)
+        """
+        jobs = []
+        should_stop = False
+        for job_data in parsed:
+            # Skip if no ID
+            if not job_data.get('id'):
                 continue
-        
+
+            # Build composite key for comparison: id + client_name
+            job_key = f"{job_data.get('id')}|{job_data.get('client_name') or ''}"
+
+            # Check if we should stop (if STOP_ON_KNOWN_JOB is enabled)
+            if STOP_ON_KNOWN_JOB and job_key in existing_job_ids:
+                print(f"Found known job {job_data['id']} (client: {job_data.get('client_name') or 'N/A'}), stopping scrape")
+                should_stop = True
+                break
+
+            jobs.append(job_data)
+
         return jobs, should_stop
-    
-    def scrape(self, category: str = None, language: str = None, 
-               existing_job_ids: Set[str] = None, max_pages: int = None) -> List[Dict]:
+
+    def scrape_http(self, category: str = None, language: str = None,
+                    existing_job_ids: Set[str] = None, max_pages: int = None) -> Optional[ScrapeResult]:
+        """
+        Scrape jobs over plain HTTP (no browser)
+        Returns a ScrapeResult, or None if the listing markup wasn't present
+        in the raw HTML (caller should fall back to Selenium)
+        """
+        if existing_job_ids is None:
+            existing_job_ids = set()
+
+        if max_pages is None:
+            max_pages = MAX_PAGES
+
+        all_jobs = []
+        page = 1
+
+        # Load first page
+        url = self.build_jobs_url(category, language, page)
+        print(f"Fetching page {page} (HTTP): {url}")
+        html = self.fetch_page_html(url)
+        if html is None:
+            return None
+
+        # One HTML parse per page: every job subtree comes from the same tree
+        parsed = parse_jobs_from_page_html(html, self.base_url)
+        if not parsed:
+            # Listing markup not in raw HTML (bot detection or JS-only render)
+            print("No job elements in raw HTML, HTTP mode unavailable")
+            return None
+
+        # Get total pages
+        total_pages = extract_total_pages(html)
+        print(f"Total pages: {total_pages}")
+
+        if max_pages:
+            total_pages = min(total_pages, max_pages)
+
+        # Filter first page
+        jobs, should_stop = self._filter_parsed_jobs(parsed, existing_job_ids)
+        all_jobs.extend(jobs)
+        pages_done = 1
+        print(f"Scraped {len(jobs)} jobs from page 1")
+
+        if should_stop:
+            print("Stopping scrape: found known job")
+            return ScrapeResult(all_jobs, pages_done)
+        if total_pages <= 1:
+            return ScrapeResult(all_jobs, pages_done)
+
+        # Fetch remaining pages concurrently; the bounded pool (4 workers on a
+        # keep-alive session) doubles as the request rate limit
+        urls = [self.build_jobs_url(category, language, p) for p in range(2, total_pages + 1)]
+        print(f"\nFetching pages 2-{total_pages} concurrently (HTTP)...")
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            htmls = list(pool.map(self.fetch_page_html, urls))
+
+        # Process in page order so STOP_ON_KNOWN_JOB keeps its semantics
+        for page, html in enumerate(htmls, start=2):
+            if html is None:
+                print(f"Failed to fetch page {page}, stopping")
+                break
+            parsed = parse_jobs_from_page_html(html, self.base_url)
+            if not parsed:
+                print(f"No job elements on page {page}, stopping")
+                break
+
+            jobs, should_stop = self._filter_parsed_jobs(parsed, existing_job_ids)
+            all_jobs.extend(jobs)
+            pages_done += 1
+            print(f"Scraped {len(jobs)} jobs from page {page}")
+
+            if should_stop:
+                print("Stopping scrape: found known job")
+                break
+
+        return ScrapeResult(all_jobs, pages_done)
+
+    def scrape(self, category: str = None, language: str = None,
+               existing_job_ids: Set[str] = None, max_pages: int = None) -> ScrapeResult:
         """
         Scrape jobs from Workana
-        Returns list of all scraped jobs
+        Returns a ScrapeResult with all scraped jobs and the page count
         """
         if existing_job_ids is None:
             existing_job_ids = set()
-        
+
         if max_pages is None:
             max_pages = MAX_PAGES
-        
+
+        # HTTP fast path: listing pages are mostly static HTML, so plain
+        # requests + HTML parsing avoids the Chromium overhead entirely.
+        # Falls back to Selenium if the markup isn't in the raw response.
+        if self.fetch_mode == 'http':
+            result = self.scrape_http(category, language, existing_job_ids, max_pages)
+            if result is not None:
+                return result
+            print("Falling back to Selenium fetch mode")
+            if not self.driver:
+                self.setup_driver()
+
         all_jobs = []
         page = 1
-        
+        pages_done = 0
+
         try:
             # Load first page
             url = self.build_jobs_url(category, language, page)
             print(f"Loading page {page}: {url}")
             
             if not self.load_page(url):
-                return all_jobs
+                return ScrapeResult(all_jobs, pages_done)
             
             # Get total pages
             total_pages = self.get_total_pages()
@@ -247,8 +441,13 @@ class WorkanaScraper:
                 
                 # Scrape current page (skip scroll on first page as it's already loaded)
                 skip_scroll = (page == 1)
-                jobs, should_stop = self.scrape_page(existing_job_ids, skip_scroll=skip_scroll)
+                result = self.scrape_page_via_js(existing_job_ids, skip_scroll=skip_scroll)
+                if result is None:
+                    # JS extraction failed; fall back to the outerHTML path
+                    result = self.scrape_page(existing_job_ids, skip_scroll=True)
+                jobs, should_stop = result
                 all_jobs.extend(jobs)
+                pages_done += 1
                 
                 print(f"Scraped {len(jobs)} jobs from page {page}")
                 
@@ -277,11 +476,14 @@ class WorkanaScraper:
         except Exception as e:
             print(f"Error during scraping: {e}")
         
-        return all_jobs
+        return ScrapeResult(all_jobs, pages_done)
     
     def close(self):
-        """Close the browser"""
+        """Close the browser and HTTP session"""
         if self.driver:
             self.driver.quit()
             self.driver = None
+        if self.http_session:
+            self.http_session.close()
+            self.http_session = None
 
